@@ -1,10 +1,13 @@
 """Action listing functionality."""
 
+import os
 import re
+from itertools import islice
 from pathlib import Path
 from typing import Literal
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.scanner import iter_markdown_files
 
 
 class ActionLister:
@@ -102,18 +105,14 @@ class ActionLister:
         # Collect from context files (next actions)
         if "next" in include_states:
             contexts_dir = actions_base / "contexts"
-            if contexts_dir.exists():
-                for context_file in contexts_dir.glob("*.md"):
-                    if not context_file.is_file():
-                        continue
-
-                    with open(context_file, 'r') as f:
-                        for line in f:
-                            line = line.strip()
-                            if line.startswith("- [ ]"):
-                                action = self.parse_action(line, "next")
-                                if action:
-                                    all_actions.append(action)
+            for context_file in iter_markdown_files(contexts_dir):
+                with open(context_file.path, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line.startswith("- [ ]"):
+                            action = self.parse_action(line, "next")
+                            if action:
+                                all_actions.append(action)
 
         # Collect from special state files
         state_files = {
@@ -146,28 +145,24 @@ class ActionLister:
         Returns:
             Dict with project info or None if not found
         """
-        repo_path = Path(self._config.get_repo_path())
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-
-        # Search in all folders
-        for folder in ["active", "incubator", "completed"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
+        projects_base = os.path.join(
+            self._config.get_repo_path(), "docs", "execution_system", "10k-projects"
+        )
+        project_name = f"{project_filename}.md"
+
+        # Search in all folders; plain string paths since this runs per project
+        for folder in ("active", "incubator", "completed"):
+            folder_path = os.path.join(projects_base, folder)
+            if not os.path.isdir(folder_path):
                 continue
 
             for area_dict in self._config.get_areas():
                 area_name = area_dict["name"]
-                area_kebab = area_dict["kebab"]
-                area_dir = folder_path / area_kebab
-
-                if not area_dir.exists():
-                    continue
-
-                project_file = area_dir / f"{project_filename}.md"
-                if project_file.exists():
+                project_file = os.path.join(folder_path, area_dict["kebab"], project_name)
+                if os.path.exists(project_file):
                     # Parse title from YAML
                     with open(project_file, 'r') as f:
-                        for line in f.readlines()[:10]:
+                        for line in islice(f, 10):
                             if line.strip().startswith("title:"):
                                 title = line.split(":", 1)[1].strip()
                                 return {
@@ -1,5 +1,6 @@
 """Action management functionality."""
 
+import os
 from datetime import date
 from pathlib import Path
 
@@ -28,26 +29,22 @@ class ActionManager:
         Returns:
             Path to project file if found, None otherwise
         """
-        repo_path = Path(self._config.get_repo_path())
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
+        projects_base = os.path.join(
+            self._config.get_repo_path(), "docs", "execution_system", "10k-projects"
+        )
+        project_name = f"{project_filename}.md"
 
         # Search in active, incubator, completed
-        for folder in ["active", "incubator", "completed"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
+        for folder in ("active", "incubator", "completed"):
+            folder_path = os.path.join(projects_base, folder)
+            if not os.path.isdir(folder_path):
                 continue
 
             # Search in all area subdirectories
             for area_dict in self._config.get_areas():
-                area_kebab = area_dict["kebab"]
-                area_dir = folder_path / area_kebab
-
-                if not area_dir.exists():
-                    continue
-
-                project_file = area_dir / f"{project_filename}.md"
-                if project_file.exists():
-                    return project_file
+                project_file = os.path.join(folder_path, area_dict["kebab"], project_name)
+                if os.path.exists(project_file):
+                    return Path(project_file)
 
         return None
 
@@ -1,10 +1,19 @@
 """Audit and health check functionality for Phase 3."""
 
+import os
 import re
-from datetime import date, datetime
+import threading
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.frontmatter import read_frontmatter
+from execution_system_mcp.review_index import ProjectReviewIndex
+from execution_system_mcp.scanner import (
+    entry_stem,
+    iter_markdown_files,
+    iter_subdirectories,
+)
 
 
 class Auditor:
@@ -18,27 +27,67 @@ class Auditor:
             config: ConfigManager instance with loaded configuration
         """
         self._config = config
+        # Built on first review query and reused while this auditor lives
+        self._review_index: ProjectReviewIndex | None = None
+        self._review_index_lock = threading.Lock()
 
-    def _parse_frontmatter(self, file_path: Path) -> dict:
+    def _parse_frontmatter(self, file_path: str | os.PathLike) -> dict:
         """Parse YAML frontmatter from file."""
-        frontmatter = {}
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
+        return read_frontmatter(file_path)
 
-        in_frontmatter = False
-        for line in lines:
-            if line.strip() == "---":
-                if not in_frontmatter:
-                    in_frontmatter = True
-                else:
-                    break
-                continue
+    @staticmethod
+    def _review_cutoff(today: date, days_threshold: int) -> str:
+        """
+        Get the ISO cutoff date for a review threshold.
+
+        Args:
+            today: Today's date
+            days_threshold: Days since review to consider needing review
+
+        Returns:
+            ISO date; values on or before it need review
+            - When the cutoff would fall outside the date range, a string
+              ordering before every ISO date ("", for huge thresholds) or
+              after every one ("9999-99-99", for huge negative thresholds)
+        """
+        try:
+            return (today - timedelta(days=days_threshold)).isoformat()
+        except OverflowError:
+            return "" if days_threshold > 0 else "9999-99-99"
+
+    @staticmethod
+    def _review_status(last_reviewed: str, today: date, cutoff: str) -> tuple[bool, int | None]:
+        """
+        Decide whether a last_reviewed date is old enough to need review.
+
+        Canonical YYYY-MM-DD values are compared as strings against the ISO
+        cutoff, which orders the same as the dates themselves; the value is
+        still parsed (with the C-level fromisoformat) so invalid dates are
+        reported. Other shapes fall back to strptime.
+
+        Args:
+            last_reviewed: last_reviewed value from frontmatter (non-empty)
+            today: Today's date
+            cutoff: ISO date; values on or before it need review
 
-            if in_frontmatter and ":" in line:
-                key, value = line.split(":", 1)
-                frontmatter[key.strip()] = value.strip()
+        Returns:
+            Tuple of (needs_review, days_since_review)
+            - days_since_review is None when the date is invalid
+        """
+        try:
+            if len(last_reviewed) == 10 and last_reviewed[4] == "-" and last_reviewed[7] == "-":
+                review_date = date.fromisoformat(last_reviewed)
+                if last_reviewed > cutoff:
+                    return (False, None)
+            else:
+                review_date = datetime.strptime(last_reviewed, "%Y-%m-%d").date()
+                if review_date.isoformat() > cutoff:
+                    return (False, None)
+        except ValueError:
+            # Invalid date format - treat as needs review
+            return (True, None)
 
-        return frontmatter
+        return (True, (today - review_date).days)
 
     def _validate_date_format(self, date_string: str) -> bool:
         """Validate date is in YYYY-MM-DD format."""
@@ -84,15 +133,8 @@ class Auditor:
 
         # Scan all project folders
         for folder in ["active", "incubator", "completed", "descoped"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
-                continue
-
-            for area_dir in folder_path.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
+            for area_dir in iter_subdirectories(projects_base / folder):
+                for project_file in iter_markdown_files(area_dir.path):
                     frontmatter = self._parse_frontmatter(project_file)
 
                     missing_fields = []
@@ -134,7 +176,7 @@ class Auditor:
                     # Add issue if any problems found
                     if missing_fields or invalid_fields:
                         issues.append({
-                            "file": str(project_file),
+                            "file": project_file.path,
                             "missing_fields": missing_fields,
                             "invalid_fields": invalid_fields
                         })
@@ -169,14 +211,13 @@ class Auditor:
 
         # Scan context files
         contexts_dir = actions_base / "contexts"
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                with open(context_file, 'r') as f:
-                    for line in f:
-                        if line.strip().startswith("- [ ]"):
-                            match = re.search(r'\+(\S+)', line)
-                            if match:
-                                action_project_tags.add(match.group(1))
+        for context_file in iter_markdown_files(contexts_dir):
+            with open(context_file, 'r') as f:
+                for line in f:
+                    if line.strip().startswith("- [ ]"):
+                        match = re.search(r'\+(\S+)', line)
+                        if match:
+                            action_project_tags.add(match.group(1))
 
         # Scan special state files
         for state_file in ["@waiting.md", "@deferred.md", "@incubating.md"]:
@@ -193,15 +234,8 @@ class Auditor:
         orphan_projects = []
 
         for folder in ["active", "incubator"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
-                continue
-
-            for area_dir in folder_path.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
+            for area_dir in iter_subdirectories(projects_base / folder):
+                for project_file in iter_markdown_files(area_dir.path):
                     frontmatter = self._parse_frontmatter(project_file)
 
                     # Skip habits and coordination
@@ -210,12 +244,12 @@ class Auditor:
                         continue
 
                     # Check if project has actions
-                    if project_file.stem not in action_project_tags:
+                    if entry_stem(project_file) not in action_project_tags:
                         orphan_projects.append({
-                            "title": frontmatter.get("title", project_file.stem),
+                            "title": frontmatter.get("title", entry_stem(project_file)),
                             "folder": folder,
                             "area": frontmatter.get("area", ""),
-                            "filename": project_file.stem
+                            "filename": entry_stem(project_file)
                         })
 
         return {"orphan_projects": orphan_projects}
@@ -256,24 +290,16 @@ class Auditor:
         # Collect all project filenames
         all_project_filenames = set()
         for folder in ["active", "incubator", "completed", "descoped"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
-                continue
-
-            for area_dir in folder_path.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
-                    all_project_filenames.add(project_file.stem)
+            for area_dir in iter_subdirectories(projects_base / folder):
+                for project_file in iter_markdown_files(area_dir.path):
+                    all_project_filenames.add(entry_stem(project_file))
 
         # Collect all valid contexts
         valid_contexts = set()
         contexts_dir = actions_base / "contexts"
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                # Context files are named like @macbook.md, stem gives @macbook
-                valid_contexts.add(context_file.stem)
+        for context_file in iter_markdown_files(contexts_dir):
+            # Context files are named like @macbook.md, stem gives @macbook
+            valid_contexts.add(entry_stem(context_file))
 
         # Add special contexts
         for special in ["@waiting", "@deferred", "@incubating"]:
@@ -286,7 +312,7 @@ class Auditor:
         invalid_contexts = []
 
         # Helper to process action file
-        def process_action_file(file_path: Path):
+        def process_action_file(file_path: Path | os.DirEntry):
             with open(file_path, 'r') as f:
                 for line in f:
                     line = line.strip()
@@ -326,9 +352,8 @@ class Auditor:
                             })
 
         # Process context files
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                process_action_file(context_file)
+        for context_file in iter_markdown_files(contexts_dir):
+            process_action_file(context_file)
 
         # Process special state files
         for state_file in ["@waiting.md", "@deferred.md", "@incubating.md"]:
@@ -365,7 +390,7 @@ class Auditor:
         issues = []
 
         # Helper to check action file
-        def check_action_file(file_path: Path):
+        def check_action_file(file_path: Path | os.DirEntry):
             frontmatter = self._parse_frontmatter(file_path)
 
             missing_fields = []
@@ -381,9 +406,8 @@ class Auditor:
 
         # Check context files
         contexts_dir = actions_base / "contexts"
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                check_action_file(context_file)
+        for context_file in iter_markdown_files(contexts_dir):
+            check_action_file(context_file)
 
         # Check special state files
         for state_file in ["@waiting.md", "@deferred.md", "@incubating.md"]:
@@ -417,60 +441,42 @@ class Auditor:
         repo_path = Path(self._config.get_repo_path())
         projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
         today = date.today()
+        cutoff = self._review_cutoff(today, days_threshold)
+
+        with self._review_index_lock:
+            if self._review_index is None:
+                self._review_index = ProjectReviewIndex(projects_base, ("active", "incubator", "completed"))
+            self._review_index.refresh()
+            dated, undated = self._review_index.needing_review(cutoff)
+
+        # (seq, record, days_since_review) for each project needing review
+        due = [
+            (seq, record, (today - date.fromisoformat(record["last_reviewed"])).days)
+            for seq, record in dated
+        ]
+        for seq, record in undated:
+            if record["last_reviewed"] is None:
+                # Missing last_reviewed - definitely needs review
+                due.append((seq, record, None))
+            else:
+                needs_review, days_diff = self._review_status(record["last_reviewed"], today, cutoff)
+                if needs_review:
+                    due.append((seq, record, days_diff))
 
-        projects_needing_review = []
-
-        for folder in ["active", "incubator", "completed"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
-                continue
-
-            for area_dir in folder_path.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
-                    frontmatter = self._parse_frontmatter(project_file)
-
-                    last_reviewed = frontmatter.get("last_reviewed")
-
-                    if not last_reviewed:
-                        # Missing last_reviewed - definitely needs review
-                        projects_needing_review.append({
-                            "title": frontmatter.get("title", project_file.stem),
-                            "folder": folder,
-                            "area": frontmatter.get("area", ""),
-                            "filename": project_file.stem,
-                            "last_reviewed": None,
-                            "days_since_review": None
-                        })
-                    else:
-                        try:
-                            review_date = datetime.strptime(last_reviewed, "%Y-%m-%d").date()
-                            days_diff = (today - review_date).days
-
-                            if days_diff >= days_threshold:
-                                projects_needing_review.append({
-                                    "title": frontmatter.get("title", project_file.stem),
-                                    "folder": folder,
-                                    "area": frontmatter.get("area", ""),
-                                    "filename": project_file.stem,
-                                    "last_reviewed": last_reviewed,
-                                    "days_since_review": days_diff
-                                })
-                        except ValueError:
-                            # Invalid date format - treat as needs review
-                            projects_needing_review.append({
-                                "title": frontmatter.get("title", project_file.stem),
-                                "folder": folder,
-                                "area": frontmatter.get("area", ""),
-                                "filename": project_file.stem,
-                                "last_reviewed": last_reviewed,
-                                "days_since_review": None
-                            })
+        # Sort by days_since_review descending (None last), then scan order
+        due.sort(key=lambda d: (d[2] is None, -(d[2] or 0), d[0]))
 
-        # Sort by days_since_review descending (None last)
-        projects_needing_review.sort(key=lambda p: (p["days_since_review"] is None, -(p["days_since_review"] or 0)))
+        projects_needing_review = [
+            {
+                "title": record["title"],
+                "folder": record["folder"],
+                "area": record["area"],
+                "filename": record["filename"],
+                "last_reviewed": record["last_reviewed"],
+                "days_since_review": days_diff
+            }
+            for _, record, days_diff in due
+        ]
 
         return {"projects_needing_review": projects_needing_review}
 
@@ -496,45 +502,34 @@ class Auditor:
         repo_path = Path(self._config.get_repo_path())
         actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
         today = date.today()
+        cutoff = self._review_cutoff(today, days_threshold)
 
         actions_needing_review = []
 
         # Helper to check action file
-        def check_action_file(file_path: Path):
+        def check_action_file(file_path: Path | os.DirEntry):
             frontmatter = self._parse_frontmatter(file_path)
             last_reviewed = frontmatter.get("last_reviewed")
 
             if not last_reviewed:
                 # Missing last_reviewed
-                actions_needing_review.append({
-                    "file": file_path.name,
-                    "last_reviewed": None,
-                    "days_since_review": None
-                })
+                last_reviewed = None
+                days_diff = None
             else:
-                try:
-                    review_date = datetime.strptime(last_reviewed, "%Y-%m-%d").date()
-                    days_diff = (today - review_date).days
-
-                    if days_diff >= days_threshold:
-                        actions_needing_review.append({
-                            "file": file_path.name,
-                            "last_reviewed": last_reviewed,
-                            "days_since_review": days_diff
-                        })
-                except ValueError:
-                    # Invalid date format
-                    actions_needing_review.append({
-                        "file": file_path.name,
-                        "last_reviewed": last_reviewed,
-                        "days_since_review": None
-                    })
+                needs_review, days_diff = self._review_status(last_reviewed, today, cutoff)
+                if not needs_review:
+                    return
+
+            actions_needing_review.append({
+                "file": file_path.name,
+                "last_reviewed": last_reviewed,
+                "days_since_review": days_diff
+            })
 
         # Check context files
         contexts_dir = actions_base / "contexts"
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                check_action_file(context_file)
+        for context_file in iter_markdown_files(contexts_dir):
+            check_action_file(context_file)
 
         # Check special state files
         for state_file in ["@waiting.md", "@deferred.md", "@incubating.md"]:
@@ -1,11 +1,13 @@
 """project completion functionality."""
 
 import re
-import yaml
-from pathlib import Path
 from datetime import date
+from pathlib import Path
+
+import yaml
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.scanner import iter_markdown_files, iter_subdirectories
 
 
 class ProjectCompleter:
@@ -38,50 +40,39 @@ class ProjectCompleter:
         repo_path = Path(self._config.get_repo_path())
         projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
 
-        # Search all area subdirectories in active folder
-        active_base = projects_base / "active"
-        if active_base.exists():
-            for area_dir in active_base.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
-                    # Parse frontmatter to check title
-                    try:
-                        with open(project_file, 'r') as f:
-                            lines = [f.readline() for _ in range(20)]
-
-                        # Simple YAML frontmatter parsing
-                        in_frontmatter = False
-                        project_title = None
-                        for line in lines:
-                            line = line.strip()
-                            if line == "---":
-                                if in_frontmatter:
-                                    break
-                                in_frontmatter = True
-                                continue
-                            if in_frontmatter and line.startswith("title:"):
-                                project_title = line.split(":", 1)[1].strip()
+        # Search all area subdirectories in active folder; entries are
+        # iterated straight off scandir so a match stops the scan
+        for area_dir in iter_subdirectories(projects_base / "active"):
+            for project_file in iter_markdown_files(area_dir.path):
+                # Parse frontmatter to check title
+                try:
+                    with open(project_file, 'r') as f:
+                        lines = [f.readline() for _ in range(20)]
+
+                    # Simple YAML frontmatter parsing
+                    in_frontmatter = False
+                    project_title = None
+                    for line in lines:
+                        line = line.strip()
+                        if line == "---":
+                            if in_frontmatter:
                                 break
+                            in_frontmatter = True
+                            continue
+                        if in_frontmatter and line.startswith("title:"):
+                            project_title = line.split(":", 1)[1].strip()
+                            break
 
-                        if project_title == title:
-                            return (project_file, area_dir.name)
+                    if project_title == title:
+                        return (Path(project_file.path), area_dir.name)
 
-                    except Exception:
-                        continue
+                except Exception:
+                    continue
 
         # Check if project exists in other folders
         for folder in ["completed", "incubator", "descoped"]:
-            folder_base = projects_base / folder
-            if not folder_base.exists():
-                continue
-
-            for area_dir in folder_base.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
+            for area_dir in iter_subdirectories(projects_base / folder):
+                for project_file in iter_markdown_files(area_dir.path):
                     try:
                         with open(project_file, 'r') as f:
                             lines = [f.readline() for _ in range(20)]
@@ -140,11 +131,9 @@ class ProjectCompleter:
                 files_to_check.append((filename, file_path))
 
         # Add context files
-        contexts_dir = next_actions_base / "contexts"
-        if contexts_dir.exists():
-            for context_file in contexts_dir.glob("*.md"):
-                relative_name = f"contexts/{context_file.name}"
-                files_to_check.append((relative_name, context_file))
+        for context_file in iter_markdown_files(next_actions_base / "contexts"):
+            relative_name = f"contexts/{context_file.name}"
+            files_to_check.append((relative_name, context_file.path))
 
         # Scan each file for unchecked items with project tag
         for filename, file_path in files_to_check:
@@ -1,8 +1,14 @@
 """Configuration management for Execution System MCP server."""
 
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the "fast" extra
+    orjson = None
+
 
 class ConfigManager:
     """Manages Execution System MCP server configuration."""
@@ -20,17 +26,56 @@ class ConfigManager:
             ValueError: If config is missing required fields or has invalid values
         """
         if config_path is None:
-            config_path = str(Path.home() / ".config" / "execution-system-mcp" / "config.json")
+            config_path = os.path.expanduser("~/.config/execution-system-mcp/config.json")
 
         config_file = Path(config_path)
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_file, "r") as f:
-            self._config = json.load(f)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # see the same exception either way
+        if orjson is not None:
+            with open(config_file, "rb") as f:
+                self._config = orjson.loads(f.read())
+        else:
+            with open(config_file, "r") as f:
+                self._config = json.load(f)
+
+        self._setup()
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "ConfigManager":
+        """
+        Build a ConfigManager from an already-parsed configuration.
+
+        Args:
+            config: Configuration dict in the same shape as the config file
+
+        Returns:
+            ConfigManager using the given configuration
+
+        Raises:
+            ValueError: If config is missing required fields or has invalid values
+        """
+        manager = cls.__new__(cls)
+        manager._config = config
+        manager._setup()
+        return manager
+
+    def _setup(self) -> None:
+        """
+        Validate the loaded configuration and build lookup tables.
 
+        Raises:
+            ValueError: If configuration is invalid
+        """
         self._validate_config()
 
+        # Lowercased area name -> kebab; first entry wins like the old linear scan
+        self._area_kebab_by_name: dict[str, str] = {}
+        for area in self._config["areas"]:
+            self._area_kebab_by_name.setdefault(area["name"].lower(), area["kebab"])
+
     def _validate_config(self) -> None:
         """
         Validate configuration has required fields.
@@ -75,10 +120,4 @@ class ConfigManager:
         Returns:
             Kebab-case area name if found, None otherwise
         """
-        area_name_lower = area_name.lower()
-
-        for area in self._config["areas"]:
-            if area["name"].lower() == area_name_lower:
-                return area["kebab"]
-
-        return None
+        return self._area_kebab_by_name.get(area_name.lower())
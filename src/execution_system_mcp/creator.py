@@ -1,5 +1,6 @@
 """Project file creation logic."""
 
+import functools
 import re
 import unicodedata
 from datetime import date
@@ -22,10 +23,14 @@ class ProjectCreator:
         self._config = config
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def to_kebab_case(text: str) -> str:
         """
         Convert text to kebab-case.
 
+        Results are memoized since the conversion is pure and the same title
+        is converted more than once per create.
+
         Args:
             text: Text to convert
 
@@ -118,6 +123,9 @@ class ProjectCreator:
 
         Returns:
             Absolute path to created project file
+
+        Raises:
+            ValueError: If the area is unknown or the project file already exists
         """
         # Generate filename
         filename = self.to_kebab_case(title) + ".md"
@@ -143,8 +151,12 @@ class ProjectCreator:
         # Generate template
         template = TemplateEngine.generate(project_type, title, folder)
 
-        # Write file
+        # Write file, never overwriting an existing project
         content = frontmatter + template
-        file_path.write_text(content)
+        try:
+            with open(file_path, "x") as f:
+                f.write(content)
+        except FileExistsError:
+            raise ValueError(f"Project file already exists: {file_path}") from None
 
         return str(file_path.absolute())
@@ -0,0 +1,36 @@
+"""Frontmatter reading shared by listers, searchers and auditors."""
+
+import os
+
+
+def read_frontmatter(file_path: str | os.PathLike) -> dict[str, str]:
+    """
+    Read simple key: value frontmatter from a markdown file.
+
+    Lines are read lazily and reading stops at the closing ``---``, so the
+    markdown body is never loaded. Lines before the opening ``---`` are
+    ignored. Values are kept as stripped strings; nested YAML is not
+    supported.
+
+    Args:
+        file_path: Path (or directory entry) of markdown file
+
+    Returns:
+        Dict of frontmatter key-value pairs
+    """
+    frontmatter = {}
+    in_frontmatter = False
+
+    with open(file_path, 'r') as f:
+        for line in f:
+            if line.strip() == "---":
+                if in_frontmatter:
+                    break
+                in_frontmatter = True
+                continue
+
+            if in_frontmatter and ":" in line:
+                key, value = line.split(":", 1)
+                frontmatter[key.strip()] = value.strip()
+
+    return frontmatter
@@ -1,9 +1,12 @@
 """Goal listing functionality."""
 
 import json
+import os
 from pathlib import Path
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.frontmatter import read_frontmatter
+from execution_system_mcp.scanner import iter_markdown_tree
 
 
 class GoalLister:
@@ -28,29 +31,7 @@ class GoalLister:
         Returns:
             Dictionary with YAML fields
         """
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        in_yaml = False
-        yaml_lines = []
-
-        for line in lines:
-            if line.strip() == '---':
-                if not in_yaml:
-                    in_yaml = True
-                else:
-                    break
-            elif in_yaml:
-                yaml_lines.append(line)
-
-        # Parse YAML manually (simple key: value format)
-        yaml_data = {}
-        for line in yaml_lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                yaml_data[key.strip()] = value.strip()
-
-        return yaml_data
+        return read_frontmatter(file_path)
 
     def _find_goal_files(self, folder: str) -> list[dict]:
         """
@@ -65,19 +46,16 @@ class GoalLister:
         repo_path = Path(self._config.get_repo_path())
         goals_base = repo_path / "docs" / "execution_system" / "30k-goals" / folder
 
-        if not goals_base.exists():
-            return []
-
         goals = []
 
         # Recursively find all .md files
-        for md_file in goals_base.rglob("*.md"):
+        for md_file in iter_markdown_tree(goals_base):
             # Skip _goals-summary.md
             if md_file.name == "_goals-summary.md":
                 continue
 
             # Parse YAML frontmatter
-            yaml_data = self._parse_yaml_frontmatter(md_file)
+            yaml_data = self._parse_yaml_frontmatter(md_file.path)
 
             # Only include files with type: goal
             if yaml_data.get("type") != "goal":
@@ -88,7 +66,7 @@ class GoalLister:
                 "title": yaml_data.get("title", ""),
                 "area": yaml_data.get("area", ""),
                 "filename": md_file.name,
-                "file_path": str(md_file.relative_to(goals_base))
+                "file_path": os.path.relpath(md_file.path, goals_base)
             }
 
             # Include started date if present
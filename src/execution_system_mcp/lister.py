@@ -1,10 +1,12 @@
 """Project listing functionality."""
 
+import os
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Literal
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.scanner import entry_stem, iter_markdown_files
 
 
 class ProjectLister:
@@ -20,12 +22,12 @@ class ProjectLister:
         self._config = config
 
     @staticmethod
-    def parse_yaml_frontmatter(file_path: Path) -> dict:
+    def parse_yaml_frontmatter(file_path: str | os.PathLike) -> dict:
         """
         Parse YAML frontmatter from project file.
 
         Args:
-            file_path: Path to project markdown file
+            file_path: Path (or directory entry) of project markdown file
 
         Returns:
             Dict with area, title, type, due, completed, started, created fields
@@ -64,7 +66,8 @@ class ProjectLister:
 
         # Use filename as title if not provided
         if not result["title"]:
-            result["title"] = file_path.stem  # filename without .md
+            # filename without .md
+            result["title"] = os.path.splitext(os.path.basename(os.fspath(file_path)))[0]
 
         return result
 
@@ -183,11 +186,8 @@ class ProjectLister:
             area_kebab = area_dict["kebab"]
             area_dir = active_path / area_kebab
 
-            if not area_dir.exists():
-                continue
-
-            # Find all .md files in this area
-            for project_file in area_dir.glob("*.md"):
+            # Find all .md files in this area (missing area dirs yield nothing)
+            for project_file in iter_markdown_files(area_dir):
                 metadata = self.parse_yaml_frontmatter(project_file)
                 projects.append({
                     "area": area_name,
@@ -295,10 +295,7 @@ class ProjectLister:
                 area_kebab = area_dict["kebab"]
                 area_dir = folder_path / area_kebab
 
-                if not area_dir.exists():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
+                for project_file in iter_markdown_files(area_dir):
                     metadata = self.parse_yaml_frontmatter(project_file)
 
                     project_data = {
@@ -310,7 +307,7 @@ class ProjectLister:
                         "completed": metadata["completed"],
                         "started": metadata["started"],
                         "created": metadata["created"],
-                        "filename": project_file.stem,
+                        "filename": entry_stem(project_file),
                     }
                     all_projects.append(project_data)
 
@@ -3,11 +3,14 @@
 import re
 import shutil
 from datetime import date
+from itertools import islice
 from pathlib import Path
 from typing import Literal
 
 from execution_system_mcp.completer import ProjectCompleter
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.frontmatter import read_frontmatter
+from execution_system_mcp.scanner import iter_markdown_files
 
 
 class ProjectManager:
@@ -48,40 +51,20 @@ class ProjectManager:
                 area_kebab = area_dict["kebab"]
                 area_dir = folder_path / area_kebab
 
-                if not area_dir.exists():
-                    continue
-
-                for project_file in area_dir.glob("*.md"):
-                    # Check title in YAML
-                    with open(project_file, 'r') as f:
-                        for line in f.readlines()[:10]:
+                for project_file in iter_markdown_files(area_dir):
+                    # Check title in YAML (header lines only, not the whole file)
+                    with open(project_file.path, 'r') as f:
+                        for line in islice(f, 10):
                             if line.strip().startswith("title:"):
                                 file_title = line.split(":", 1)[1].strip()
                                 if file_title == title:
-                                    return (project_file, folder)
+                                    return (Path(project_file.path), folder)
 
         return (None, None)
 
     def _parse_frontmatter(self, file_path: Path) -> dict:
         """Parse YAML frontmatter from project file."""
-        frontmatter = {}
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        in_frontmatter = False
-        for line in lines:
-            if line.strip() == "---":
-                if not in_frontmatter:
-                    in_frontmatter = True
-                else:
-                    break
-                continue
-
-            if in_frontmatter and ":" in line:
-                key, value = line.split(":", 1)
-                frontmatter[key.strip()] = value.strip()
-
-        return frontmatter
+        return read_frontmatter(file_path)
 
     def _update_frontmatter(self, file_path: Path, updates: dict, removals: list[str] | None = None) -> None:
         """
@@ -404,16 +387,13 @@ class ProjectManager:
                         continue
 
                     area_dir = folder_path / area_kebab
-                    if not area_dir.exists():
-                        continue
 
-                    for project_file in area_dir.glob("*.md"):
+                    for project_file in iter_markdown_files(area_dir):
                         # If filter_names specified, check title
                         if filter_names:
-                            with open(project_file, 'r') as f:
-                                content = f.read()
+                            with open(project_file.path, 'r') as f:
                                 title = None
-                                for line in content.split('\n')[:10]:
+                                for line in islice(f, 10):
                                     if line.strip().startswith("title:"):
                                         title = line.split(":", 1)[1].strip()
                                         break
@@ -422,7 +402,7 @@ class ProjectManager:
                                     continue
 
                         # Update review date
-                        self._update_frontmatter(project_file, {"last_reviewed": today})
+                        self._update_frontmatter(Path(project_file.path), {"last_reviewed": today})
                         updated_count += 1
 
         # Update action lists
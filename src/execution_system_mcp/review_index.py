@@ -0,0 +1,123 @@
+"""In-memory index of project review dates."""
+
+import os
+from bisect import bisect_right
+from datetime import date
+
+from execution_system_mcp.frontmatter import read_frontmatter
+from execution_system_mcp.scanner import (
+    entry_stem,
+    iter_markdown_files,
+    iter_subdirectories,
+)
+
+
+class ProjectReviewIndex:
+    """
+    Project review metadata kept between review queries.
+
+    refresh() re-stats the project files and only re-reads those whose
+    mtime or size changed. Projects with a valid YYYY-MM-DD last_reviewed are
+    kept sorted by that date, so the ones due for review are a prefix found
+    by binary search. Projects with a missing or irregular date are returned
+    separately for the caller to evaluate.
+    """
+
+    def __init__(self, projects_base: str | os.PathLike, folders: tuple[str, ...]) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            projects_base: Path to the 10k-projects directory
+            folders: Project folders to index, in scan order
+        """
+        self._projects_base = os.fspath(projects_base)
+        self._folders = folders
+        # path -> ((mtime_ns, size), record), in scan order
+        self._files: dict[str, tuple[tuple[int, int], dict]] = {}
+        # (seq, record) pairs, where seq is the record's scan order
+        self._dated_keys: list[str] = []
+        self._dated: list[tuple[int, dict]] = []
+        self._undated: list[tuple[int, dict]] = []
+
+    @staticmethod
+    def _read_record(entry: os.DirEntry, folder: str) -> dict:
+        """
+        Build the index record for one project file.
+
+        Args:
+            entry: Directory entry of the project file
+            folder: Project folder containing the file
+
+        Returns:
+            Dict with title, folder, area, filename, last_reviewed and dated
+        """
+        frontmatter = read_frontmatter(entry.path)
+        stem = entry_stem(entry)
+        last_reviewed = frontmatter.get("last_reviewed") or None
+
+        dated = False
+        if last_reviewed and len(last_reviewed) == 10 and last_reviewed[4] == "-" and last_reviewed[7] == "-":
+            try:
+                date.fromisoformat(last_reviewed)
+                dated = True
+            except ValueError:
+                pass
+
+        return {
+            "title": frontmatter.get("title", stem),
+            "folder": folder,
+            "area": frontmatter.get("area", ""),
+            "filename": stem,
+            "last_reviewed": last_reviewed,
+            "dated": dated,
+        }
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the project files on disk."""
+        files = {}
+        changed = False
+
+        for folder in self._folders:
+            for area_dir in iter_subdirectories(os.path.join(self._projects_base, folder)):
+                for entry in iter_markdown_files(area_dir.path):
+                    stat = entry.stat()
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._files.get(entry.path)
+                    if cached is None or cached[0] != signature:
+                        cached = (signature, self._read_record(entry, folder))
+                        changed = True
+                    files[entry.path] = cached
+
+        # Comparing key order also catches removed and reordered files
+        if not changed and list(files) == list(self._files):
+            return
+
+        # Records are shared with earlier query results, so scan order is kept
+        # beside them rather than written into them
+        self._files = files
+        records = [(seq, record) for seq, (_, record) in enumerate(files.values())]
+
+        self._dated = sorted(
+            (pair for pair in records if pair[1]["dated"]),
+            key=lambda pair: (pair[1]["last_reviewed"], pair[0])
+        )
+        self._dated_keys = [record["last_reviewed"] for _, record in self._dated]
+        self._undated = [pair for pair in records if not pair[1]["dated"]]
+
+    def needing_review(self, cutoff: str) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]]]:
+        """
+        Get projects whose review date is on or before the cutoff.
+
+        Args:
+            cutoff: ISO date (YYYY-MM-DD)
+
+        Returns:
+            Tuple of (dated records due for review, undated records), each a
+            list of (seq, record) pairs
+            - seq is the record's scan order
+            - Undated records have a missing or irregular last_reviewed and
+              are not filtered
+            - Records are shared between calls and must not be modified
+        """
+        return (self._dated[:bisect_right(self._dated_keys, cutoff)], self._undated)
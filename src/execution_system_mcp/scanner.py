@@ -0,0 +1,90 @@
+"""Directory scanning helpers shared by listers and auditors."""
+
+import os
+from collections.abc import Iterator
+
+
+def iter_markdown_files(directory: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """
+    Yield markdown files directly inside a directory.
+
+    Uses os.scandir so the file type comes from the directory entry itself
+    instead of a separate stat() per file. A missing directory yields nothing.
+
+    Args:
+        directory: Directory to scan (not recursive)
+
+    Yields:
+        DirEntry for each regular file ending in .md
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    yield entry
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
+def iter_subdirectories(directory: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """
+    Yield subdirectories directly inside a directory.
+
+    Args:
+        directory: Directory to scan (not recursive)
+
+    Yields:
+        DirEntry for each subdirectory. A missing directory yields nothing.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+
+def iter_markdown_tree(directory: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """
+    Yield markdown files anywhere below a directory.
+
+    An iterative os.scandir walk replacing Path.rglob("*.md"): no Path object or glob
+    matching per entry. Files in a directory are yielded before those in its
+    subdirectories, the same order rglob used. Symlinked directories are not
+    followed. A missing directory yields nothing.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        DirEntry for each regular file ending in .md
+    """
+    stack = [directory]
+    while stack:
+        subdirectories = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield entry
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        # Reversed so the first subdirectory is walked next
+        stack.extend(reversed(subdirectories))
+
+
+def entry_stem(entry: os.DirEntry) -> str:
+    """
+    Get a directory entry's filename without its extension.
+
+    Args:
+        entry: Directory entry
+
+    Returns:
+        Filename without extension (equivalent to Path.stem)
+    """
+    return os.path.splitext(entry.name)[0]
@@ -5,6 +5,12 @@ from pathlib import Path
 from typing import Literal
 
 from execution_system_mcp.config import ConfigManager
+from execution_system_mcp.frontmatter import read_frontmatter
+from execution_system_mcp.scanner import (
+    entry_stem,
+    iter_markdown_files,
+    iter_subdirectories,
+)
 
 
 class Searcher:
@@ -34,23 +40,7 @@ class Searcher:
         Returns:
             Dict of frontmatter key-value pairs
         """
-        frontmatter = {}
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-
-        in_frontmatter = False
-        for line in lines[:10]:  # Only check first 10 lines
-            if line.strip() == '---':
-                if not in_frontmatter:
-                    in_frontmatter = True
-                    continue
-                else:
-                    break
-            if in_frontmatter and ':' in line:
-                key, value = line.split(':', 1)
-                frontmatter[key.strip()] = value.strip()
-
-        return frontmatter
+        return read_frontmatter(file_path)
 
     def search_projects(
         self,
@@ -99,21 +89,14 @@ class Searcher:
         query_lower = query.lower()
 
         for folder_name in folders:
-            folder_path = projects_base / folder_name
-            if not folder_path.exists():
-                continue
-
-            for area_dir in folder_path.iterdir():
-                if not area_dir.is_dir():
-                    continue
-
+            for area_dir in iter_subdirectories(projects_base / folder_name):
                 # Apply area filter
                 if area_kebab and area_dir.name != area_kebab:
                     continue
 
-                for project_file in area_dir.glob("*.md"):
+                for project_file in iter_markdown_files(area_dir.path):
                     frontmatter = self._parse_frontmatter(project_file)
-                    title = frontmatter.get("title", project_file.stem)
+                    title = frontmatter.get("title", entry_stem(project_file))
                     area = frontmatter.get("area", "")
 
                     # Track if we found match in title to avoid duplicates
@@ -125,7 +108,7 @@ class Searcher:
                             "title": title,
                             "area": area,
                             "folder": folder_name,
-                            "filename": project_file.stem,
+                            "filename": entry_stem(project_file),
                             "match_location": "title",
                             "snippet": title
                         })
@@ -133,7 +116,7 @@ class Searcher:
 
                     # Search in content (skip if already found in title)
                     if not found_in_title:
-                        with open(project_file, 'r') as f:
+                        with open(project_file.path, 'r') as f:
                             content = f.read()
 
                         # Skip frontmatter when searching content
@@ -153,7 +136,7 @@ class Searcher:
                                         "title": title,
                                         "area": area,
                                         "folder": folder_name,
-                                        "filename": project_file.stem,
+                                        "filename": entry_stem(project_file),
                                         "match_location": "content",
                                         "snippet": snippet
                                     })
@@ -1,8 +1,12 @@
 """MCP server for project creation."""
 
+import asyncio
 import json
 import os
-from pathlib import Path
+import threading
+from collections.abc import Callable
+from operator import itemgetter
+from typing import TypeVar
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -21,61 +25,295 @@ from execution_system_mcp.project_manager import ProjectManager
 from execution_system_mcp.searcher import Searcher
 from execution_system_mcp.validator import ProjectValidator
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the "fast" extra
+    orjson = None
+
+_T = TypeVar("_T")
+
+# Results larger than this (in compact form) are returned without indentation
+_COMPACT_JSON_THRESHOLD = 8192
+
+_DATE_PATTERN = "^\\d{4}-\\d{2}-\\d{2}$"
+
+# Schema fragments shared by several tools, defined once and referenced by name
+_NO_ARGS_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+_TITLE_PROP = {
+    "type": "string",
+    "description": "Project title (exact match, case-sensitive)"
+}
+
+_DUE_PROP = {
+    "type": "string",
+    "description": "Optional due date in ISO format YYYY-MM-DD",
+    "pattern": _DATE_PATTERN
+}
+
+_DEFER_PROP = {
+    "type": "string",
+    "description": "Optional defer date in ISO format YYYY-MM-DD",
+    "pattern": _DATE_PATTERN
+}
+
+_ACTION_DATE_PROP = {
+    "type": "string",
+    "description": "Optional creation date in ISO format YYYY-MM-DD (defaults to today)",
+    "pattern": _DATE_PATTERN
+}
+
+_DAYS_THRESHOLD_PROP = {
+    "type": "integer",
+    "description": "Number of days since last review (inclusive) to flag for review (default: 7)"
+}
+
+_FILTER_AREA_PROP = {
+    "type": "string",
+    "description": "Optional: filter to show only projects from a specific area (case-insensitive)"
+}
+
+_FILTER_PROJECT_PROP = {
+    "type": "string",
+    "description": "Optional: filter to show only actions for a specific project (use kebab-case filename)"
+}
+
+_FILTER_CONTEXT_PROP = {
+    "type": "string",
+    "description": "Optional: filter to show only actions for a specific context (e.g., '@macbook', '@phone')"
+}
+
+_INCLUDE_STATES_PROP = {
+    "type": "array",
+    "items": {
+        "type": "string",
+        "enum": ["next", "waiting", "deferred", "incubating"]
+    },
+    "description": "Which action states to include (default: all states)"
+}
+
+
+def _dumps(obj: object) -> str:
+    """
+    Serialize a handler result as JSON.
+
+    Small results are indented for readability. Results whose compact form
+    is over _COMPACT_JSON_THRESHOLD characters are returned compact, since
+    the indentation would mostly add whitespace for the client to tokenize.
+    Uses orjson when it is installed and the standard library otherwise;
+    both paths emit the same text with non-ASCII left as-is.
 
-def create_project_handler(params: dict, config_path: str | None = None) -> str:
+    Args:
+        obj: JSON-serializable result
+
+    Returns:
+        JSON string
     """
-    Handle create_project tool invocation.
+    if orjson is not None:
+        compact = orjson.dumps(obj).decode()
+        if len(compact) > _COMPACT_JSON_THRESHOLD:
+            return compact
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    compact = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    if len(compact) > _COMPACT_JSON_THRESHOLD:
+        return compact
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Parsed configs keyed by path, with the st_mtime_ns they were loaded at
+_CONFIG_CACHE: dict[str, tuple[int, ConfigManager]] = {}
+
+
+def _get_config(config_path: str | None) -> ConfigManager:
+    """
+    Get a ConfigManager, reusing the cached one while the file is unchanged.
+
+    The server is long-lived and the config rarely changes, so re-reading and
+    re-parsing it on every tool call is wasted work. The cache entry is
+    invalidated whenever the file's modification time changes.
+
+    Args:
+        config_path: Path to config file. If None, the default location is
+            loaded without caching.
+
+    Returns:
+        ConfigManager for the current contents of the config file
+    """
+    if config_path is None:
+        return ConfigManager(config_path)
+
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        # Let ConfigManager raise its usual error for a missing file
+        _CONFIG_CACHE.pop(config_path, None)
+        return ConfigManager(config_path)
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = ConfigManager(config_path)
+    _CONFIG_CACHE[config_path] = (mtime, config)
+    return config
+
+
+# Service objects per config path, rebuilt when _get_config() returns a new config
+_SERVICE_CACHE: dict[str | None, tuple[ConfigManager, dict[type, object]]] = {}
+
+
+def _get_service(config_path: str | None, service_cls: type[_T]) -> _T:
+    """
+    Get the shared service instance (lister, manager, ...) for a config.
+
+    Services only hold their config, so one instance per class is reused
+    across tool calls until the config file changes.
+
+    Args:
+        config_path: Path to config file
+        service_cls: Service class taking a ConfigManager
+
+    Returns:
+        Instance of service_cls bound to the current config
+    """
+    config = _get_config(config_path)
+    cached = _SERVICE_CACHE.get(config_path)
+    if cached is None or cached[0] is not config:
+        cached = (config, {})
+        _SERVICE_CACHE[config_path] = cached
+
+    services = cached[1]
+    service = services.get(service_cls)
+    if service is None:
+        service = services[service_cls] = service_cls(config)
+    return service
+
+
+def _arg_getter(*keys: str) -> Callable[[dict], tuple]:
+    """
+    Build an extractor returning several tool parameters at once.
+
+    The common case, where every key is present, is a single itemgetter
+    call. Missing keys fall back to None so handlers keep their own
+    required-parameter checks and error messages. A single key still gives
+    a 1-tuple, matching the fallback.
+
+    Args:
+        *keys: Parameter names, in the order to return them
+
+    Returns:
+        Function mapping a params dict to a tuple of values
+    """
+    getter = itemgetter(*keys)
+    if len(keys) == 1:
+        key_getter = getter
+
+        def getter(params: dict) -> tuple:
+            return (key_getter(params),)
+
+    def extract(params: dict) -> tuple:
+        try:
+            return getter(params)
+        except KeyError:
+            return tuple(params.get(key) for key in keys)
+
+    return extract
+
+
+# Parameter extractors for handlers that read several parameters up front
+_CREATE_PROJECT_ARGS = _arg_getter("title", "area", "type", "folder")
+_TITLE_DUE_DATE_ARGS = _arg_getter("title", "due_date")
+_TITLE_NEW_AREA_ARGS = _arg_getter("title", "new_area")
+_TITLE_PROJECT_TYPE_ARGS = _arg_getter("title", "project_type")
+_TEXT_CONTEXT_ARGS = _arg_getter("text", "context")
+_TEXT_PROJECT_ARGS = _arg_getter("text", "project")
+_FILE_PATH_LINE_NUMBER_ARGS = _arg_getter("file_path", "line_number")
+
+
+def _create_project(params: dict, config_path: str | None) -> tuple[str, str | None, str]:
+    """
+    Validate parameters and create a project file.
 
     Args:
         params: Tool parameters (title, area, type, folder, due?)
         config_path: Optional path to config file (for testing)
 
     Returns:
-        Success or error message
+        Tuple of (status, title, detail)
+        - On success: ("ok", title, absolute path of created file)
+        - On validation failure: ("error", title, error message)
+
+    Raises:
+        Exception: Unexpected errors (e.g. unreadable config) propagate to
+            the caller; the MCP dispatcher turns them into error text
     """
-    try:
-        # Load configuration
-        config = ConfigManager(config_path)
-
-        # Extract parameters
-        title = params.get("title")
-        area = params.get("area")
-        project_type = params.get("type")
-        folder = params.get("folder")
-        due = params.get("due")
-
-        # Validate required parameters
-        if not all([title, area, project_type, folder]):
-            return "Error: Missing required parameter (title, area, type, or folder)"
-
-        # Initialize validator and creator
-        validator = ProjectValidator(config)
-        creator = ProjectCreator(config)
-
-        # Validate area
-        is_valid, error_msg = validator.validate_area(area)
+    # Extract parameters
+    title, area, project_type, folder = _CREATE_PROJECT_ARGS(params)
+    due = params.get("due")
+
+    # Validate required parameters
+    if not all([title, area, project_type, folder]):
+        return ("error", title, "Missing required parameter (title, area, type, or folder)")
+
+    # Initialize validator and creator
+    validator = _get_service(config_path, ProjectValidator)
+    creator = _get_service(config_path, ProjectCreator)
+
+    # Validate area
+    is_valid, error_msg = validator.validate_area(area)
+    if not is_valid:
+        return ("error", title, error_msg)
+
+    # Check for duplicates
+    filename = creator.to_kebab_case(title)
+    is_duplicate, duplicate_folder = validator.check_duplicates(filename)
+    if is_duplicate:
+        return ("error", title, f"Project '{title}' already exists in {duplicate_folder}/ as {filename}.md")
+
+    # Validate due date if provided
+    if due:
+        is_valid, error_msg = validator.validate_due_date(due)
         if not is_valid:
-            return f"Error: {error_msg}"
+            return ("error", title, error_msg)
 
-        # Check for duplicates
-        filename = creator.to_kebab_case(title)
-        is_duplicate, duplicate_folder = validator.check_duplicates(filename)
-        if is_duplicate:
-            return f"Error: Project '{title}' already exists in {duplicate_folder}/ as {filename}.md"
+    # Create project
+    file_path = creator.create_project(title, area, project_type, folder, due)
+    validator.add(filename, folder, file_path)
 
-        # Validate due date if provided
-        if due:
-            is_valid, error_msg = validator.validate_due_date(due)
-            if not is_valid:
-                return f"Error: {error_msg}"
+    return ("ok", title, file_path)
 
-        # Create project
-        file_path = creator.create_project(title, area, project_type, folder, due)
 
-        return f"✓ Successfully created project '{title}' at {file_path}"
+def create_project_handler(
+    params: dict,
+    config_path: str | None = None,
+    *,
+    raw: bool = False
+) -> str | tuple[str, str | None, str]:
+    """
+    Handle create_project tool invocation.
 
-    except Exception as e:
-        return f"Error: {str(e)}"
+    Args:
+        params: Tool parameters (title, area, type, folder, due?)
+        config_path: Optional path to config file (for testing)
+        raw: If True, return the (status, title, detail) tuple instead of a
+            formatted message. Bulk callers use this to skip message formatting.
+
+    Returns:
+        Success or error message, or the raw result tuple when raw=True
+    """
+    result = _create_project(params, config_path)
+    if raw:
+        return result
+
+    status, title, detail = result
+    if status == "ok":
+        return f"✓ Successfully created project '{title}' at {detail}"
+    return f"Error: {detail}"
 
 
 def list_active_projects_handler(params: dict, config_path: str | None = None) -> str:
@@ -89,18 +327,11 @@ def list_active_projects_handler(params: dict, config_path: str | None = None) -
     Returns:
         Formatted list of active projects grouped by area
     """
-    try:
-        # Load configuration
-        config = ConfigManager(config_path)
-
-        # Initialize lister
-        lister = ProjectLister(config)
+    # Initialize lister
+    lister = _get_service(config_path, ProjectLister)
 
-        # List active projects
-        return lister.list_active_projects()
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # List active projects
+    return lister.list_active_projects()
 
 
 def list_projects_handler(params: dict, config_path: str | None = None) -> str:
@@ -114,38 +345,31 @@ def list_projects_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with projects grouped according to parameters
     """
-    try:
-        # Load configuration
-        config = ConfigManager(config_path)
-
-        # Initialize lister
-        lister = ProjectLister(config)
-
-        # Extract parameters with defaults
-        folder = params.get("folder", "active")
-        group_by = params.get("group_by", "area")
-        filter_area = params.get("filter_area")
-        filter_has_due = params.get("filter_has_due")
-        completed_date_preset = params.get("completed_date_preset")
-        filter_completed_start = params.get("filter_completed_start")
-        filter_completed_end = params.get("filter_completed_end")
-
-        # List projects
-        result = lister.list_projects(
-            folder=folder,
-            group_by=group_by,
-            filter_area=filter_area,
-            filter_has_due=filter_has_due,
-            completed_date_preset=completed_date_preset,
-            filter_completed_start=filter_completed_start,
-            filter_completed_end=filter_completed_end
-        )
-
-        # Return as JSON string
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    # Initialize lister
+    lister = _get_service(config_path, ProjectLister)
+
+    # Extract parameters with defaults
+    folder = params.get("folder", "active")
+    group_by = params.get("group_by", "area")
+    filter_area = params.get("filter_area")
+    filter_has_due = params.get("filter_has_due")
+    completed_date_preset = params.get("completed_date_preset")
+    filter_completed_start = params.get("filter_completed_start")
+    filter_completed_end = params.get("filter_completed_end")
+
+    # List projects
+    result = lister.list_projects(
+        folder=folder,
+        group_by=group_by,
+        filter_area=filter_area,
+        filter_has_due=filter_has_due,
+        completed_date_preset=completed_date_preset,
+        filter_completed_start=filter_completed_start,
+        filter_completed_end=filter_completed_end
+    )
+
+    # Return as JSON string
+    return _dumps(result)
 
 
 def complete_project_handler(params: dict, config_path: str | None = None) -> str:
@@ -159,25 +383,18 @@ def complete_project_handler(params: dict, config_path: str | None = None) -> st
     Returns:
         Success or error message
     """
-    try:
-        # Load configuration
-        config = ConfigManager(config_path)
+    # Extract parameters
+    title = params.get("title")
 
-        # Extract parameters
-        title = params.get("title")
+    # Validate required parameters
+    if not title:
+        return "Error: Missing required parameter (title)"
 
-        # Validate required parameters
-        if not title:
-            return "Error: Missing required parameter (title)"
+    # Initialize completer
+    completer = _get_service(config_path, ProjectCompleter)
 
-        # Initialize completer
-        completer = ProjectCompleter(config)
-
-        # Complete project
-        return completer.complete_project(title)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    # Complete project
+    return completer.complete_project(title)
 
 
 def list_actions_handler(params: dict, config_path: str | None = None) -> str:
@@ -191,32 +408,25 @@ def list_actions_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with actions grouped according to parameters
     """
-    try:
-        # Load configuration
-        config = ConfigManager(config_path)
-
-        # Initialize lister
-        lister = ActionLister(config)
+    # Initialize lister
+    lister = _get_service(config_path, ActionLister)
 
-        # Extract parameters with defaults
-        group_by = params.get("group_by", "project")
-        include_states = params.get("include_states")
-        filter_project = params.get("filter_project")
-        filter_context = params.get("filter_context")
+    # Extract parameters with defaults
+    group_by = params.get("group_by", "project")
+    include_states = params.get("include_states")
+    filter_project = params.get("filter_project")
+    filter_context = params.get("filter_context")
 
-        # List actions
-        result = lister.list_actions(
-            group_by=group_by,
-            include_states=include_states,
-            filter_project=filter_project,
-            filter_context=filter_context
-        )
+    # List actions
+    result = lister.list_actions(
+        group_by=group_by,
+        include_states=include_states,
+        filter_project=filter_project,
+        filter_context=filter_context
+    )
 
-        # Return as JSON string
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    # Return as JSON string
+    return _dumps(result)
 
 
 def activate_project_handler(params: dict, config_path: str | None = None) -> str:
@@ -230,18 +440,13 @@ def activate_project_handler(params: dict, config_path: str | None = None) -> st
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
+    manager = _get_service(config_path, ProjectManager)
+    title = params.get("title")
 
-        if not title:
-            return "Error: Missing required parameter (title)"
+    if not title:
+        return "Error: Missing required parameter (title)"
 
-        return manager.activate_project(title)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.activate_project(title)
 
 
 def move_project_to_incubator_handler(params: dict, config_path: str | None = None) -> str:
@@ -255,18 +460,13 @@ def move_project_to_incubator_handler(params: dict, config_path: str | None = No
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
+    manager = _get_service(config_path, ProjectManager)
+    title = params.get("title")
 
-        if not title:
-            return "Error: Missing required parameter (title)"
+    if not title:
+        return "Error: Missing required parameter (title)"
 
-        return manager.move_project_to_incubator(title)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.move_project_to_incubator(title)
 
 
 def descope_project_handler(params: dict, config_path: str | None = None) -> str:
@@ -280,18 +480,13 @@ def descope_project_handler(params: dict, config_path: str | None = None) -> str
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
+    manager = _get_service(config_path, ProjectManager)
+    title = params.get("title")
 
-        if not title:
-            return "Error: Missing required parameter (title)"
+    if not title:
+        return "Error: Missing required parameter (title)"
 
-        return manager.descope_project(title)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.descope_project(title)
 
 
 def update_project_due_date_handler(params: dict, config_path: str | None = None) -> str:
@@ -305,19 +500,13 @@ def update_project_due_date_handler(params: dict, config_path: str | None = None
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
-        due_date = params.get("due_date")
+    manager = _get_service(config_path, ProjectManager)
+    title, due_date = _TITLE_DUE_DATE_ARGS(params)
 
-        if not title:
-            return "Error: Missing required parameter (title)"
+    if not title:
+        return "Error: Missing required parameter (title)"
 
-        return manager.update_project_due_date(title, due_date)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.update_project_due_date(title, due_date)
 
 
 def update_project_area_handler(params: dict, config_path: str | None = None) -> str:
@@ -331,19 +520,13 @@ def update_project_area_handler(params: dict, config_path: str | None = None) ->
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
-        new_area = params.get("new_area")
-
-        if not title or not new_area:
-            return "Error: Missing required parameters (title, new_area)"
+    manager = _get_service(config_path, ProjectManager)
+    title, new_area = _TITLE_NEW_AREA_ARGS(params)
 
-        return manager.update_project_area(title, new_area)
+    if not title or not new_area:
+        return "Error: Missing required parameters (title, new_area)"
 
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.update_project_area(title, new_area)
 
 
 def update_project_type_handler(params: dict, config_path: str | None = None) -> str:
@@ -357,19 +540,13 @@ def update_project_type_handler(params: dict, config_path: str | None = None) ->
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
-        title = params.get("title")
-        project_type = params.get("project_type")
+    manager = _get_service(config_path, ProjectManager)
+    title, project_type = _TITLE_PROJECT_TYPE_ARGS(params)
 
-        if not title or not project_type:
-            return "Error: Missing required parameters (title, project_type)"
+    if not title or not project_type:
+        return "Error: Missing required parameters (title, project_type)"
 
-        return manager.update_project_type(title, project_type)
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.update_project_type(title, project_type)
 
 
 def update_review_dates_handler(params: dict, config_path: str | None = None) -> str:
@@ -383,24 +560,19 @@ def update_review_dates_handler(params: dict, config_path: str | None = None) ->
     Returns:
         Success message with count
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ProjectManager(config)
+    manager = _get_service(config_path, ProjectManager)
 
-        target_type = params.get("target_type", "projects")
-        filter_folder = params.get("filter_folder")
-        filter_area = params.get("filter_area")
-        filter_names = params.get("filter_names")
+    target_type = params.get("target_type", "projects")
+    filter_folder = params.get("filter_folder")
+    filter_area = params.get("filter_area")
+    filter_names = params.get("filter_names")
 
-        return manager.update_review_dates(
-            target_type=target_type,
-            filter_folder=filter_folder,
-            filter_area=filter_area,
-            filter_names=filter_names
-        )
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.update_review_dates(
+        target_type=target_type,
+        filter_folder=filter_folder,
+        filter_area=filter_area,
+        filter_names=filter_names
+    )
 
 
 def audit_projects_handler(params: dict, config_path: str | None = None) -> str:
@@ -414,14 +586,9 @@ def audit_projects_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with validation issues
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        result = auditor.audit_projects()
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    result = auditor.audit_projects()
+    return _dumps(result)
 
 
 def audit_orphan_projects_handler(params: dict, config_path: str | None = None) -> str:
@@ -435,14 +602,9 @@ def audit_orphan_projects_handler(params: dict, config_path: str | None = None)
     Returns:
         JSON string with orphan projects
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        result = auditor.audit_orphan_projects()
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    result = auditor.audit_orphan_projects()
+    return _dumps(result)
 
 
 def audit_orphan_actions_handler(params: dict, config_path: str | None = None) -> str:
@@ -456,14 +618,9 @@ def audit_orphan_actions_handler(params: dict, config_path: str | None = None) -
     Returns:
         JSON string with orphan actions
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        result = auditor.audit_orphan_actions()
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    result = auditor.audit_orphan_actions()
+    return _dumps(result)
 
 
 def audit_action_files_handler(params: dict, config_path: str | None = None) -> str:
@@ -477,14 +634,9 @@ def audit_action_files_handler(params: dict, config_path: str | None = None) ->
     Returns:
         JSON string with action file validation issues
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        result = auditor.audit_action_files()
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    result = auditor.audit_action_files()
+    return _dumps(result)
 
 
 def list_projects_needing_review_handler(params: dict, config_path: str | None = None) -> str:
@@ -498,15 +650,10 @@ def list_projects_needing_review_handler(params: dict, config_path: str | None =
     Returns:
         JSON string with projects needing review
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        days_threshold = params.get("days_threshold", 7)
-        result = auditor.list_projects_needing_review(days_threshold)
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    days_threshold = params.get("days_threshold", 7)
+    result = auditor.list_projects_needing_review(days_threshold)
+    return _dumps(result)
 
 
 def list_actions_needing_review_handler(params: dict, config_path: str | None = None) -> str:
@@ -520,15 +667,10 @@ def list_actions_needing_review_handler(params: dict, config_path: str | None =
     Returns:
         JSON string with action files needing review
     """
-    try:
-        config = ConfigManager(config_path)
-        auditor = Auditor(config)
-        days_threshold = params.get("days_threshold", 7)
-        result = auditor.list_actions_needing_review(days_threshold)
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    auditor = _get_service(config_path, Auditor)
+    days_threshold = params.get("days_threshold", 7)
+    result = auditor.list_actions_needing_review(days_threshold)
+    return _dumps(result)
 
 
 def search_projects_handler(params: dict, config_path: str | None = None) -> str:
@@ -542,26 +684,21 @@ def search_projects_handler(params: dict, config_path: str | None = None) -> str
     Returns:
         JSON string with matching projects
     """
-    try:
-        config = ConfigManager(config_path)
-        searcher = Searcher(config)
+    searcher = _get_service(config_path, Searcher)
 
-        query = params.get("query")
-        if not query:
-            return json.dumps({"error": "Missing required parameter (query)"}, indent=2)
+    query = params.get("query")
+    if not query:
+        return _dumps({"error": "Missing required parameter (query)"})
 
-        folder = params.get("folder", "all")
-        filter_area = params.get("filter_area")
+    folder = params.get("folder", "all")
+    filter_area = params.get("filter_area")
 
-        result = searcher.search_projects(
-            query=query,
-            folder=folder,
-            filter_area=filter_area
-        )
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    result = searcher.search_projects(
+        query=query,
+        folder=folder,
+        filter_area=filter_area
+    )
+    return _dumps(result)
 
 
 def search_actions_handler(params: dict, config_path: str | None = None) -> str:
@@ -575,28 +712,23 @@ def search_actions_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with matching actions
     """
-    try:
-        config = ConfigManager(config_path)
-        searcher = Searcher(config)
+    searcher = _get_service(config_path, Searcher)
 
-        query = params.get("query")
-        if not query:
-            return json.dumps({"error": "Missing required parameter (query)"}, indent=2)
+    query = params.get("query")
+    if not query:
+        return _dumps({"error": "Missing required parameter (query)"})
 
-        include_states = params.get("include_states")
-        filter_project = params.get("filter_project")
-        filter_context = params.get("filter_context")
+    include_states = params.get("include_states")
+    filter_project = params.get("filter_project")
+    filter_context = params.get("filter_context")
 
-        result = searcher.search_actions(
-            query=query,
-            include_states=include_states,
-            filter_project=filter_project,
-            filter_context=filter_context
-        )
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    result = searcher.search_actions(
+        query=query,
+        include_states=include_states,
+        filter_project=filter_project,
+        filter_context=filter_context
+    )
+    return _dumps(result)
 
 
 def list_areas_handler(params: dict, config_path: str | None = None) -> str:
@@ -610,13 +742,8 @@ def list_areas_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with list of areas
     """
-    try:
-        config = ConfigManager(config_path)
-        lister = AreaLister(config)
-        return lister.list_areas()
-
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    lister = _get_service(config_path, AreaLister)
+    return lister.list_areas()
 
 
 def add_action_handler(params: dict, config_path: str | None = None) -> str:
@@ -630,27 +757,21 @@ def add_action_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ActionManager(config)
+    manager = _get_service(config_path, ActionManager)
 
-        text = params.get("text")
-        context = params.get("context")
+    text, context = _TEXT_CONTEXT_ARGS(params)
 
-        if not text or not context:
-            return "Error: Missing required parameters (text, context)"
+    if not text or not context:
+        return "Error: Missing required parameters (text, context)"
 
-        return manager.add_action(
-            text=text,
-            context=context,
-            project=params.get("project"),
-            due=params.get("due"),
-            defer=params.get("defer"),
-            action_date=params.get("action_date")
-        )
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.add_action(
+        text=text,
+        context=context,
+        project=params.get("project"),
+        due=params.get("due"),
+        defer=params.get("defer"),
+        action_date=params.get("action_date")
+    )
 
 
 def add_to_waiting_handler(params: dict, config_path: str | None = None) -> str:
@@ -664,29 +785,23 @@ def add_to_waiting_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ActionManager(config)
+    manager = _get_service(config_path, ActionManager)
 
-        text = params.get("text")
-        project = params.get("project")
+    text, project = _TEXT_PROJECT_ARGS(params)
 
-        if not text:
-            return "Error: Missing required parameter (text)"
+    if not text:
+        return "Error: Missing required parameter (text)"
 
-        if not project:
-            return "Error: Missing required parameter (project)"
+    if not project:
+        return "Error: Missing required parameter (project)"
 
-        return manager.add_to_waiting(
-            text=text,
-            project=project,
-            due=params.get("due"),
-            defer=params.get("defer"),
-            action_date=params.get("action_date")
-        )
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.add_to_waiting(
+        text=text,
+        project=project,
+        due=params.get("due"),
+        defer=params.get("defer"),
+        action_date=params.get("action_date")
+    )
 
 
 def add_to_deferred_handler(params: dict, config_path: str | None = None) -> str:
@@ -700,28 +815,22 @@ def add_to_deferred_handler(params: dict, config_path: str | None = None) -> str
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ActionManager(config)
-
-        text = params.get("text")
-        project = params.get("project")
+    manager = _get_service(config_path, ActionManager)
 
-        if not text:
-            return "Error: Missing required parameter (text)"
+    text, project = _TEXT_PROJECT_ARGS(params)
 
-        if not project:
-            return "Error: Missing required parameter (project)"
+    if not text:
+        return "Error: Missing required parameter (text)"
 
-        return manager.add_to_deferred(
-            text=text,
-            project=project,
-            defer=params.get("defer"),
-            action_date=params.get("action_date")
-        )
+    if not project:
+        return "Error: Missing required parameter (project)"
 
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.add_to_deferred(
+        text=text,
+        project=project,
+        defer=params.get("defer"),
+        action_date=params.get("action_date")
+    )
 
 
 def add_to_incubating_handler(params: dict, config_path: str | None = None) -> str:
@@ -735,22 +844,17 @@ def add_to_incubating_handler(params: dict, config_path: str | None = None) -> s
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ActionManager(config)
+    manager = _get_service(config_path, ActionManager)
 
-        text = params.get("text")
-        if not text:
-            return "Error: Missing required parameter (text)"
+    text = params.get("text")
+    if not text:
+        return "Error: Missing required parameter (text)"
 
-        return manager.add_to_incubating(
-            text=text,
-            project=params.get("project"),
-            action_date=params.get("action_date")
-        )
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.add_to_incubating(
+        text=text,
+        project=params.get("project"),
+        action_date=params.get("action_date")
+    )
 
 
 def complete_action_handler(params: dict, config_path: str | None = None) -> str:
@@ -764,24 +868,18 @@ def complete_action_handler(params: dict, config_path: str | None = None) -> str
     Returns:
         Success or error message
     """
-    try:
-        config = ConfigManager(config_path)
-        manager = ActionManager(config)
+    manager = _get_service(config_path, ActionManager)
 
-        file_path = params.get("file_path")
-        line_number = params.get("line_number")
+    file_path, line_number = _FILE_PATH_LINE_NUMBER_ARGS(params)
 
-        if not file_path or line_number is None:
-            return "Error: Missing required parameters (file_path, line_number)"
+    if not file_path or line_number is None:
+        return "Error: Missing required parameters (file_path, line_number)"
 
-        return manager.complete_action(
-            file_path=file_path,
-            line_number=line_number,
-            completion_date=params.get("completion_date")
-        )
-
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return manager.complete_action(
+        file_path=file_path,
+        line_number=line_number,
+        completion_date=params.get("completion_date")
+    )
 
 
 def list_goals_handler(params: dict, config_path: str | None = None) -> str:
@@ -795,13 +893,621 @@ def list_goals_handler(params: dict, config_path: str | None = None) -> str:
     Returns:
         JSON string with goals grouped by folder
     """
-    try:
-        config = ConfigManager(config_path)
-        lister = GoalLister(config)
-        return lister.list_goals()
+    lister = _get_service(config_path, GoalLister)
+    return lister.list_goals()
+
+
+# Tools that only read the execution system; the only ones allowed in "bulk"
+_READ_ONLY_TOOLS = (
+    "list_active_projects",
+    "list_projects",
+    "list_actions",
+    "audit_projects",
+    "audit_orphan_projects",
+    "audit_orphan_actions",
+    "audit_action_files",
+    "list_projects_needing_review",
+    "list_actions_needing_review",
+    "search_projects",
+    "search_actions",
+    "list_areas",
+    "list_goals",
+)
+
+# Tool definitions, built once and returned as-is on every tools/list request
+_TOOLS = [
+    Tool(
+        name="create_project",
+        description="Create a new project file with YAML frontmatter and structured markdown template",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Project title (will be converted to kebab-case for filename)"
+                },
+                "area": {
+                    "type": "string",
+                    "description": "Area of focus (must match configured areas, case-insensitive)"
+                },
+                "type": {
+                    "type": "string",
+                    "enum": ["standard", "coordination", "habit"],
+                    "description": "Project type determining the template structure"
+                },
+                "folder": {
+                    "type": "string",
+                    "enum": ["active", "incubator"],
+                    "description": "Target folder (active projects include 'started' date)"
+                },
+                "due": _DUE_PROP
+            },
+            "required": ["title", "area", "type", "folder"]
+        }
+    ),
+    Tool(
+        name="list_active_projects",
+        description="List all active projects grouped by area of focus with due dates and type indicators",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="complete_project",
+        description="Complete an active project by moving it to the completed folder after validating all 0k work is done",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="list_projects",
+        description="List projects with flexible filtering and grouping options. Returns JSON with project metadata including title, area, type, folder, due date, completed date, started date, created date, and filename.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "folder": {
+                    "type": "string",
+                    "enum": ["active", "incubator", "completed", "all"],
+                    "description": "Which folder(s) to list projects from (default: active)"
+                },
+                "group_by": {
+                    "type": "string",
+                    "enum": ["area", "due_date", "flat"],
+                    "description": "How to group projects: 'area' groups by area of focus, 'due_date' groups by urgency (Overdue/This Week/Later/No Due Date), 'flat' returns all projects in one group sorted by title (default: area)"
+                },
+                "filter_area": _FILTER_AREA_PROP,
+                "filter_has_due": {
+                    "type": "boolean",
+                    "description": "Optional: filter to show only projects with due dates (true) or without due dates (false)"
+                },
+                "completed_date_preset": {
+                    "type": "string",
+                    "enum": ["last_week", "last_month", "week_to_date", "month_to_date", "quarter_to_date", "year_to_date"],
+                    "description": "Optional: filter completed projects by preset date range (week starts Sunday)"
+                },
+                "filter_completed_start": {
+                    "type": "string",
+                    "pattern": _DATE_PATTERN,
+                    "description": "Optional: custom start date for completed projects filter (YYYY-MM-DD), requires filter_completed_end"
+                },
+                "filter_completed_end": {
+                    "type": "string",
+                    "pattern": _DATE_PATTERN,
+                    "description": "Optional: custom end date for completed projects filter (YYYY-MM-DD), requires filter_completed_start"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_actions",
+        description="List next actions with flexible filtering and grouping options. Returns JSON with action metadata including text, date, context, project, due date, defer date, and state.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_by": {
+                    "type": "string",
+                    "enum": ["project", "context", "flat"],
+                    "description": "How to group actions: 'project' groups by project folder (active/incubator), then project, then state (next/waiting/deferred/incubating); 'context' groups by context (@macbook, @phone, @waiting, etc.); 'flat' returns ungrouped list (default: project)"
+                },
+                "include_states": _INCLUDE_STATES_PROP,
+                "filter_project": _FILTER_PROJECT_PROP,
+                "filter_context": _FILTER_CONTEXT_PROP
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="activate_project",
+        description="Move a project from incubator to active folder. Adds 'started' date to project YAML. No validation for existing actions required - you activate first, then add actions.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="move_project_to_incubator",
+        description="Move a project from active to incubator folder. Removes 'started' date from project YAML. Validates that project has NO incomplete 0k actions (next, waiting, deferred, or incubating) - all actions must be complete or removed first.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="descope_project",
+        description="Move a project to descoped folder (archives project as out-of-scope). Adds 'descoped' date and removes 'started' date. Validates that project has NO incomplete 0k actions - all actions must be complete or removed first. Creates descoped/{area}/ folder if needed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="update_project_due_date",
+        description="Update or remove a project's due date in YAML frontmatter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP,
+                "due_date": {
+                    "type": "string",
+                    "description": "ISO date string (YYYY-MM-DD) or null to remove due date",
+                    "pattern": _DATE_PATTERN
+                }
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="update_project_area",
+        description="Update a project's area of focus. Moves the project file to the new area's folder and updates YAML frontmatter. Area must match configured areas (case-insensitive).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP,
+                "new_area": {
+                    "type": "string",
+                    "description": "New area name (must match configured areas, case-insensitive)"
+                }
+            },
+            "required": ["title", "new_area"]
+        }
+    ),
+    Tool(
+        name="update_project_type",
+        description="Update a project's type in YAML frontmatter. Types: standard (regular project), habit (recurring practice), coordination (multi-stakeholder coordination).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": _TITLE_PROP,
+                "project_type": {
+                    "type": "string",
+                    "enum": ["standard", "habit", "coordination"],
+                    "description": "New project type"
+                }
+            },
+            "required": ["title", "project_type"]
+        }
+    ),
+    Tool(
+        name="update_review_dates",
+        description="Bulk update 'last_reviewed' dates for projects and/or action lists. Useful during weekly review to mark items as reviewed. Supports flexible filtering by folder, area, or specific names.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "target_type": {
+                    "type": "string",
+                    "enum": ["projects", "actions", "all"],
+                    "description": "What to update: 'projects' (project files), 'actions' (action list files), or 'all' (both) (default: projects)"
+                },
+                "filter_folder": {
+                    "type": "string",
+                    "enum": ["active", "incubator", "all"],
+                    "description": "For projects: which folder(s) to update (default: all folders)"
+                },
+                "filter_area": {
+                    "type": "string",
+                    "description": "For projects: update only projects in specific area (case-insensitive)"
+                },
+                "filter_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific project titles or action list names to update (e.g., ['Project Name'] or ['@macbook', '@waiting'])"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="audit_projects",
+        description="Validate all project files for data quality issues. Checks: required fields (area, title, last_reviewed), valid areas (match configured areas), valid types (standard/habit/coordination), valid date formats (YYYY-MM-DD). Returns JSON with list of validation issues.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="audit_orphan_projects",
+        description="Find projects without any associated next actions. Only checks standard projects (excludes habit and coordination types). Returns JSON with list of orphan projects including file path.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="audit_orphan_actions",
+        description="Find next actions that reference non-existent projects or use invalid contexts. Validates: project tags (+project) exist as project files, context tags (@context) match existing context files. Returns JSON with list of orphan actions.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="audit_action_files",
+        description="Validate all action list files (next.md, @waiting.md, etc.) for data quality issues. Checks: required YAML fields (title, last_reviewed). Returns JSON with list of validation issues.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="list_projects_needing_review",
+        description="Find projects that haven't been reviewed recently. A project needs review if 'last_reviewed' is >= threshold days ago (inclusive) or missing. Default threshold: 7 days. Returns JSON with projects grouped by area.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "days_threshold": _DAYS_THRESHOLD_PROP
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_actions_needing_review",
+        description="Find action list files (@macbook.md, @waiting.md, etc.) that haven't been reviewed recently. An action file needs review if 'last_reviewed' is >= threshold days ago (inclusive) or missing. Default threshold: 7 days. Returns JSON with action files needing review.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "days_threshold": _DAYS_THRESHOLD_PROP
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="search_projects",
+        description="Search for projects by text in title or content. Case-insensitive search. Returns JSON with matching projects including title, area, folder, filename, match location (title/content), and snippet showing match context.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Text to search for (case-insensitive)"
+                },
+                "folder": {
+                    "type": "string",
+                    "enum": ["active", "incubator", "completed", "all"],
+                    "description": "Which folder(s) to search (default: all)"
+                },
+                "filter_area": _FILTER_AREA_PROP
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="search_actions",
+        description="Search for actions by text in action content. Case-insensitive search. Returns JSON with matching actions including action text, state, context, project tag, file, and full line.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Text to search for (case-insensitive)"
+                },
+                "include_states": _INCLUDE_STATES_PROP,
+                "filter_project": _FILTER_PROJECT_PROP,
+                "filter_context": _FILTER_CONTEXT_PROP
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="list_areas",
+        description="List all configured areas of focus from config. Returns JSON with area names and kebab-case identifiers.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="add_action",
+        description="Add a next action to a context list file. Validates that project exists if +project tag is provided. Action is added to top of context file with creation date.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Action text (without @context or +project tags)"
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Context tag (e.g., '@macbook', '@phone', '@home')"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Optional project filename in kebab-case (e.g., 'ml-refresh'). Will be validated against existing projects."
+                },
+                "due": _DUE_PROP,
+                "defer": _DEFER_PROP,
+                "action_date": _ACTION_DATE_PROP
+            },
+            "required": ["text", "context"]
+        }
+    ),
+    Tool(
+        name="add_to_waiting",
+        description="Add an item to the @waiting.md list. Use for things waiting on others or external events. Requires a project to be specified.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Action text (without @waiting tag)"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Project filename in kebab-case (required)"
+                },
+                "due": _DUE_PROP,
+                "defer": _DEFER_PROP,
+                "action_date": _ACTION_DATE_PROP
+            },
+            "required": ["text", "project"]
+        }
+    ),
+    Tool(
+        name="add_to_deferred",
+        description="Add an item to the @deferred.md list. Use for actions that cannot be done now but will be actionable at a specific future date. Requires a project to be specified.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Action text (without @deferred tag)"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Project filename in kebab-case (required)"
+                },
+                "defer": {
+                    "type": "string",
+                    "description": "Defer date in ISO format YYYY-MM-DD - when this becomes actionable",
+                    "pattern": _DATE_PATTERN
+                },
+                "action_date": _ACTION_DATE_PROP
+            },
+            "required": ["text", "project"]
+        }
+    ),
+    Tool(
+        name="add_to_incubating",
+        description="Add an item to the @incubating.md list. Use for ideas that might become projects or actions but need more thought.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Action or idea text (without @incubating tag)"
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Optional project filename in kebab-case"
+                },
+                "action_date": _ACTION_DATE_PROP
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="complete_action",
+        description="Complete an action by line number. Marks action as complete, moves to completed.md, removes from source file.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Relative path to action file (e.g., 'contexts/@macbook.md' or '@waiting.md')"
+                },
+                "line_number": {
+                    "type": "integer",
+                    "description": "Line number of action to complete (1-indexed as shown in editors)"
+                },
+                "completion_date": {
+                    "type": "string",
+                    "description": "Optional completion date in ISO format YYYY-MM-DD (defaults to today)",
+                    "pattern": _DATE_PATTERN
+                }
+            },
+            "required": ["file_path", "line_number"]
+        }
+    ),
+    Tool(
+        name="list_goals",
+        description="List all goals (30k level) grouped by folder. Only returns files with type: goal in YAML frontmatter. Returns JSON with active and incubator goals.",
+        inputSchema=_NO_ARGS_SCHEMA
+    ),
+    Tool(
+        name="bulk",
+        description="Run several read-only tools in one request. Calls run concurrently. Returns JSON list of {name, result} in call order, where result is the text the tool would have returned on its own.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "enum": list(_READ_ONLY_TOOLS),
+                                "description": "Read-only tool name"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool (default: none)"
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+]
+
+# Tool name -> handler, used by call_tool for dispatch
+_HANDLERS = {
+    "create_project": create_project_handler,
+    "list_active_projects": list_active_projects_handler,
+    "list_projects": list_projects_handler,
+    "list_actions": list_actions_handler,
+    "complete_project": complete_project_handler,
+    "activate_project": activate_project_handler,
+    "move_project_to_incubator": move_project_to_incubator_handler,
+    "descope_project": descope_project_handler,
+    "update_project_due_date": update_project_due_date_handler,
+    "update_project_area": update_project_area_handler,
+    "update_project_type": update_project_type_handler,
+    "update_review_dates": update_review_dates_handler,
+    "audit_projects": audit_projects_handler,
+    "audit_orphan_projects": audit_orphan_projects_handler,
+    "audit_orphan_actions": audit_orphan_actions_handler,
+    "audit_action_files": audit_action_files_handler,
+    "list_projects_needing_review": list_projects_needing_review_handler,
+    "list_actions_needing_review": list_actions_needing_review_handler,
+    "search_projects": search_projects_handler,
+    "search_actions": search_actions_handler,
+    "list_areas": list_areas_handler,
+    "add_action": add_action_handler,
+    "add_to_waiting": add_to_waiting_handler,
+    "add_to_deferred": add_to_deferred_handler,
+    "add_to_incubating": add_to_incubating_handler,
+    "complete_action": complete_action_handler,
+    "list_goals": list_goals_handler,
+}
+
+
+# Tools whose results are JSON, so errors are reported as {"error": ...}
+_JSON_TOOLS = frozenset({
+    "list_projects",
+    "list_actions",
+    "audit_projects",
+    "audit_orphan_projects",
+    "audit_orphan_actions",
+    "audit_action_files",
+    "list_projects_needing_review",
+    "list_actions_needing_review",
+    "search_projects",
+    "search_actions",
+    "list_areas",
+    "list_goals",
+})
+
+
+# Held while a tool that writes to the execution system runs. Write handlers
+# read, modify and rewrite whole files through shared service objects, so two
+# of them running at once on worker threads could lose an update.
+_write_lock = threading.Lock()
+
+
+def _call_handler(name: str, arguments: dict, config_path: str | None) -> str:
+    """
+    Call a registered tool handler, serializing tools that write.
 
+    Args:
+        name: Registered tool name
+        arguments: Tool parameters
+        config_path: Path to config file
+
+    Returns:
+        Handler's text result
+    """
+    handler = _HANDLERS[name]
+    if name in _READ_ONLY_TOOLS:
+        return handler(arguments, config_path)
+    with _write_lock:
+        return handler(arguments, config_path)
+
+
+async def _run_handler(name: str, arguments: dict, config_path: str | None) -> str:
+    """
+    Run a registered tool handler in a worker thread.
+
+    Handlers do blocking filesystem work, so they run off the event loop to
+    keep it free to service the stdio streams. Read-only tools run
+    concurrently; tools that write run one at a time. Exceptions raised by a
+    handler are reported as error text (JSON for JSON tools).
+
+    Args:
+        name: Registered tool name
+        arguments: Tool parameters
+        config_path: Path to config file
+
+    Returns:
+        Handler's text result
+    """
+    try:
+        return await asyncio.to_thread(_call_handler, name, arguments, config_path)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        if name in _JSON_TOOLS:
+            return _dumps({"error": str(e)})
+        return f"Error: {str(e)}"
+
+
+async def _run_bulk(arguments: dict, config_path: str | None) -> str:
+    """
+    Run several read-only tool calls concurrently.
+
+    Args:
+        arguments: Tool parameters ({"calls": [{"name", "arguments"?}, ...]})
+        config_path: Path to config file
+
+    Returns:
+        JSON list of {"name", "result"} in call order
+    """
+    calls = arguments.get("calls")
+    if not isinstance(calls, list):
+        return _dumps({"error": "Missing required parameter (calls)"})
+    calls = [call if isinstance(call, dict) else {} for call in calls]
+
+    async def run_call(call: dict) -> str:
+        call_name = call.get("name")
+        if call_name not in _READ_ONLY_TOOLS:
+            return f"Error: Tool '{call_name}' is not allowed in bulk (read-only tools only)"
+        return await _run_handler(call_name, call.get("arguments") or {}, config_path)
+
+    results = await asyncio.gather(*(run_call(call) for call in calls))
+    return _dumps([{"name": call.get("name"), "result": result} for call, result in zip(calls, results)])
+
+
+async def _dispatch(name: str, arguments: dict, config_path: str | None) -> list[TextContent]:
+    """
+    Run a tool and wrap its result for MCP.
+
+    Args:
+        name: Tool name
+        arguments: Tool parameters
+        config_path: Path to config file
+
+    Returns:
+        Single-item list with the tool's text result
+
+    Raises:
+        ValueError: If the tool name is unknown
+    """
+    if name == "bulk":
+        result = await _run_bulk(arguments, config_path)
+    elif name in _HANDLERS:
+        result = await _run_handler(name, arguments, config_path)
+    else:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return [TextContent(type="text", text=result)]
 
 
 async def main():
@@ -809,638 +1515,20 @@ async def main():
     server = Server("execution-system-mcp")
 
     # Get config path from environment or use default
-    config_path = os.environ.get("EXECUTION_SYSTEM_MCP_CONFIG")
-    if not config_path:
-        config_path = str(Path.home() / ".config" / "execution-system-mcp" / "config.json")
+    config_path = (
+        os.environ.get("EXECUTION_SYSTEM_MCP_CONFIG")
+        or os.path.expanduser("~/.config/execution-system-mcp/config.json")
+    )
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available tools."""
-        return [
-            Tool(
-                name="create_project",
-                description="Create a new project file with YAML frontmatter and structured markdown template",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (will be converted to kebab-case for filename)"
-                        },
-                        "area": {
-                            "type": "string",
-                            "description": "Area of focus (must match configured areas, case-insensitive)"
-                        },
-                        "type": {
-                            "type": "string",
-                            "enum": ["standard", "coordination", "habit"],
-                            "description": "Project type determining the template structure"
-                        },
-                        "folder": {
-                            "type": "string",
-                            "enum": ["active", "incubator"],
-                            "description": "Target folder (active projects include 'started' date)"
-                        },
-                        "due": {
-                            "type": "string",
-                            "description": "Optional due date in ISO format YYYY-MM-DD",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["title", "area", "type", "folder"]
-                }
-            ),
-            Tool(
-                name="list_active_projects",
-                description="List all active projects grouped by area of focus with due dates and type indicators",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="complete_project",
-                description="Complete an active project by moving it to the completed folder after validating all 0k work is done",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        }
-                    },
-                    "required": ["title"]
-                }
-            ),
-            Tool(
-                name="list_projects",
-                description="List projects with flexible filtering and grouping options. Returns JSON with project metadata including title, area, type, folder, due date, completed date, started date, created date, and filename.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "folder": {
-                            "type": "string",
-                            "enum": ["active", "incubator", "completed", "all"],
-                            "description": "Which folder(s) to list projects from (default: active)"
-                        },
-                        "group_by": {
-                            "type": "string",
-                            "enum": ["area", "due_date", "flat"],
-                            "description": "How to group projects: 'area' groups by area of focus, 'due_date' groups by urgency (Overdue/This Week/Later/No Due Date), 'flat' returns all projects in one group sorted by title (default: area)"
-                        },
-                        "filter_area": {
-                            "type": "string",
-                            "description": "Optional: filter to show only projects from a specific area (case-insensitive)"
-                        },
-                        "filter_has_due": {
-                            "type": "boolean",
-                            "description": "Optional: filter to show only projects with due dates (true) or without due dates (false)"
-                        },
-                        "completed_date_preset": {
-                            "type": "string",
-                            "enum": ["last_week", "last_month", "week_to_date", "month_to_date", "quarter_to_date", "year_to_date"],
-                            "description": "Optional: filter completed projects by preset date range (week starts Sunday)"
-                        },
-                        "filter_completed_start": {
-                            "type": "string",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$",
-                            "description": "Optional: custom start date for completed projects filter (YYYY-MM-DD), requires filter_completed_end"
-                        },
-                        "filter_completed_end": {
-                            "type": "string",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$",
-                            "description": "Optional: custom end date for completed projects filter (YYYY-MM-DD), requires filter_completed_start"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="list_actions",
-                description="List next actions with flexible filtering and grouping options. Returns JSON with action metadata including text, date, context, project, due date, defer date, and state.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "group_by": {
-                            "type": "string",
-                            "enum": ["project", "context", "flat"],
-                            "description": "How to group actions: 'project' groups by project folder (active/incubator), then project, then state (next/waiting/deferred/incubating); 'context' groups by context (@macbook, @phone, @waiting, etc.); 'flat' returns ungrouped list (default: project)"
-                        },
-                        "include_states": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                                "enum": ["next", "waiting", "deferred", "incubating"]
-                            },
-                            "description": "Which action states to include (default: all states)"
-                        },
-                        "filter_project": {
-                            "type": "string",
-                            "description": "Optional: filter to show only actions for a specific project (use kebab-case filename)"
-                        },
-                        "filter_context": {
-                            "type": "string",
-                            "description": "Optional: filter to show only actions for a specific context (e.g., '@macbook', '@phone')"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="activate_project",
-                description="Move a project from incubator to active folder. Adds 'started' date to project YAML. No validation for existing actions required - you activate first, then add actions.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        }
-                    },
-                    "required": ["title"]
-                }
-            ),
-            Tool(
-                name="move_project_to_incubator",
-                description="Move a project from active to incubator folder. Removes 'started' date from project YAML. Validates that project has NO incomplete 0k actions (next, waiting, deferred, or incubating) - all actions must be complete or removed first.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        }
-                    },
-                    "required": ["title"]
-                }
-            ),
-            Tool(
-                name="descope_project",
-                description="Move a project to descoped folder (archives project as out-of-scope). Adds 'descoped' date and removes 'started' date. Validates that project has NO incomplete 0k actions - all actions must be complete or removed first. Creates descoped/{area}/ folder if needed.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        }
-                    },
-                    "required": ["title"]
-                }
-            ),
-            Tool(
-                name="update_project_due_date",
-                description="Update or remove a project's due date in YAML frontmatter.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        },
-                        "due_date": {
-                            "type": "string",
-                            "description": "ISO date string (YYYY-MM-DD) or null to remove due date",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["title"]
-                }
-            ),
-            Tool(
-                name="update_project_area",
-                description="Update a project's area of focus. Moves the project file to the new area's folder and updates YAML frontmatter. Area must match configured areas (case-insensitive).",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        },
-                        "new_area": {
-                            "type": "string",
-                            "description": "New area name (must match configured areas, case-insensitive)"
-                        }
-                    },
-                    "required": ["title", "new_area"]
-                }
-            ),
-            Tool(
-                name="update_project_type",
-                description="Update a project's type in YAML frontmatter. Types: standard (regular project), habit (recurring practice), coordination (multi-stakeholder coordination).",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Project title (exact match, case-sensitive)"
-                        },
-                        "project_type": {
-                            "type": "string",
-                            "enum": ["standard", "habit", "coordination"],
-                            "description": "New project type"
-                        }
-                    },
-                    "required": ["title", "project_type"]
-                }
-            ),
-            Tool(
-                name="update_review_dates",
-                description="Bulk update 'last_reviewed' dates for projects and/or action lists. Useful during weekly review to mark items as reviewed. Supports flexible filtering by folder, area, or specific names.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "target_type": {
-                            "type": "string",
-                            "enum": ["projects", "actions", "all"],
-                            "description": "What to update: 'projects' (project files), 'actions' (action list files), or 'all' (both) (default: projects)"
-                        },
-                        "filter_folder": {
-                            "type": "string",
-                            "enum": ["active", "incubator", "all"],
-                            "description": "For projects: which folder(s) to update (default: all folders)"
-                        },
-                        "filter_area": {
-                            "type": "string",
-                            "description": "For projects: update only projects in specific area (case-insensitive)"
-                        },
-                        "filter_names": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Specific project titles or action list names to update (e.g., ['Project Name'] or ['@macbook', '@waiting'])"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="audit_projects",
-                description="Validate all project files for data quality issues. Checks: required fields (area, title, last_reviewed), valid areas (match configured areas), valid types (standard/habit/coordination), valid date formats (YYYY-MM-DD). Returns JSON with list of validation issues.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="audit_orphan_projects",
-                description="Find projects without any associated next actions. Only checks standard projects (excludes habit and coordination types). Returns JSON with list of orphan projects including file path.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="audit_orphan_actions",
-                description="Find next actions that reference non-existent projects or use invalid contexts. Validates: project tags (+project) exist as project files, context tags (@context) match existing context files. Returns JSON with list of orphan actions.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="audit_action_files",
-                description="Validate all action list files (next.md, @waiting.md, etc.) for data quality issues. Checks: required YAML fields (title, last_reviewed). Returns JSON with list of validation issues.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="list_projects_needing_review",
-                description="Find projects that haven't been reviewed recently. A project needs review if 'last_reviewed' is >= threshold days ago (inclusive) or missing. Default threshold: 7 days. Returns JSON with projects grouped by area.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "days_threshold": {
-                            "type": "integer",
-                            "description": "Number of days since last review (inclusive) to flag for review (default: 7)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="list_actions_needing_review",
-                description="Find action list files (@macbook.md, @waiting.md, etc.) that haven't been reviewed recently. An action file needs review if 'last_reviewed' is >= threshold days ago (inclusive) or missing. Default threshold: 7 days. Returns JSON with action files needing review.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "days_threshold": {
-                            "type": "integer",
-                            "description": "Number of days since last review (inclusive) to flag for review (default: 7)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="search_projects",
-                description="Search for projects by text in title or content. Case-insensitive search. Returns JSON with matching projects including title, area, folder, filename, match location (title/content), and snippet showing match context.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Text to search for (case-insensitive)"
-                        },
-                        "folder": {
-                            "type": "string",
-                            "enum": ["active", "incubator", "completed", "all"],
-                            "description": "Which folder(s) to search (default: all)"
-                        },
-                        "filter_area": {
-                            "type": "string",
-                            "description": "Optional: filter to show only projects from a specific area (case-insensitive)"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            ),
-            Tool(
-                name="search_actions",
-                description="Search for actions by text in action content. Case-insensitive search. Returns JSON with matching actions including action text, state, context, project tag, file, and full line.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Text to search for (case-insensitive)"
-                        },
-                        "include_states": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                                "enum": ["next", "waiting", "deferred", "incubating"]
-                            },
-                            "description": "Which action states to include (default: all states)"
-                        },
-                        "filter_project": {
-                            "type": "string",
-                            "description": "Optional: filter to show only actions for a specific project (use kebab-case filename)"
-                        },
-                        "filter_context": {
-                            "type": "string",
-                            "description": "Optional: filter to show only actions for a specific context (e.g., '@macbook', '@phone')"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            ),
-            Tool(
-                name="list_areas",
-                description="List all configured areas of focus from config. Returns JSON with area names and kebab-case identifiers.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="add_action",
-                description="Add a next action to a context list file. Validates that project exists if +project tag is provided. Action is added to top of context file with creation date.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Action text (without @context or +project tags)"
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Context tag (e.g., '@macbook', '@phone', '@home')"
-                        },
-                        "project": {
-                            "type": "string",
-                            "description": "Optional project filename in kebab-case (e.g., 'ml-refresh'). Will be validated against existing projects."
-                        },
-                        "due": {
-                            "type": "string",
-                            "description": "Optional due date in ISO format YYYY-MM-DD",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        },
-                        "defer": {
-                            "type": "string",
-                            "description": "Optional defer date in ISO format YYYY-MM-DD",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        },
-                        "action_date": {
-                            "type": "string",
-                            "description": "Optional creation date in ISO format YYYY-MM-DD (defaults to today)",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["text", "context"]
-                }
-            ),
-            Tool(
-                name="add_to_waiting",
-                description="Add an item to the @waiting.md list. Use for things waiting on others or external events. Requires a project to be specified.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Action text (without @waiting tag)"
-                        },
-                        "project": {
-                            "type": "string",
-                            "description": "Project filename in kebab-case (required)"
-                        },
-                        "due": {
-                            "type": "string",
-                            "description": "Optional due date in ISO format YYYY-MM-DD",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        },
-                        "defer": {
-                            "type": "string",
-                            "description": "Optional defer date in ISO format YYYY-MM-DD",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        },
-                        "action_date": {
-                            "type": "string",
-                            "description": "Optional creation date in ISO format YYYY-MM-DD (defaults to today)",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["text", "project"]
-                }
-            ),
-            Tool(
-                name="add_to_deferred",
-                description="Add an item to the @deferred.md list. Use for actions that cannot be done now but will be actionable at a specific future date. Requires a project to be specified.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Action text (without @deferred tag)"
-                        },
-                        "project": {
-                            "type": "string",
-                            "description": "Project filename in kebab-case (required)"
-                        },
-                        "defer": {
-                            "type": "string",
-                            "description": "Defer date in ISO format YYYY-MM-DD - when this becomes actionable",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        },
-                        "action_date": {
-                            "type": "string",
-                            "description": "Optional creation date in ISO format YYYY-MM-DD (defaults to today)",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["text", "project"]
-                }
-            ),
-            Tool(
-                name="add_to_incubating",
-                description="Add an item to the @incubating.md list. Use for ideas that might become projects or actions but need more thought.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Action or idea text (without @incubating tag)"
-                        },
-                        "project": {
-                            "type": "string",
-                            "description": "Optional project filename in kebab-case"
-                        },
-                        "action_date": {
-                            "type": "string",
-                            "description": "Optional creation date in ISO format YYYY-MM-DD (defaults to today)",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["text"]
-                }
-            ),
-            Tool(
-                name="complete_action",
-                description="Complete an action by line number. Marks action as complete, moves to completed.md, removes from source file.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Relative path to action file (e.g., 'contexts/@macbook.md' or '@waiting.md')"
-                        },
-                        "line_number": {
-                            "type": "integer",
-                            "description": "Line number of action to complete (1-indexed as shown in editors)"
-                        },
-                        "completion_date": {
-                            "type": "string",
-                            "description": "Optional completion date in ISO format YYYY-MM-DD (defaults to today)",
-                            "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                        }
-                    },
-                    "required": ["file_path", "line_number"]
-                }
-            ),
-            Tool(
-                name="list_goals",
-                description="List all goals (30k level) grouped by folder. Only returns files with type: goal in YAML frontmatter. Returns JSON with active and incubator goals.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            )
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         """Handle tool calls."""
-        if name == "create_project":
-            result = create_project_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_active_projects":
-            result = list_active_projects_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_projects":
-            result = list_projects_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_actions":
-            result = list_actions_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "complete_project":
-            result = complete_project_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "activate_project":
-            result = activate_project_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "move_project_to_incubator":
-            result = move_project_to_incubator_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "descope_project":
-            result = descope_project_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "update_project_due_date":
-            result = update_project_due_date_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "update_project_area":
-            result = update_project_area_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "update_project_type":
-            result = update_project_type_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "update_review_dates":
-            result = update_review_dates_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "audit_projects":
-            result = audit_projects_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "audit_orphan_projects":
-            result = audit_orphan_projects_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "audit_orphan_actions":
-            result = audit_orphan_actions_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "audit_action_files":
-            result = audit_action_files_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_projects_needing_review":
-            result = list_projects_needing_review_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_actions_needing_review":
-            result = list_actions_needing_review_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "search_projects":
-            result = search_projects_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "search_actions":
-            result = search_actions_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_areas":
-            result = list_areas_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "add_action":
-            result = add_action_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "add_to_waiting":
-            result = add_to_waiting_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "add_to_deferred":
-            result = add_to_deferred_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "add_to_incubating":
-            result = add_to_incubating_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "complete_action":
-            result = complete_action_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        elif name == "list_goals":
-            result = list_goals_handler(arguments, config_path)
-            return [TextContent(type="text", text=result)]
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        return await _dispatch(name, arguments, config_path)
 
     # Run server
     async with stdio_server() as (read_stream, write_stream):
@@ -1448,5 +1536,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
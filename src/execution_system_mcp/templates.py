@@ -1,21 +1,7 @@
 """Template generation for projects."""
 
-
-class TemplateEngine:
-    """Generates markdown templates for different project types."""
-
-    @staticmethod
-    def generate_standard(title: str) -> str:
-        """
-        Generate standard project template.
-
-        Args:
-            title: Project title
-
-        Returns:
-            Markdown template string
-        """
-        return f"""# {title}
+# Templates use literal {title} / {status} placeholders filled with str.replace
+_STANDARD_TPL = """# {title}
 
 ## 1. PURPOSE - Why This Matters
 
@@ -30,21 +16,7 @@ class TemplateEngine:
 *Capture ideas, notes, and considerations here*
 """
 
-    @staticmethod
-    def generate_habit(title: str, folder: str) -> str:
-        """
-        Generate habit project template.
-
-        Args:
-            title: Project title
-            folder: Target folder (active or incubator)
-
-        Returns:
-            Markdown template string
-        """
-        status = "Active" if folder == "active" else "Incubating"
-
-        return f"""# {title}
+_HABIT_TPL = """# {title}
 
 **Status:** {status}
 
@@ -65,18 +37,7 @@ class TemplateEngine:
 (See context lists for active next actions)
 """
 
-    @staticmethod
-    def generate_coordination(title: str) -> str:
-        """
-        Generate coordination project template.
-
-        Args:
-            title: Project title
-
-        Returns:
-            Markdown template string
-        """
-        return f"""# {title}
+_COORDINATION_TPL = """# {title}
 
 ## 1. PURPOSE - Why This Matters
 
@@ -103,6 +64,53 @@ class TemplateEngine:
 - *Brainstorm ideas here*
 """
 
+
+class TemplateEngine:
+    """Generates markdown templates for different project types."""
+
+    @staticmethod
+    def generate_standard(title: str) -> str:
+        """
+        Generate standard project template.
+
+        Args:
+            title: Project title
+
+        Returns:
+            Markdown template string
+        """
+        return _STANDARD_TPL.replace("{title}", title)
+
+    @staticmethod
+    def generate_habit(title: str, folder: str) -> str:
+        """
+        Generate habit project template.
+
+        Args:
+            title: Project title
+            folder: Target folder (active or incubator)
+
+        Returns:
+            Markdown template string
+        """
+        status = "Active" if folder == "active" else "Incubating"
+
+        # Fill status first so a title containing "{status}" is left intact
+        return _HABIT_TPL.replace("{status}", status).replace("{title}", title)
+
+    @staticmethod
+    def generate_coordination(title: str) -> str:
+        """
+        Generate coordination project template.
+
+        Args:
+            title: Project title
+
+        Returns:
+            Markdown template string
+        """
+        return _COORDINATION_TPL.replace("{title}", title)
+
     @staticmethod
     def generate(project_type: str, title: str, folder: str) -> str:
         """
@@ -116,11 +124,15 @@ class TemplateEngine:
         Returns:
             Markdown template string
         """
-        if project_type == "standard":
-            return TemplateEngine.generate_standard(title)
-        elif project_type == "habit":
-            return TemplateEngine.generate_habit(title, folder)
-        elif project_type == "coordination":
-            return TemplateEngine.generate_coordination(title)
-        else:
+        generator = _GENERATORS.get(project_type)
+        if generator is None:
             raise ValueError(f"Unknown project type: {project_type}")
+        return generator(title, folder)
+
+
+# Project type -> generator taking (title, folder)
+_GENERATORS = {
+    "standard": lambda title, folder: TemplateEngine.generate_standard(title),
+    "habit": TemplateEngine.generate_habit,
+    "coordination": lambda title, folder: TemplateEngine.generate_coordination(title),
+}
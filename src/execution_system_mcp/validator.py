@@ -1,15 +1,39 @@
 """Validation logic for project creation."""
 
-import re
-from datetime import datetime
-from pathlib import Path
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
 from execution_system_mcp.config import ConfigManager
 
+# Filesystem timestamps can be as coarse as 2s (FAT); a directory modified
+# this close to when it was indexed may hide a later change with equal mtime
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Projects live in <folder>/<area>/; the duplicate index does not descend
+# further than this many levels below a folder, so stray deep trees (a .git
+# or node_modules copied into the projects directory) are not walked
+_MAX_INDEX_DEPTH = 3
+
 
 class ProjectValidator:
     """Validates project creation parameters."""
 
+    __slots__ = (
+        "_config",
+        "_folder_root_seps",
+        "_index_dirs",
+        "_index_lock",
+        "_project_index",
+        "_projects_base",
+        "_valid_areas_str",
+    )
+
+    # Project folders searched for duplicates, in search order
+    _FOLDERS = ("active", "incubator", "completed", "descoped")
+
     def __init__(self, config: ConfigManager) -> None:
         """
         Initialize validator with configuration.
@@ -18,6 +42,20 @@ class ProjectValidator:
             config: ConfigManager instance with loaded configuration
         """
         self._config = config
+        self._projects_base = os.path.join(
+            config.get_repo_path(), "docs", "execution_system", "10k-projects"
+        )
+        # Separator count of a folder root such as .../10k-projects/active
+        self._folder_root_seps = os.path.abspath(self._projects_base).count(os.sep) + 1
+        # Comma-separated area names for error messages; built on first invalid area
+        self._valid_areas_str: str | None = None
+        # Project filename (without .md) -> folder; built on first duplicate check
+        self._project_index: dict[str, str] | None = None
+        # Directory -> (folder, st_mtime_ns or None if missing, racy,
+        # project filenames, subdirectory paths) as last listed
+        self._index_dirs: dict[str, tuple[str, int | None, bool, list[str], list[str]]] = {}
+        # Guards the index; handlers run on worker threads
+        self._index_lock = threading.Lock()
 
     def validate_area(self, area: str) -> tuple[bool, str | None]:
         """
@@ -37,17 +75,220 @@ class ProjectValidator:
         if area_kebab is not None:
             return (True, None)
 
-        # Build error message with list of valid areas
-        valid_areas = [area_dict["name"] for area_dict in self._config.get_areas()]
-        valid_areas_str = ", ".join(valid_areas)
-        error_msg = f"Invalid area '{area}'. Valid areas: {valid_areas_str}"
+        if self._valid_areas_str is None:
+            self._valid_areas_str = ", ".join(area_dict["name"] for area_dict in self._config.get_areas())
+
+        error_msg = f"Invalid area '{area}'. Valid areas: {self._valid_areas_str}"
 
         return (False, error_msg)
 
+    @staticmethod
+    def _dir_mtime(directory: str) -> int | None:
+        """Get a directory's st_mtime_ns, or None if it does not exist."""
+        try:
+            return os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _list_dir(self, directory: str) -> tuple[int | None, bool, list[str], list[str]]:
+        """
+        List one directory for the project index.
+
+        Args:
+            directory: Absolute directory path
+
+        Returns:
+            Tuple of (st_mtime_ns or None if missing, racy, project filenames
+            without .md, subdirectory paths). A directory is racy when it was
+            modified so close to being listed that a further change could
+            leave its mtime unchanged. Subdirectories are left out at the
+            depth limit.
+        """
+        descend = directory.count(os.sep) - self._folder_root_seps < _MAX_INDEX_DEPTH
+        listed_ns = time.time_ns()
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return (None, False, [], [])
+
+        filenames = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if descend:
+                            subdirectories.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        filenames.append(entry.name[:-3])
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+        return (mtime, mtime >= listed_ns - _RACY_MTIME_WINDOW_NS, filenames, subdirectories)
+
+    def _scan_tree(self, directory: str, folder: str) -> dict[str, tuple]:
+        """
+        List every directory in a tree.
+
+        Args:
+            directory: Absolute path of the tree root
+            folder: Project folder the tree belongs to
+
+        Returns:
+            Dict of directory -> index entry, as stored in _index_dirs
+        """
+        listings = {}
+        stack = [directory]
+
+        while stack:
+            current = stack.pop()
+            listing = self._list_dir(current)
+            listings[current] = (folder, *listing)
+            stack.extend(listing[3])
+
+        return listings
+
+    def _scan_folder(self, folder: str) -> dict[str, tuple]:
+        """Walk one project folder (e.g. "active")."""
+        return self._scan_tree(os.path.abspath(os.path.join(self._projects_base, folder)), folder)
+
+    def _drop_tree(self, directory: str) -> None:
+        """Remove a directory and everything indexed below it."""
+        stack = [directory]
+        while stack:
+            listing = self._index_dirs.pop(stack.pop(), None)
+            if listing is not None:
+                stack.extend(listing[4])
+
+    def _rebuild_lookup(self) -> None:
+        """Derive the filename -> folder index from the directory listings."""
+        index: dict[str, str] = {}
+        for folder in self._FOLDERS:
+            for dir_folder, _, _, filenames, _ in self._index_dirs.values():
+                if dir_folder == folder:
+                    for filename in filenames:
+                        # Earlier folders win, as in the folder search order
+                        index.setdefault(filename, folder)
+        self._project_index = index
+
+    def _build_index(self) -> None:
+        """Index every project filename across all folders."""
+        index_dirs = {}
+
+        # Folders are independent trees, so their directory reads can overlap
+        # (mostly a win on cold or network filesystems)
+        with ThreadPoolExecutor(max_workers=len(self._FOLDERS)) as executor:
+            for listings in executor.map(self._scan_folder, self._FOLDERS):
+                index_dirs.update(listings)
+
+        self._index_dirs = index_dirs
+        self._rebuild_lookup()
+
+    def _refresh_index(self) -> None:
+        """
+        Re-list the indexed directories that changed on disk.
+
+        Adding, removing or renaming an entry updates its directory's mtime,
+        so stat-ing the indexed directories catches projects created, moved
+        or deleted outside this validator. Only changed and racy directories
+        are listed again; new subdirectories are walked and removed ones are
+        dropped with everything below them.
+        """
+        changed = [
+            directory
+            for directory, (_, mtime, racy, _, _) in self._index_dirs.items()
+            if racy or self._dir_mtime(directory) != mtime
+        ]
+        if not changed:
+            return
+
+        for directory in changed:
+            old = self._index_dirs.get(directory)
+            if old is None:
+                # Dropped along with a removed parent
+                continue
+
+            folder, _, _, _, old_subdirectories = old
+            listing = self._list_dir(directory)
+            self._index_dirs[directory] = (folder, *listing)
+
+            subdirectories = listing[3]
+            for subdirectory in set(subdirectories).difference(old_subdirectories):
+                self._index_dirs.update(self._scan_tree(subdirectory, folder))
+            for subdirectory in set(old_subdirectories).difference(subdirectories):
+                self._drop_tree(subdirectory)
+
+        self._rebuild_lookup()
+
+    def invalidate(self) -> None:
+        """Drop the project index so the next duplicate check rebuilds it."""
+        with self._index_lock:
+            self._project_index = None
+            self._index_dirs = {}
+
+    def add(self, filename: str, folder: str, file_path: str) -> None:
+        """
+        Record a project created through this server in the index.
+
+        Re-lists the new file's directory and records any directories
+        created for it, so the change is not mistaken for an outside edit.
+        Anything else that changed in the re-listed directories, such as a
+        subdirectory created outside this server, is indexed as well, since
+        the new listings hide it from the next refresh.
+
+        Args:
+            filename: Project filename (without .md extension)
+            folder: Folder the project was created in
+            file_path: Path of the created project file
+        """
+        with self._index_lock:
+            if self._project_index is None:
+                return
+
+            self._project_index.setdefault(filename, folder)
+
+            outside_changes = False
+            child = None
+            directory = os.path.dirname(os.path.abspath(file_path))
+            while True:
+                old = self._index_dirs.get(directory)
+                dir_folder, old_filenames, old_subdirectories = (
+                    (old[0], old[3], old[4]) if old is not None else (folder, [], [])
+                )
+                listing = self._list_dir(directory)
+                self._index_dirs[directory] = (dir_folder, *listing)
+
+                filenames, subdirectories = listing[2], listing[3]
+                if set(filenames).symmetric_difference(old_filenames).difference((filename,)):
+                    outside_changes = True
+                # The child on the way up was just listed; other new
+                # subdirectories were created outside this server
+                for subdirectory in set(subdirectories).difference(old_subdirectories, (child,)):
+                    self._index_dirs.update(self._scan_tree(subdirectory, dir_folder))
+                    outside_changes = True
+                for subdirectory in set(old_subdirectories).difference(subdirectories):
+                    self._drop_tree(subdirectory)
+                    outside_changes = True
+
+                if old is not None:
+                    # Parent of an already indexed directory is unchanged
+                    break
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                child = directory
+                directory = parent
+
+            if outside_changes:
+                self._rebuild_lookup()
+
     def check_duplicates(self, filename: str) -> tuple[bool, str | None]:
         """
         Check for duplicate project filename across all folders.
 
+        Uses an in-memory index of project filenames, updated from the
+        directories that changed on disk since the last check.
+
         Args:
             filename: Project filename (without .md extension)
 
@@ -56,23 +297,16 @@ class ProjectValidator:
             - If duplicate found: (True, folder_name where duplicate exists)
             - If no duplicate: (False, None)
         """
-        # TODO: Future optimization - maintain an in-memory index of existing projects
-        # instead of scanning filesystem on each creation
-
-        repo_path = Path(self._config.get_repo_path())
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-
-        # Check all four folders for duplicates
-        for folder in ["active", "incubator", "completed", "descoped"]:
-            folder_path = projects_base / folder
-            if not folder_path.exists():
-                continue
-
-            # Recursively search for the filename in this folder and its subdirectories
-            for project_file in folder_path.rglob(f"{filename}.md"):
-                return (True, folder)
+        with self._index_lock:
+            if self._project_index is None:
+                self._build_index()
+            else:
+                self._refresh_index()
+            folder = self._project_index.get(filename)
 
-        return (False, None)
+        if folder is None:
+            return (False, None)
+        return (True, folder)
 
     def validate_due_date(self, due: str) -> tuple[bool, str | None]:
         """
@@ -89,13 +323,22 @@ class ProjectValidator:
         if not due:
             return (False, "Due date cannot be empty")
 
-        # Check format matches YYYY-MM-DD
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', due):
+        # Check format matches YYYY-MM-DD; fromisoformat alone would also
+        # accept other ISO forms such as 20251231
+        if not (
+            len(due) == 10
+            and due.isascii()
+            and due[4] == "-"
+            and due[7] == "-"
+            and due[:4].isdigit()
+            and due[5:7].isdigit()
+            and due[8:].isdigit()
+        ):
             return (False, f"Invalid due date format. Expected YYYY-MM-DD, got '{due}'")
 
         # Validate it's an actual valid date
         try:
-            datetime.strptime(due, "%Y-%m-%d")
+            date.fromisoformat(due)
             return (True, None)
         except ValueError:
             return (False, f"Invalid date values in '{due}'. Must be a valid calendar date")
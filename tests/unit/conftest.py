@@ -0,0 +1,149 @@
+"""Shared fixtures for unit tests."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from execution_system_mcp.action_lister import ActionLister
+from execution_system_mcp.action_manager import ActionManager
+from execution_system_mcp.auditor import Auditor
+from execution_system_mcp.config import ConfigManager
+
+# Every project the action tests reference; ActionManager only checks they exist
+_ACTION_PROJECTS = ("test-project", "state-project")
+_PROJECT_STUB = b"---\narea: Health\n---\n"
+
+# Repository-relative path segments, joined once per fixture with joinpath()
+_ACTIONS_SEGMENTS = ("docs", "execution_system", "00k-next-actions")
+_PROJECTS_SEGMENTS = ("docs", "execution_system", "10k-projects")
+_ACTIVE_HEALTH_SEGMENTS = (*_PROJECTS_SEGMENTS, "active", "health")
+
+
+@pytest.fixture
+def make_lister(tmp_path):
+    """
+    Build an ActionLister for a repository at tmp_path / "repo".
+
+    Returns a factory taking the configured areas as (name, kebab) pairs,
+    defaulting to Career only.
+    """
+    def _make_lister(areas=(("Career", "career"),)):
+        config = ConfigManager.from_dict({
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": name, "kebab": kebab} for name, kebab in areas],
+        })
+        return ActionLister(config)
+
+    return _make_lister
+
+
+@pytest.fixture
+def write_files(tmp_path):
+    """
+    Write a tree of files under tmp_path in one call.
+
+    Returns a function taking {relative path: content}. Parent directories
+    are created once each, and content is written as UTF-8 bytes straight
+    to the file descriptor, without a buffered file object.
+    """
+    created = set()
+
+    def _write_files(tree: dict[str, str | bytes]) -> None:
+        for relative_path, content in tree.items():
+            path = tmp_path / relative_path
+            if path.parent not in created:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(path.parent)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content if isinstance(content, bytes) else content.encode("utf-8"))
+            finally:
+                os.close(fd)
+
+    return _write_files
+
+
+@pytest.fixture
+def action_repo(tmp_path):
+    """
+    Build an execution system repository and ActionManager for action tests.
+
+    Creates the next-actions contexts directory under tmp_path / "repo" and
+    an active/health stub for each project the action tests reference, with
+    Health as the only configured area. Tests write just the action files
+    they need.
+
+    Returns a namespace with actions_dir, contexts_dir and manager.
+    """
+    repo_path = tmp_path / "repo"
+    actions_dir = repo_path.joinpath(*_ACTIONS_SEGMENTS)
+    contexts_dir = actions_dir / "contexts"
+    contexts_dir.mkdir(parents=True)
+    health_dir = repo_path.joinpath(*_ACTIVE_HEALTH_SEGMENTS)
+    health_dir.mkdir(parents=True)
+    for project in _ACTION_PROJECTS:
+        (health_dir / f"{project}.md").write_bytes(_PROJECT_STUB)
+
+    config = ConfigManager.from_dict({
+        "execution_system_repo_path": str(repo_path),
+        "areas": [{"name": "Health", "kebab": "health"}],
+    })
+
+    return SimpleNamespace(
+        actions_dir=actions_dir,
+        contexts_dir=contexts_dir,
+        manager=ActionManager(config),
+    )
+
+
+def _build_audit_repo(repo_path):
+    """
+    Create an empty execution system repository at repo_path and its Auditor.
+
+    Returns a namespace with projects_dir (active/health), contexts_dir and
+    auditor, with Health as the only configured area.
+    """
+    projects_dir = repo_path.joinpath(*_ACTIVE_HEALTH_SEGMENTS)
+    contexts_dir = repo_path.joinpath(*_ACTIONS_SEGMENTS, "contexts")
+    projects_dir.mkdir(parents=True)
+    contexts_dir.mkdir(parents=True)
+
+    config = ConfigManager.from_dict({
+        "execution_system_repo_path": str(repo_path),
+        "areas": [{"name": "Health", "kebab": "health"}],
+    })
+
+    return SimpleNamespace(
+        projects_dir=projects_dir,
+        contexts_dir=contexts_dir,
+        auditor=Auditor(config),
+    )
+
+
+@pytest.fixture
+def audit_repo(tmp_path):
+    """
+    Build an empty execution system repository and Auditor for audit tests.
+
+    Creates the active/health project area and the next-actions contexts
+    directory under tmp_path / "repo", with Health as the only configured
+    area. Tests write just the project and action files they need.
+
+    Returns a namespace with projects_dir (active/health), contexts_dir and
+    auditor. The auditor reads nothing until it is queried, so tests can
+    write their files after taking it.
+    """
+    return _build_audit_repo(tmp_path / "repo")
+
+
+@pytest.fixture(scope="class")
+def class_audit_repo(tmp_path_factory):
+    """
+    Build one audit repository shared by every test in a class.
+
+    Same layout and namespace as audit_repo. For classes whose tests only
+    read: the class writes all its files once and each test asserts on its
+    own files, so no test may depend on the repo holding only its files.
+    """
+    return _build_audit_repo(tmp_path_factory.mktemp("audit") / "repo")
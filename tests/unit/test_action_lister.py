@@ -1,12 +1,10 @@
 """Tests for ActionLister."""
 
-import json
-from pathlib import Path
-
-import pytest
-
 from execution_system_mcp.action_lister import ActionLister
-from execution_system_mcp.config import ConfigManager
+
+# Repository-relative roots for write_files, matching make_lister's repo
+_ACTIONS = "repo/docs/execution_system/00k-next-actions"
+_PROJECTS = "repo/docs/execution_system/10k-projects"
 
 
 class TestActionListerParseAction:
@@ -95,7 +93,7 @@ class TestActionListerParseAction:
 class TestActionListerListActions:
     """Test ActionLister.list_actions() with JSON output and flexible filtering."""
 
-    def test_list_actions_grouped_by_project_default(self, tmp_path):
+    def test_list_actions_grouped_by_project_default(self, make_lister, write_files):
         """
         Test listing actions grouped by project (default behavior).
 
@@ -104,67 +102,43 @@ class TestActionListerListActions:
         Then: Returns JSON grouped by project folder, then project, then state
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        # Create macbook context with actions
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Research ML resources @macbook +ml-refresh
 - [ ] 2025-10-30 Complete homework @macbook +dbt-skills
-""")
-
-        # Create waiting file
-        (actions_base / "@waiting.md").write_text("""---
+""",
+            f"{_ACTIONS}/@waiting.md": """---
 title: Waiting For
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-29 Recruiter to respond @waiting +job-search
-""")
-
-        # Set up projects
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "career"
-        active_dir.mkdir(parents=True)
-        (active_dir / "ml-refresh.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/ml-refresh.md": """---
 area: Career
 title: ML Refresh
 type: standard
 ---
-""")
-        (active_dir / "job-search.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/job-search.md": """---
 area: Career
 title: Job Search
 type: standard
 ---
-""")
-
-        incubator_dir = projects_base / "incubator" / "health"
-        incubator_dir.mkdir(parents=True)
-        (incubator_dir / "dbt-skills.md").write_text("""---
+""",
+            f"{_PROJECTS}/incubator/health/dbt-skills.md": """---
 area: Health
 title: DBT Skills
 type: standard
 ---
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [
-                {"name": "Career", "kebab": "career"},
-                {"name": "Health", "kebab": "health"},
-            ],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+""",
+        })
+
+        lister = make_lister(areas=[("Career", "career"), ("Health", "health")])
 
         # When
         result = lister.list_actions()
@@ -184,7 +158,7 @@ type: standard
         assert len(ml_project["states"][0]["actions"]) == 1
         assert ml_project["states"][0]["actions"][0]["text"] == "Research ML resources"
 
-    def test_list_actions_grouped_by_context(self, tmp_path):
+    def test_list_actions_grouped_by_context(self, make_lister, write_files):
         """
         Test listing actions grouped by context.
 
@@ -193,36 +167,25 @@ type: standard
         Then: Returns JSON grouped by context
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Research ML @macbook +ml-refresh
 - [ ] 2025-10-30 Complete homework @macbook +dbt-skills
-""")
-
-        (contexts_dir / "@phone.md").write_text("""---
+""",
+            f"{_ACTIONS}/contexts/@phone.md": """---
 title: Phone
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Call recruiter @phone +job-search
-""")
+""",
+        })
 
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+        lister = make_lister()
 
         # When
         result = lister.list_actions(group_by="context")
@@ -237,7 +200,7 @@ last_reviewed: 2025-10-22
         phone_group = next(g for g in result["groups"] if g["group_name"] == "@phone")
         assert len(phone_group["actions"]) == 1
 
-    def test_filter_by_project(self, tmp_path):
+    def test_filter_by_project(self, make_lister, write_files):
         """
         Test filtering actions by specific project.
 
@@ -246,39 +209,24 @@ last_reviewed: 2025-10-22
         Then: Returns only actions for that project
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Research ML @macbook +ml-refresh
 - [ ] 2025-10-30 Complete homework @macbook +dbt-skills
-""")
-
-        # Set up project
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "career"
-        active_dir.mkdir(parents=True)
-        (active_dir / "ml-refresh.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/ml-refresh.md": """---
 area: Career
 title: ML Refresh
 type: standard
 ---
-""")
+""",
+        })
 
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+        lister = make_lister()
 
         # When
         result = lister.list_actions(filter_project="ml-refresh")
@@ -289,7 +237,7 @@ type: standard
         assert active_group["projects"][0]["project_filename"] == "ml-refresh"
         assert len(active_group["projects"][0]["states"][0]["actions"]) == 1
 
-    def test_filter_by_context(self, tmp_path):
+    def test_filter_by_context(self, make_lister, write_files):
         """
         Test filtering actions by specific context.
 
@@ -298,46 +246,30 @@ type: standard
         Then: Returns only actions for that context
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Research ML @macbook +ml-refresh
-""")
-
-        (contexts_dir / "@phone.md").write_text("""---
+""",
+            f"{_ACTIONS}/contexts/@phone.md": """---
 title: Phone
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Call recruiter @phone +job-search
-""")
-
-        # Set up projects
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "career"
-        active_dir.mkdir(parents=True)
-        (active_dir / "job-search.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/job-search.md": """---
 area: Career
 title: Job Search
 type: standard
 ---
-""")
+""",
+        })
 
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+        lister = make_lister()
 
         # When
         result = lister.list_actions(filter_context="@phone", group_by="context")
@@ -347,7 +279,7 @@ type: standard
         assert result["groups"][0]["group_name"] == "@phone"
         assert len(result["groups"][0]["actions"]) == 1
 
-    def test_flat_grouping(self, tmp_path):
+    def test_flat_grouping(self, make_lister, write_files):
         """
         Test flat grouping returns simple list.
 
@@ -356,28 +288,18 @@ type: standard
         Then: Returns single group with all actions
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Task A @macbook +project-a
 - [ ] 2025-10-30 Task B @macbook +project-b
-""")
+""",
+        })
 
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+        lister = make_lister()
 
         # When
         result = lister.list_actions(group_by="flat")
@@ -387,7 +309,7 @@ last_reviewed: 2025-10-22
         assert result["groups"][0]["group_name"] == "All Actions"
         assert len(result["groups"][0]["actions"]) == 2
 
-    def test_include_all_states_by_default(self, tmp_path):
+    def test_include_all_states_by_default(self, make_lister, write_files):
         """
         Test that all action states are included by default.
 
@@ -396,62 +318,44 @@ last_reviewed: 2025-10-22
         Then: Returns actions from all states
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Next action @macbook +project-a
-""")
-
-        (actions_base / "@waiting.md").write_text("""---
+""",
+            f"{_ACTIONS}/@waiting.md": """---
 title: Waiting
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Waiting action @waiting +project-a
-""")
-
-        (actions_base / "@deferred.md").write_text("""---
+""",
+            f"{_ACTIONS}/@deferred.md": """---
 title: Deferred
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Deferred action @deferred +project-a defer:2025-11-01
-""")
-
-        (actions_base / "@incubating.md").write_text("""---
+""",
+            f"{_ACTIONS}/@incubating.md": """---
 title: Incubating
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Incubating action @incubating +project-a
-""")
-
-        # Set up project
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "career"
-        active_dir.mkdir(parents=True)
-        (active_dir / "project-a.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/project-a.md": """---
 area: Career
 title: Project A
 type: standard
 ---
-""")
+""",
+        })
 
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+        lister = make_lister()
 
         # When
         result = lister.list_actions()
@@ -461,7 +365,7 @@ type: standard
         state_names = {s["state"] for s in project["states"]}
         assert state_names == {"next", "waiting", "deferred", "incubating"}
 
-    def test_filter_by_states(self, tmp_path):
+    def test_filter_by_states(self, make_lister, write_files):
         """
         Test filtering by specific action states.
 
@@ -470,54 +374,37 @@ type: standard
         Then: Returns only actions in those states
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
+        write_files({
+            f"{_ACTIONS}/contexts/@macbook.md": """---
 title: Macbook
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Next action @macbook +project-a
-""")
-
-        (actions_base / "@waiting.md").write_text("""---
+""",
+            f"{_ACTIONS}/@waiting.md": """---
 title: Waiting
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Waiting action @waiting +project-a
-""")
-
-        (actions_base / "@deferred.md").write_text("""---
+""",
+            f"{_ACTIONS}/@deferred.md": """---
 title: Deferred
 last_reviewed: 2025-10-22
 ---
 
 - [ ] 2025-10-30 Deferred action @deferred +project-a defer:2025-11-01
-""")
-
-        # Set up project
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "career"
-        active_dir.mkdir(parents=True)
-        (active_dir / "project-a.md").write_text("""---
+""",
+            f"{_PROJECTS}/active/career/project-a.md": """---
 area: Career
 title: Project A
 type: standard
 ---
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Career", "kebab": "career"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        lister = ActionLister(config)
+""",
+        })
+
+        lister = make_lister()
 
         # When
         result = lister.list_actions(include_states=["next", "waiting"])
@@ -1,19 +1,63 @@
 """Tests for ActionManager."""
 
-import json
+import functools
+import re
 from datetime import date
-from pathlib import Path
 
 import pytest
 
-from execution_system_mcp.action_manager import ActionManager
-from execution_system_mcp.config import ConfigManager
+# Date the manager stamps on new and completed actions; frozen by _frozen_today
+_TODAY = "2025-10-25"
+_EXPECTED_NEW_ACTION = f"- [ ] {_TODAY} New action to add @macbook +test-project\n".encode("utf-8")
+
+
+class _FrozenDate(date):
+    """date whose today() always returns _TODAY."""
+
+    @classmethod
+    def today(cls):
+        return cls.fromisoformat(_TODAY)
+
+
+@pytest.fixture(autouse=True)
+def _frozen_today(monkeypatch):
+    """Freeze the date ActionManager sees so expected lines can be constants."""
+    monkeypatch.setattr("execution_system_mcp.action_manager.date", _FrozenDate)
+
+
+@functools.lru_cache(maxsize=None)
+def _md_header(title: str, blank_lines: int = 1) -> bytes:
+    """Build an action list's YAML header, followed by blank_lines blank lines, as UTF-8 bytes."""
+    header = f"---\ntitle: {title}\nlast_reviewed: 2025-10-20\n---\n" + "\n" * blank_lines
+    return header.encode("utf-8")
+
+
+def _write_list(path, title: str, *actions: str, blank_lines: int = 1) -> None:
+    """Write an action list file with a standard header and the given action lines."""
+    body = "".join(f"{action}\n" for action in actions).encode("utf-8")
+    path.write_bytes(_md_header(title, blank_lines) + body)
+
+
+def _write_context(action_repo, context: str, title: str, *actions: str, blank_lines: int = 1):
+    """Write a context list into action_repo's contexts directory and return its path."""
+    path = action_repo.contexts_dir / f"{context}.md"
+    _write_list(path, title, *actions, blank_lines=blank_lines)
+    return path
+
+
+# Completed action line: "- [x] <completion date> <original action>"
+_COMPLETED_RE = re.compile(r"^- \[x\] (\d{4}-\d{2}-\d{2}) (.+)$", re.MULTILINE)
+
+
+def _completed_actions(content: str) -> dict[str, str]:
+    """Map each completed action (without its completion date) to that date, in one pass."""
+    return {action: completed_on for completed_on, action in _COMPLETED_RE.findall(content)}
 
 
 class TestActionManagerAddAction:
     """Test ActionManager add_action functionality."""
 
-    def test_adds_action_to_context_file(self, tmp_path):
+    def test_adds_action_to_context_file(self, action_repo):
         """
         Test adding action to context file.
 
@@ -22,37 +66,14 @@ class TestActionManagerAddAction:
         Then: Action is added to top of file with today's date
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-20 Existing action @macbook +existing-project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        # Create a dummy project so validation passes
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health"
-        projects_dir.mkdir(parents=True)
-        project_file = projects_dir / "test-project.md"
-        project_file.write_text("""---
-area: Health
-title: Test Project
----
-""")
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        macbook_file = _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-20 Existing action @macbook +existing-project",
+        )
+
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -63,17 +84,12 @@ title: Test Project
 
         # Then
         assert "✓ Successfully added action" in result
-        content = macbook_file.read_text()
-        lines = content.strip().split('\n')
+        content = macbook_file.read_bytes()
 
-        # Check action is added after YAML header
-        today = date.today().strftime("%Y-%m-%d")
-        expected_action = f"- [ ] {today} New action to add @macbook +test-project"
-        assert expected_action in content
-        # Should be added at top (after YAML)
-        assert lines[4] == expected_action
+        # Should be added at top, directly after the YAML header
+        assert content.startswith(_md_header("Macbook", blank_lines=0) + _EXPECTED_NEW_ACTION)
 
-    def test_adds_action_with_due_date(self, tmp_path):
+    def test_adds_action_with_due_date(self, action_repo):
         """
         Test adding action with due date.
 
@@ -82,26 +98,9 @@ title: Test Project
         Then: Action includes due:YYYY-MM-DD tag
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        macbook_file = _write_context(action_repo, "@macbook", "Macbook")
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -112,10 +111,10 @@ last_reviewed: 2025-10-20
 
         # Then
         assert "✓ Successfully added action" in result
-        content = macbook_file.read_text()
-        assert "due:2025-12-31" in content
+        content = macbook_file.read_bytes()
+        assert b"due:2025-12-31" in content
 
-    def test_adds_action_with_custom_date(self, tmp_path):
+    def test_adds_action_with_custom_date(self, action_repo):
         """
         Test adding action with custom creation date.
 
@@ -124,26 +123,9 @@ last_reviewed: 2025-10-20
         Then: Action uses provided date instead of today
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
+        macbook_file = _write_context(action_repo, "@macbook", "Macbook")
 
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -153,10 +135,11 @@ last_reviewed: 2025-10-20
         )
 
         # Then
-        content = macbook_file.read_text()
-        assert "- [ ] 2025-09-15 Action from past @macbook" in content
+        assert "✓ Successfully added action" in result
+        content = macbook_file.read_bytes()
+        assert b"- [ ] 2025-09-15 Action from past @macbook" in content
 
-    def test_validates_project_exists(self, tmp_path):
+    def test_validates_project_exists(self, action_repo):
         """
         Test project validation when adding action.
 
@@ -165,30 +148,9 @@ last_reviewed: 2025-10-20
         Then: Returns error about invalid project
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
+        _write_context(action_repo, "@macbook", "Macbook")
 
-""")
-
-        # Create projects dir but no project file
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active"
-        projects_dir.mkdir(parents=True)
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -201,7 +163,7 @@ last_reviewed: 2025-10-20
         assert "Error" in result
         assert "Project 'nonexistent-project' does not exist" in result
 
-    def test_returns_error_for_invalid_context(self, tmp_path):
+    def test_returns_error_for_invalid_context(self, action_repo):
         """
         Test error when context file doesn't exist.
 
@@ -210,15 +172,7 @@ last_reviewed: 2025-10-20
         Then: Returns error about missing context
         """
         # Given
-        repo_path = tmp_path / "repo"
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -231,7 +185,7 @@ last_reviewed: 2025-10-20
         assert "Context file" in result
         assert "@nonexistent.md" in result
 
-    def test_action_without_project_tag(self, tmp_path):
+    def test_action_without_project_tag(self, action_repo):
         """
         Test adding action without project tag.
 
@@ -240,26 +194,9 @@ last_reviewed: 2025-10-20
         Then: Action added successfully without +project tag
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        phone_file = contexts_dir / "@phone.md"
-        phone_file.write_text("""---
-title: Phone
-last_reviewed: 2025-10-20
----
+        phone_file = _write_context(action_repo, "@phone", "Phone")
 
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -269,11 +206,11 @@ last_reviewed: 2025-10-20
 
         # Then
         assert "✓ Successfully added action" in result
-        content = phone_file.read_text()
-        assert "Call dentist @phone" in content
-        assert "+" not in content  # No project tag
+        content = phone_file.read_bytes()
+        assert b"Call dentist @phone" in content
+        assert b"+" not in content  # No project tag
 
-    def test_no_blank_line_after_yaml(self, tmp_path):
+    def test_no_blank_line_after_yaml(self, action_repo):
         """
         Test that no blank line exists after YAML when adding action.
 
@@ -282,27 +219,14 @@ last_reviewed: 2025-10-20
         Then: New action is placed immediately after YAML, no blank lines
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-20 Existing action @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        macbook_file = _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-20 Existing action @macbook",
+        )
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -312,18 +236,16 @@ last_reviewed: 2025-10-20
 
         # Then
         assert "✓ Successfully added action" in result
-        content = macbook_file.read_text()
-        lines = content.split('\n')
+        lines = macbook_file.read_text().splitlines()
 
-        # Line 3 is closing ---
-        assert lines[3] == "---"
-        # Line 4 should be the new action, NO blank line
-        today = date.today().strftime("%Y-%m-%d")
-        assert lines[4] == f"- [ ] {today} New action @macbook"
-        # Line 5 should be the existing action
-        assert lines[5] == "- [ ] 2025-10-20 Existing action @macbook"
+        # Closing ---, then the new action with NO blank line, then the existing action
+        assert lines[3:6] == [
+            "---",
+            f"- [ ] {_TODAY} New action @macbook",
+            "- [ ] 2025-10-20 Existing action @macbook",
+        ]
 
-    def test_removes_blank_lines_after_yaml(self, tmp_path):
+    def test_removes_blank_lines_after_yaml(self, action_repo):
         """
         Test that blank lines after YAML are removed when adding action.
 
@@ -332,29 +254,16 @@ last_reviewed: 2025-10-20
         Then: All blank lines removed, action placed immediately after YAML
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
         # Two blank lines after YAML
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-
-- [ ] 2025-10-20 Existing action @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        macbook_file = _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-20 Existing action @macbook",
+            blank_lines=2,
+        )
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.add_action(
@@ -363,148 +272,90 @@ last_reviewed: 2025-10-20
         )
 
         # Then
-        content = macbook_file.read_text()
-        lines = content.split('\n')
+        assert "✓ Successfully added action" in result
+        lines = macbook_file.read_text().splitlines()
 
         # Verify no blank lines between YAML and first action
-        assert lines[3] == "---"
-        today = date.today().strftime("%Y-%m-%d")
-        assert lines[4] == f"- [ ] {today} New action @macbook"
-        assert lines[5] == "- [ ] 2025-10-20 Existing action @macbook"
-
-
-class TestActionManagerAddToWaiting:
-    """Test ActionManager add_to_waiting functionality."""
-
-    def test_adds_to_waiting_file(self, tmp_path):
-        """
-        Test adding item to @waiting file.
-
-        Given: @waiting.md exists
-        When: Adding item with add_to_waiting
-        Then: Item added to top of file with @waiting context
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        waiting_file = actions_dir / "@waiting.md"
-        waiting_file.write_text("""---
-title: Waiting For
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-20 Existing waiting item @waiting +existing-project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        # Create dummy project for validation
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health"
-        projects_dir.mkdir(parents=True)
-        (projects_dir / "receive-package.md").write_text("---\narea: Health\n---\n")
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
-
-        # When
-        result = manager.add_to_waiting(
-            text="Wait for package delivery",
-            project="receive-package"
-        )
-
-        # Then
-        assert "✓ Successfully added to @waiting.md" in result
-        content = waiting_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        expected = f"- [ ] {today} Wait for package delivery @waiting +receive-package"
-        assert expected in content
-
-    def test_adds_to_waiting_with_defer(self, tmp_path):
-        """
-        Test adding to waiting with defer date.
-
-        Given: @waiting.md exists
-        When: Adding item with defer date and project
-        Then: Item includes defer:YYYY-MM-DD tag
+        assert lines[3:6] == [
+            "---",
+            f"- [ ] {_TODAY} New action @macbook",
+            "- [ ] 2025-10-20 Existing action @macbook",
+        ]
+
+
+class TestActionManagerAddToStateFile:
+    """Test ActionManager add_to_waiting/add_to_deferred/add_to_incubating."""
+
+    @pytest.mark.parametrize(
+        "method_name, filename, title, extra_kwargs, expected_tags",
+        [
+            ("add_to_waiting", "@waiting.md", "Waiting For", {}, "@waiting +state-project"),
+            (
+                "add_to_waiting",
+                "@waiting.md",
+                "Waiting For",
+                {"defer": "2025-12-01"},
+                "@waiting +state-project defer:2025-12-01",
+            ),
+            (
+                "add_to_deferred",
+                "@deferred.md",
+                "Deferred",
+                {"defer": "2025-11-15"},
+                "@deferred +state-project defer:2025-11-15",
+            ),
+            ("add_to_incubating", "@incubating.md", "Incubating", {}, "@incubating +state-project"),
+        ],
+        ids=["waiting", "waiting-deferred", "deferred", "incubating"],
+    )
+    def test_adds_to_state_file(self, action_repo, method_name, filename, title, extra_kwargs, expected_tags):
+        """
+        Test adding item to a special state file.
+
+        Given: State file (@waiting.md, @deferred.md or @incubating.md) and a project exist
+        When: Adding item with the matching add_to_* method
+        Then: Item added with today's date, the state context, project tag and any defer tag
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        waiting_file = actions_dir / "@waiting.md"
-        waiting_file.write_text("""---
-title: Waiting For
-last_reviewed: 2025-10-20
----
+        state_file = action_repo.actions_dir / filename
+        _write_list(state_file, title)
 
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        # Create dummy project for validation
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health"
-        projects_dir.mkdir(parents=True)
-        (projects_dir / "shipment-project.md").write_text("---\narea: Health\n---\n")
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
-        result = manager.add_to_waiting(
-            text="Wait for delayed shipment",
-            project="shipment-project",
-            defer="2025-12-01"
+        result = getattr(manager, method_name)(
+            text="Item for later",
+            project="state-project",
+            **extra_kwargs
         )
 
         # Then
-        content = waiting_file.read_text()
-        assert "defer:2025-12-01" in content
-
-    def test_error_when_waiting_missing_project(self, tmp_path):
-        """
-        Test that adding to waiting without project returns error.
-
-        Given: @waiting.md exists
+        assert f"✓ Successfully added to {filename}" in result
+        content = state_file.read_text()
+        assert f"- [ ] {_TODAY} Item for later {expected_tags}" in content
+
+    @pytest.mark.parametrize(
+        "method_name, filename, title, extra_kwargs",
+        [
+            ("add_to_waiting", "@waiting.md", "Waiting For", {}),
+            ("add_to_deferred", "@deferred.md", "Deferred", {"defer": "2025-12-01"}),
+        ],
+        ids=["waiting", "deferred"],
+    )
+    def test_error_when_missing_project(self, action_repo, method_name, filename, title, extra_kwargs):
+        """
+        Test that adding to a state file that requires a project fails without one.
+
+        Given: @waiting.md or @deferred.md exists
         When: Adding item without project parameter
         Then: Returns error about missing project
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        waiting_file = actions_dir / "@waiting.md"
-        waiting_file.write_text("""---
-title: Waiting For
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        _write_list(action_repo.actions_dir / filename, title)
+        manager = action_repo.manager
 
         # When
-        result = manager.add_to_waiting(
-            text="Wait for something"
-        )
+        result = getattr(manager, method_name)(text="Item without project", **extra_kwargs)
 
         # Then
         assert "Error" in result
@@ -512,154 +363,10 @@ last_reviewed: 2025-10-20
         assert "required" in result.lower()
 
 
-class TestActionManagerAddToDeferred:
-    """Test ActionManager add_to_deferred functionality."""
-
-    def test_adds_to_deferred_file(self, tmp_path):
-        """
-        Test adding item to @deferred file.
-
-        Given: @deferred.md exists
-        When: Adding item with add_to_deferred
-        Then: Item added to top of file with @deferred context
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        deferred_file = actions_dir / "@deferred.md"
-        deferred_file.write_text("""---
-title: Deferred
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        # Create dummy project for validation
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health"
-        projects_dir.mkdir(parents=True)
-        (projects_dir / "future-project.md").write_text("---\narea: Health\n---\n")
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
-
-        # When
-        result = manager.add_to_deferred(
-            text="Action for later",
-            defer="2025-11-15",
-            project="future-project"
-        )
-
-        # Then
-        assert "✓ Successfully added to @deferred.md" in result
-        content = deferred_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        assert f"- [ ] {today} Action for later @deferred +future-project defer:2025-11-15" in content
-
-    def test_error_when_deferred_missing_project(self, tmp_path):
-        """
-        Test that adding to deferred without project returns error.
-
-        Given: @deferred.md exists
-        When: Adding item without project parameter
-        Then: Returns error about missing project
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        deferred_file = actions_dir / "@deferred.md"
-        deferred_file.write_text("""---
-title: Deferred
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
-
-        # When
-        result = manager.add_to_deferred(
-            text="Deferred action",
-            defer="2025-12-01"
-        )
-
-        # Then
-        assert "Error" in result
-        assert "project" in result.lower()
-        assert "required" in result.lower()
-
-
-class TestActionManagerAddToIncubating:
-    """Test ActionManager add_to_incubating functionality."""
-
-    def test_adds_to_incubating_file(self, tmp_path):
-        """
-        Test adding item to @incubating file.
-
-        Given: @incubating.md exists
-        When: Adding item with add_to_incubating
-        Then: Item added to top of file with @incubating context
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
-
-        incubating_file = actions_dir / "@incubating.md"
-        incubating_file.write_text("""---
-title: Incubating
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        # Create dummy project for validation
-        projects_dir = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health"
-        projects_dir.mkdir(parents=True)
-        (projects_dir / "experimental-idea.md").write_text("---\narea: Health\n---\n")
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
-
-        # When
-        result = manager.add_to_incubating(
-            text="Maybe someday explore this",
-            project="experimental-idea"
-        )
-
-        # Then
-        assert "✓ Successfully added to @incubating.md" in result
-        content = incubating_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        assert f"- [ ] {today} Maybe someday explore this @incubating +experimental-idea" in content
-
-
 class TestActionManagerCompleteAction:
     """Test ActionManager complete_action functionality."""
 
-    def test_completes_action_by_line_number(self, tmp_path):
+    def test_completes_action_by_line_number(self, action_repo):
         """
         Test completing action using line number.
 
@@ -668,38 +375,20 @@ class TestActionManagerCompleteAction:
         Then: Action marked complete, moved to completed.md, removed from source
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-20 First action @macbook +project-one
-- [ ] 2025-10-21 Second action @macbook +project-two
-- [ ] 2025-10-22 Third action @macbook +project-three
-""")
-
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        completed_file = actions_dir / "completed.md"
-        completed_file.write_text("""---
-title: Completed Actions
-last_reviewed: 2025-10-20
----
-
-""")
+        macbook_file = _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-20 First action @macbook +project-one",
+            "- [ ] 2025-10-21 Second action @macbook +project-two",
+            "- [ ] 2025-10-22 Third action @macbook +project-three",
+        )
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        actions_dir = action_repo.actions_dir
+        completed_file = actions_dir / "completed.md"
+        _write_list(completed_file, "Completed Actions")
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When - complete line 6 (second action)
         result = manager.complete_action(
@@ -710,18 +399,17 @@ last_reviewed: 2025-10-20
         # Then
         assert "✓ Successfully completed action" in result
 
-        # Source file should have action removed
-        source_content = macbook_file.read_text()
-        assert "Second action" not in source_content
-        assert "First action" in source_content
-        assert "Third action" in source_content
+        # Source file should have action removed; split once, then exact-line lookups
+        source_lines = set(macbook_file.read_bytes().splitlines())
+        assert b"- [ ] 2025-10-21 Second action @macbook +project-two" not in source_lines
+        assert b"- [ ] 2025-10-20 First action @macbook +project-one" in source_lines
+        assert b"- [ ] 2025-10-22 Third action @macbook +project-three" in source_lines
 
         # Completed file should have action with completion date
-        completed_content = completed_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        assert f"- [x] {today} 2025-10-21 Second action @macbook +project-two" in completed_content
+        completed = _completed_actions(completed_file.read_text())
+        assert completed["2025-10-21 Second action @macbook +project-two"] == _TODAY
 
-    def test_complete_preserves_due_and_defer_dates(self, tmp_path):
+    def test_complete_preserves_due_and_defer_dates(self, action_repo):
         """
         Test that completing action preserves due: and defer: tags.
 
@@ -730,36 +418,18 @@ last_reviewed: 2025-10-20
         Then: Tags are preserved in completed.md
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-15 Action with dates @macbook +project due:2025-11-01 defer:2025-10-20
-""")
+        _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-15 Action with dates @macbook +project due:2025-11-01 defer:2025-10-20",
+        )
 
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
+        actions_dir = action_repo.actions_dir
         completed_file = actions_dir / "completed.md"
-        completed_file.write_text("""---
-title: Completed Actions
-last_reviewed: 2025-10-20
----
-
-""")
+        _write_list(completed_file, "Completed Actions")
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
-
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.complete_action(
@@ -768,11 +438,11 @@ last_reviewed: 2025-10-20
         )
 
         # Then
-        completed_content = completed_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        assert f"- [x] {today} 2025-10-15 Action with dates @macbook +project due:2025-11-01 defer:2025-10-20" in completed_content
+        assert "✓ Successfully completed action" in result
+        completed = _completed_actions(completed_file.read_text())
+        assert completed["2025-10-15 Action with dates @macbook +project due:2025-11-01 defer:2025-10-20"] == _TODAY
 
-    def test_complete_with_custom_completion_date(self, tmp_path):
+    def test_complete_with_custom_completion_date(self, action_repo):
         """
         Test completing action with custom completion date.
 
@@ -781,36 +451,18 @@ last_reviewed: 2025-10-20
         Then: Action uses provided completion date
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-15 Action to complete @macbook
-""")
+        _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-15 Action to complete @macbook",
+        )
 
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
+        actions_dir = action_repo.actions_dir
         completed_file = actions_dir / "completed.md"
-        completed_file.write_text("""---
-title: Completed Actions
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        _write_list(completed_file, "Completed Actions")
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.complete_action(
@@ -820,10 +472,11 @@ last_reviewed: 2025-10-20
         )
 
         # Then
-        completed_content = completed_file.read_text()
-        assert "- [x] 2025-10-25 2025-10-15 Action to complete @macbook" in completed_content
+        assert "✓ Successfully completed action" in result
+        completed = _completed_actions(completed_file.read_text())
+        assert completed["2025-10-15 Action to complete @macbook"] == "2025-10-25"
 
-    def test_complete_action_from_waiting_list(self, tmp_path):
+    def test_complete_action_from_waiting_list(self, action_repo):
         """
         Test completing action from @waiting list.
 
@@ -832,35 +485,19 @@ last_reviewed: 2025-10-20
         Then: Works correctly for special state files
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        actions_dir.mkdir(parents=True)
+        actions_dir = action_repo.actions_dir
 
         waiting_file = actions_dir / "@waiting.md"
-        waiting_file.write_text("""---
-title: Waiting For
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-18 Waiting for response @waiting +project-x
-""")
+        _write_list(
+            waiting_file,
+            "Waiting For",
+            "- [ ] 2025-10-18 Waiting for response @waiting +project-x",
+        )
 
         completed_file = actions_dir / "completed.md"
-        completed_file.write_text("""---
-title: Completed Actions
-last_reviewed: 2025-10-20
----
-
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        _write_list(completed_file, "Completed Actions")
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.complete_action(
@@ -870,11 +507,10 @@ last_reviewed: 2025-10-20
 
         # Then
         assert "✓ Successfully completed action" in result
-        completed_content = completed_file.read_text()
-        today = date.today().strftime("%Y-%m-%d")
-        assert f"- [x] {today} 2025-10-18 Waiting for response @waiting +project-x" in completed_content
+        completed = _completed_actions(completed_file.read_text())
+        assert completed["2025-10-18 Waiting for response @waiting +project-x"] == _TODAY
 
-    def test_error_on_invalid_line_number(self, tmp_path):
+    def test_error_on_invalid_line_number(self, action_repo):
         """
         Test error when line number doesn't contain an action.
 
@@ -883,27 +519,14 @@ last_reviewed: 2025-10-20
         Then: Returns error
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-
-- [ ] 2025-10-20 Action @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-20 Action @macbook",
+        )
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When - try to complete line 1 (YAML header)
         result = manager.complete_action(
@@ -915,7 +538,7 @@ last_reviewed: 2025-10-20
         assert "Error" in result
         assert "incomplete" in result.lower()
 
-    def test_complete_no_blank_line_in_completed_file(self, tmp_path):
+    def test_complete_no_blank_line_in_completed_file(self, action_repo):
         """
         Test that completing action doesn't add blank lines to completed.md.
 
@@ -924,37 +547,24 @@ last_reviewed: 2025-10-20
         Then: Completed action is placed immediately after YAML, no blank lines
         """
         # Given
-        repo_path = tmp_path / "repo"
-        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        macbook_file = contexts_dir / "@macbook.md"
-        macbook_file.write_text("""---
-title: Macbook
-last_reviewed: 2025-10-20
----
-- [ ] 2025-10-15 Action to complete @macbook
-""")
-
-        actions_dir = repo_path / "docs" / "execution_system" / "00k-next-actions"
+        _write_context(
+            action_repo,
+            "@macbook",
+            "Macbook",
+            "- [ ] 2025-10-15 Action to complete @macbook",
+            blank_lines=0,
+        )
+
+        actions_dir = action_repo.actions_dir
         completed_file = actions_dir / "completed.md"
         # completed.md has blank line after YAML
-        completed_file.write_text("""---
-title: Completed Actions
-last_reviewed: 2025-10-20
----
-
-- [x] 2025-10-19 Old completed action @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        _write_list(
+            completed_file,
+            "Completed Actions",
+            "- [x] 2025-10-19 Old completed action @macbook",
+        )
 
-        config = ConfigManager(str(config_file))
-        manager = ActionManager(config)
+        manager = action_repo.manager
 
         # When
         result = manager.complete_action(
@@ -964,11 +574,11 @@ last_reviewed: 2025-10-20
 
         # Then
         assert "✓ Successfully completed action" in result
-        content = completed_file.read_text()
-        lines = content.split('\n')
+        lines = completed_file.read_text().splitlines()
 
         # Verify no blank lines between YAML and first action
-        assert lines[3] == "---"
-        today = date.today().strftime("%Y-%m-%d")
-        assert lines[4] == f"- [x] {today} 2025-10-15 Action to complete @macbook"
-        assert lines[5] == "- [x] 2025-10-19 Old completed action @macbook"
+        assert lines[3:6] == [
+            "---",
+            f"- [x] {_TODAY} 2025-10-15 Action to complete @macbook",
+            "- [x] 2025-10-19 Old completed action @macbook",
+        ]
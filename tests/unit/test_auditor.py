@@ -1,58 +1,131 @@
 """Tests for Auditor (Phase 3 tools)."""
 
-import json
-from datetime import date, timedelta
-from pathlib import Path
+import os
+from datetime import date
 
 import pytest
 
 from execution_system_mcp.auditor import Auditor
-from execution_system_mcp.config import ConfigManager
+
+# Today's date as the auditor sees it; frozen by _frozen_today
+_TODAY = date(2025, 1, 20)
+
+
+class _FrozenDate(date):
+    """date whose today() always returns _TODAY."""
+
+    @classmethod
+    def today(cls):
+        return cls(_TODAY.year, _TODAY.month, _TODAY.day)
+
+
+@pytest.fixture(autouse=True)
+def _frozen_today(monkeypatch):
+    """Freeze the date Auditor sees so review dates can be literals."""
+    monkeypatch.setattr("execution_system_mcp.auditor.date", _FrozenDate)
+
+
+# Project types audit_projects() accepts; anything else is an invalid type
+_VALID_PROJECT_TYPES = ("standard", "habit", "coordination")
+_INVALID_PROJECT_TYPES = ("invalid_type", "Standard")
+
+
+def _markdown(body: str = "", **fields: str) -> bytes:
+    """Build markdown file bytes with the given frontmatter fields, in order, and an optional body."""
+    frontmatter = "".join(f"{key}: {value}\n" for key, value in fields.items())
+    return (f"---\n{frontmatter}---\n" + (f"\n{body}\n" if body else "")).encode()
+
+
+def _auditor_with(audit_repo, *, projects=(), contexts=()) -> Auditor:
+    """
+    Write project and context files into the audit repo and return its auditor.
+
+    Args:
+        audit_repo: Namespace from the audit_repo fixture
+        projects: (filename, markdown) pairs written to active/health
+        contexts: (filename, markdown) pairs written to the contexts directory
+
+    Returns:
+        The repo's Auditor
+    """
+    for filename, markdown in projects:
+        (audit_repo.projects_dir / filename).write_bytes(markdown)
+    for filename, markdown in contexts:
+        (audit_repo.contexts_dir / filename).write_bytes(markdown)
+    return audit_repo.auditor
+
+
+# Every project TestAuditorAuditProjects checks, audited together in one shared repo
+_AUDITED_PROJECTS = {
+    **{
+        f"{project_type}-project.md": _markdown(
+            area="Health",
+            title="Test Project",
+            type=project_type,
+            created="2025-01-01",
+            last_reviewed="2025-01-15",
+            body="# Test Project",
+        )
+        for project_type in _VALID_PROJECT_TYPES
+    },
+    "incomplete-project.md": _markdown(
+        area="Health",
+        type="standard",
+        created="2025-01-01",
+        body="# Project without title",
+    ),
+    "bad-area.md": _markdown(
+        area="InvalidArea",
+        title="Bad Area Project",
+        type="standard",
+        created="2025-01-01",
+        last_reviewed="2025-01-01",
+    ),
+    "bad-date.md": _markdown(
+        area="Health",
+        title="Bad Date Project",
+        type="standard",
+        created="01/15/2025",
+        last_reviewed="2025-01-01",
+    ),
+    **{
+        f"bad-type-{project_type}.md": _markdown(
+            area="Health",
+            title="Bad Type Project",
+            type=project_type,
+            created="2025-01-01",
+            last_reviewed="2025-01-01",
+        )
+        for project_type in _INVALID_PROJECT_TYPES
+    },
+}
+
+
+@pytest.fixture(scope="class")
+def issues_by_file(class_audit_repo):
+    """Audit all of _AUDITED_PROJECTS once per class and index the issues by filename."""
+    auditor = _auditor_with(class_audit_repo, projects=_AUDITED_PROJECTS.items())
+    return {os.path.basename(issue["file"]): issue for issue in auditor.audit_projects()["issues"]}
 
 
 class TestAuditorAuditProjects:
     """Test Auditor.audit_projects()."""
 
-    def test_valid_project_no_issues(self, tmp_path):
+    @pytest.mark.parametrize("project_type", _VALID_PROJECT_TYPES)
+    def test_valid_project_no_issues(self, issues_by_file, project_type):
         """
         Test project with all valid fields.
 
-        Given: Project with all required fields and valid values
+        Given: Project with all required fields and valid values, for each project type
         When: Calling audit_projects()
-        Then: Returns no issues
+        Then: Returns no issue for it
         """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "test-project.md").write_text("""---
-area: Health
-title: Test Project
-type: standard
-created: 2025-01-01
-last_reviewed: 2025-01-15
----
-# Test Project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_projects()
+        # Given / When: issues_by_file audits every project once
 
         # Then
-        assert len(result["issues"]) == 0
+        assert f"{project_type}-project.md" not in issues_by_file
 
-    def test_missing_required_fields(self, tmp_path):
+    def test_missing_required_fields(self, issues_by_file):
         """
         Test project missing required fields.
 
@@ -60,740 +133,328 @@ last_reviewed: 2025-01-15
         When: Calling audit_projects()
         Then: Returns issues for missing fields
         """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "incomplete-project.md").write_text("""---
-area: Health
-type: standard
-created: 2025-01-01
----
-# Project without title
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_projects()
+        # Given / When: issues_by_file audits every project once
+        issue = issues_by_file["incomplete-project.md"]
 
         # Then
-        assert len(result["issues"]) == 1
-        issue = result["issues"][0]
-        assert "incomplete-project.md" in issue["file"]
         assert "title" in issue["missing_fields"]
         assert "last_reviewed" in issue["missing_fields"]
 
-    def test_invalid_area(self, tmp_path):
+    @pytest.mark.parametrize(
+        "filename, field, value, reason",
+        [
+            pytest.param("bad-area.md", "area", "InvalidArea", "not in configured areas", id="area"),
+            pytest.param("bad-date.md", "created", "01/15/2025", "invalid date format", id="date_format"),
+        ],
+    )
+    def test_invalid_field(self, issues_by_file, filename, field, value, reason):
         """
-        Test project with invalid area.
+        Test project with an invalid field value.
 
-        Given: Project with area not in configured areas
+        Given: Project whose area or created date is invalid
         When: Calling audit_projects()
-        Then: Returns issue for invalid area
+        Then: Returns an issue naming the field, its value and the reason
         """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "bad-area.md").write_text("""---
-area: InvalidArea
-title: Bad Area Project
-type: standard
-created: 2025-01-01
-last_reviewed: 2025-01-01
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_projects()
+        # Given / When: issues_by_file audits every project once
+        issue = issues_by_file[filename]
 
         # Then
-        assert len(result["issues"]) == 1
-        issue = result["issues"][0]
-        invalid_field = next(f for f in issue["invalid_fields"] if f["field"] == "area")
-        assert invalid_field["value"] == "InvalidArea"
-        assert "not in configured areas" in invalid_field["reason"]
+        invalid_fields = {f["field"]: f for f in issue["invalid_fields"]}
+        assert invalid_fields[field]["value"] == value
+        assert reason in invalid_fields[field]["reason"]
 
-    def test_invalid_project_type(self, tmp_path):
+    @pytest.mark.parametrize("project_type", _INVALID_PROJECT_TYPES)
+    def test_invalid_project_type(self, issues_by_file, project_type):
         """
-        Test project with invalid type.
+        Test project with a type outside the valid set.
 
-        Given: Project with type not in [standard, habit, coordination]
+        Given: Project whose type is unknown or wrongly cased
         When: Calling audit_projects()
-        Then: Returns issue for invalid type
+        Then: Returns an issue for the type only, listing the valid types
         """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "bad-type.md").write_text("""---
-area: Health
-title: Bad Type Project
-type: invalid_type
-created: 2025-01-01
-last_reviewed: 2025-01-01
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_projects()
+        # Given / When: issues_by_file audits every project once
+        issue = issues_by_file[f"bad-type-{project_type}.md"]
 
         # Then
-        assert len(result["issues"]) == 1
-        issue = result["issues"][0]
-        invalid_field = next(f for f in issue["invalid_fields"] if f["field"] == "type")
-        assert invalid_field["value"] == "invalid_type"
-        assert "must be one of" in invalid_field["reason"]
-
-    def test_invalid_date_format(self, tmp_path):
-        """
-        Test project with invalid date format.
-
-        Given: Project with created date in wrong format
-        When: Calling audit_projects()
-        Then: Returns issue for invalid date
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "bad-date.md").write_text("""---
-area: Health
-title: Bad Date Project
-type: standard
-created: 01/15/2025
-last_reviewed: 2025-01-01
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_projects()
-
-        # Then
-        assert len(result["issues"]) == 1
-        issue = result["issues"][0]
-        invalid_field = next(f for f in issue["invalid_fields"] if f["field"] == "created")
-        assert "invalid date format" in invalid_field["reason"].lower()
+        assert issue["missing_fields"] == []
+        assert issue["invalid_fields"] == [{
+            "field": "type",
+            "value": project_type,
+            "reason": f"must be one of: {', '.join(_VALID_PROJECT_TYPES)}",
+        }]
 
 
 class TestAuditorAuditOrphanProjects:
     """Test Auditor.audit_orphan_projects()."""
 
-    def test_no_orphans_with_actions(self, tmp_path):
-        """
-        Test project with actions is not orphaned.
-
-        Given: Standard project with next action
+    @pytest.mark.parametrize(
+        "project_md, macbook_md, expected_orphans",
+        [
+            pytest.param(
+                _markdown(area="Health", title="Project With Actions", type="standard"),
+                _markdown(title="Macbook", body="- [ ] 2025-10-30 Do something @macbook +project"),
+                [],
+                id="standard_with_actions",
+            ),
+            pytest.param(
+                _markdown(area="Health", title="Orphan Project", type="standard"),
+                _markdown(title="Macbook"),
+                ["Orphan Project"],
+                id="standard_without_actions",
+            ),
+            pytest.param(
+                _markdown(area="Health", title="Habit Project", type="habit"),
+                None,
+                [],
+                id="habit_without_actions",
+            ),
+        ],
+    )
+    def test_orphan_projects(self, audit_repo, project_md, macbook_md, expected_orphans):
+        """
+        Test which active projects are reported as orphans.
+
+        Given: One project, and a @macbook context that may tag it with an action
         When: Calling audit_orphan_projects()
-        Then: Returns no orphans
+        Then: Only standard projects without actions are orphans; habits never are
         """
         # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "with-actions.md").write_text("""---
-area: Health
-title: Project With Actions
-type: standard
----
-""")
-
-        # Create action
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
----
-
-- [ ] 2025-10-30 Do something @macbook +with-actions
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(
+            audit_repo,
+            projects=[("project.md", project_md)],
+            contexts=[("@macbook.md", macbook_md)] if macbook_md is not None else (),
+        )
 
         # When
         result = auditor.audit_orphan_projects()
 
         # Then
-        assert len(result["orphan_projects"]) == 0
-
-    def test_orphan_standard_project(self, tmp_path):
-        """
-        Test standard project without actions is orphaned.
-
-        Given: Standard project with no actions
-        When: Calling audit_orphan_projects()
-        Then: Returns project as orphan
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "orphan.md").write_text("""---
-area: Health
-title: Orphan Project
-type: standard
----
-""")
-
-        # Empty actions directory
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-        (contexts_dir / "@macbook.md").write_text("---\ntitle: Macbook\n---\n")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_orphan_projects()
-
-        # Then
-        assert len(result["orphan_projects"]) == 1
-        assert result["orphan_projects"][0]["title"] == "Orphan Project"
-
-    def test_habits_not_orphaned(self, tmp_path):
-        """
-        Test habit projects are excluded from orphan check.
-
-        Given: Habit project with no actions
-        When: Calling audit_orphan_projects()
-        Then: Not reported as orphan
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "habit.md").write_text("""---
-area: Health
-title: Habit Project
-type: habit
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_orphan_projects()
-
-        # Then
-        assert len(result["orphan_projects"]) == 0
+        assert [p["title"] for p in result["orphan_projects"]] == expected_orphans
 
 
 class TestAuditorAuditOrphanActions:
     """Test Auditor.audit_orphan_actions()."""
 
-    def test_valid_actions_no_orphans(self, tmp_path):
-        """
-        Test actions with valid project tags.
-
-        Given: Actions with project tags that exist
-        When: Calling audit_orphan_actions()
-        Then: Returns no orphans
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "valid-project.md").write_text("""---
-area: Health
-title: Valid Project
-type: standard
----
-""")
-
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
----
-
-- [ ] 2025-10-30 Do something @macbook +valid-project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_orphan_actions()
-
-        # Then
-        assert len(result["orphan_actions"]) == 0
-        assert len(result["invalid_contexts"]) == 0
-
-    def test_orphan_action_invalid_project(self, tmp_path):
-        """
-        Test action with nonexistent project tag.
-
-        Given: Action with project tag that doesn't exist
+    @pytest.mark.parametrize(
+        "action, expected_orphan_tags, expected_invalid_contexts",
+        [
+            pytest.param(
+                "- [ ] 2025-10-30 Do something @macbook +valid-project",
+                [],
+                [],
+                id="valid",
+            ),
+            pytest.param(
+                "- [ ] 2025-10-30 Do something @macbook +nonexistent-project",
+                ["nonexistent-project"],
+                [],
+                id="nonexistent_project",
+            ),
+            pytest.param(
+                "- [ ] 2025-10-30 Do something @invalidcontext +valid-project",
+                [],
+                ["@invalidcontext"],
+                id="invalid_context",
+            ),
+        ],
+    )
+    def test_orphan_actions(self, audit_repo, action, expected_orphan_tags, expected_invalid_contexts):
+        """
+        Test actions with unknown project tags or contexts are reported.
+
+        Given: Project valid-project and a @macbook context holding one action
         When: Calling audit_orphan_actions()
-        Then: Returns orphan action
+        Then: Unknown project tags are orphan actions; unknown contexts are invalid
         """
         # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
----
-
-- [ ] 2025-10-30 Do something @macbook +nonexistent-project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(
+            audit_repo,
+            projects=[("valid-project.md", _markdown(area="Health", title="Valid Project", type="standard"))],
+            contexts=[("@macbook.md", _markdown(title="Macbook", body=action))],
+        )
 
         # When
         result = auditor.audit_orphan_actions()
 
         # Then
-        assert len(result["orphan_actions"]) == 1
-        assert result["orphan_actions"][0]["project_tag"] == "nonexistent-project"
-
-    def test_invalid_context(self, tmp_path):
-        """
-        Test action with invalid context.
-
-        Given: Action with context that doesn't have a file
-        When: Calling audit_orphan_actions()
-        Then: Returns invalid context
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "project.md").write_text("""---
-area: Health
-title: Project
-type: standard
----
-""")
-
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
----
-
-- [ ] 2025-10-30 Do something @invalidcontext +project
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_orphan_actions()
-
-        # Then
-        assert len(result["invalid_contexts"]) == 1
-        assert result["invalid_contexts"][0]["context"] == "@invalidcontext"
+        assert [a["project_tag"] for a in result["orphan_actions"]] == expected_orphan_tags
+        assert [c["context"] for c in result["invalid_contexts"]] == expected_invalid_contexts
 
 
 class TestAuditorAuditActionFiles:
     """Test Auditor.audit_action_files()."""
 
-    def test_valid_action_file(self, tmp_path):
-        """
-        Test action file with all required fields.
-
-        Given: Action file with title and last_reviewed
-        When: Calling audit_action_files()
-        Then: Returns no issues
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
-last_reviewed: 2025-01-15
----
-
-- [ ] 2025-10-30 Action here @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.audit_action_files()
-
-        # Then
-        assert len(result["issues"]) == 0
-
-    def test_missing_required_fields(self, tmp_path):
-        """
-        Test action file missing required fields.
-
-        Given: Action file missing last_reviewed
+    @pytest.mark.parametrize(
+        "macbook_md, expected_missing",
+        [
+            pytest.param(
+                _markdown(
+                    title="Macbook",
+                    last_reviewed="2025-01-15",
+                    body="- [ ] 2025-10-30 Action here @macbook",
+                ),
+                [],
+                id="valid",
+            ),
+            pytest.param(
+                _markdown(title="Macbook", body="- [ ] 2025-10-30 Action here @macbook"),
+                [["last_reviewed"]],
+                id="missing_last_reviewed",
+            ),
+        ],
+    )
+    def test_required_fields(self, audit_repo, macbook_md, expected_missing):
+        """
+        Test action files are checked for title and last_reviewed.
+
+        Given: @macbook.md with or without last_reviewed
         When: Calling audit_action_files()
-        Then: Returns issue
+        Then: One issue listing the missing fields, or no issues
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        (contexts_dir / "@macbook.md").write_text("""---
-title: Macbook
----
-
-- [ ] 2025-10-30 Action here @macbook
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(audit_repo, contexts=[("@macbook.md", macbook_md)])
 
         # When
         result = auditor.audit_action_files()
 
         # Then
-        assert len(result["issues"]) == 1
-        assert "last_reviewed" in result["issues"][0]["missing_fields"]
+        assert [issue["missing_fields"] for issue in result["issues"]] == expected_missing
 
 
 class TestAuditorListProjectsNeedingReview:
     """Test Auditor.list_projects_needing_review()."""
 
-    def test_recent_project_not_needing_review(self, tmp_path):
+    @pytest.mark.parametrize(
+        "last_reviewed, expected",
+        [
+            pytest.param("2025-01-17", [], id="3_days_ago"),
+            pytest.param("2025-01-13", [("2025-01-13", 7)], id="exactly_7_days_ago"),
+            pytest.param("2025-01-10", [("2025-01-10", 10)], id="10_days_ago"),
+            pytest.param(None, [(None, None)], id="never_reviewed"),
+        ],
+    )
+    def test_review_threshold(self, audit_repo, last_reviewed, expected):
         """
-        Test recently reviewed project not returned.
+        Test projects are due for review 7 or more days after last_reviewed.
 
-        Given: Project reviewed 3 days ago
+        Given: Project reviewed 3, 7 or 10 days ago, or never
         When: Calling list_projects_needing_review()
-        Then: Not in results
+        Then: Projects reviewed 7+ days ago or never are returned with their days since review
         """
         # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        recent_date = (date.today() - timedelta(days=3)).isoformat()
-        (active_dir / "recent.md").write_text(f"""---
-area: Health
-title: Recent Project
-type: standard
-last_reviewed: {recent_date}
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        fields = {"area": "Health", "title": "Project", "type": "standard"}
+        if last_reviewed is not None:
+            fields["last_reviewed"] = last_reviewed
+        auditor = _auditor_with(audit_repo, projects=[("project.md", _markdown(**fields))])
 
         # When
         result = auditor.list_projects_needing_review()
 
         # Then
-        assert len(result["projects_needing_review"]) == 0
+        assert [
+            (p["last_reviewed"], p["days_since_review"]) for p in result["projects_needing_review"]
+        ] == expected
 
-    def test_old_project_needs_review(self, tmp_path):
+    def test_invalid_and_unpadded_dates(self, audit_repo):
         """
-        Test project reviewed 10 days ago needs review.
+        Test impossible and non-zero-padded review dates.
 
-        Given: Project reviewed 10 days ago
+        Given: One project with last_reviewed 2999-02-30 (impossible, after cutoff)
+            and one with an unpadded date ten days ago
         When: Calling list_projects_needing_review()
-        Then: In results with days_since_review = 10
+        Then: Impossible date is flagged with null days; unpadded date is parsed
         """
         # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        old_date = (date.today() - timedelta(days=10)).isoformat()
-        (active_dir / "old.md").write_text(f"""---
-area: Health
-title: Old Project
-type: standard
-last_reviewed: {old_date}
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(audit_repo, projects=[
+            ("typo.md", _markdown(area="Health", title="Typo Project", last_reviewed="2999-02-30")),
+            ("unpadded.md", _markdown(area="Health", title="Unpadded Project", last_reviewed="2025-1-10")),
+        ])
 
         # When
         result = auditor.list_projects_needing_review()
 
         # Then
-        assert len(result["projects_needing_review"]) == 1
-        assert result["projects_needing_review"][0]["days_since_review"] == 10
+        by_title = {p["title"]: p for p in result["projects_needing_review"]}
+        assert by_title["Typo Project"]["days_since_review"] is None
+        assert by_title["Unpadded Project"]["days_since_review"] == 10
 
-    def test_exactly_7_days_needs_review(self, tmp_path):
+    @pytest.mark.parametrize(
+        "days_threshold, expected_days",
+        [
+            pytest.param(10**6, [], id="before_date_min"),
+            pytest.param(-10**6, [10], id="after_date_max"),
+        ],
+    )
+    def test_threshold_outside_date_range(self, audit_repo, days_threshold, expected_days):
         """
-        Test project reviewed exactly 7 days ago needs review.
+        Test thresholds whose cutoff falls outside the date range.
 
-        Given: Project reviewed 7 days ago (inclusive)
-        When: Calling list_projects_needing_review()
-        Then: In results
+        Given: Project reviewed ten days ago
+        When: Calling list_projects_needing_review() with a threshold of 10**6 or -10**6 days
+        Then: Nothing is due for the huge threshold; everything is due for the negative one
         """
         # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        seven_days_ago = (date.today() - timedelta(days=7)).isoformat()
-        (active_dir / "seven.md").write_text(f"""---
-area: Health
-title: Seven Days Project
-type: standard
-last_reviewed: {seven_days_ago}
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(audit_repo, projects=[
+            ("project.md", _markdown(area="Health", title="Project", last_reviewed="2025-01-10")),
+        ])
 
         # When
-        result = auditor.list_projects_needing_review()
+        result = auditor.list_projects_needing_review(days_threshold=days_threshold)
 
         # Then
-        assert len(result["projects_needing_review"]) == 1
-        assert result["projects_needing_review"][0]["days_since_review"] == 7
-
-    def test_missing_last_reviewed_needs_review(self, tmp_path):
-        """
-        Test project without last_reviewed needs review.
-
-        Given: Project with no last_reviewed field
-        When: Calling list_projects_needing_review()
-        Then: In results with null last_reviewed
-        """
-        # Given
-        repo_path = tmp_path / "repo"
-        projects_base = repo_path / "docs" / "execution_system" / "10k-projects"
-        active_dir = projects_base / "active" / "health"
-        active_dir.mkdir(parents=True)
-
-        (active_dir / "never.md").write_text("""---
-area: Health
-title: Never Reviewed
-type: standard
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
-
-        # When
-        result = auditor.list_projects_needing_review()
-
-        # Then
-        assert len(result["projects_needing_review"]) == 1
-        assert result["projects_needing_review"][0]["last_reviewed"] is None
-
+        assert [p["days_since_review"] for p in result["projects_needing_review"]] == expected_days
 
 class TestAuditorListActionsNeedingReview:
     """Test Auditor.list_actions_needing_review()."""
 
-    def test_recent_action_file_not_needing_review(self, tmp_path):
+    @pytest.mark.parametrize(
+        "last_reviewed, expected_days",
+        [
+            pytest.param("2025-01-17", [], id="3_days_ago"),
+            pytest.param("2025-01-08", [12], id="12_days_ago"),
+        ],
+    )
+    def test_review_threshold(self, audit_repo, last_reviewed, expected_days):
         """
-        Test recently reviewed action file not returned.
+        Test action files are due for review 7 or more days after last_reviewed.
 
-        Given: Action file reviewed 3 days ago
+        Given: Action file reviewed 3 or 12 days ago
         When: Calling list_actions_needing_review()
-        Then: Not in results
+        Then: Only the file reviewed 12 days ago is returned, with its days since review
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        recent_date = (date.today() - timedelta(days=3)).isoformat()
-        (contexts_dir / "@macbook.md").write_text(f"""---
-title: Macbook
-last_reviewed: {recent_date}
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(
+            audit_repo, contexts=[("@macbook.md", _markdown(title="Macbook", last_reviewed=last_reviewed))]
+        )
 
         # When
         result = auditor.list_actions_needing_review()
 
         # Then
-        assert len(result["actions_needing_review"]) == 0
+        assert [a["days_since_review"] for a in result["actions_needing_review"]] == expected_days
 
-    def test_old_action_file_needs_review(self, tmp_path):
+    @pytest.mark.parametrize(
+        "days_threshold, expected_days",
+        [
+            pytest.param(10**6, [], id="before_date_min"),
+            pytest.param(-10**6, [12], id="after_date_max"),
+        ],
+    )
+    def test_threshold_outside_date_range(self, audit_repo, days_threshold, expected_days):
         """
-        Test action file reviewed 12 days ago needs review.
+        Test thresholds whose cutoff falls outside the date range.
 
-        Given: Action file reviewed 12 days ago
-        When: Calling list_actions_needing_review()
-        Then: In results with days_since_review = 12
+        Given: Action file reviewed twelve days ago
+        When: Calling list_actions_needing_review() with a threshold of 10**6 or -10**6 days
+        Then: Nothing is due for the huge threshold; everything is due for the negative one
         """
         # Given
-        repo_path = tmp_path / "repo"
-        actions_base = repo_path / "docs" / "execution_system" / "00k-next-actions"
-        contexts_dir = actions_base / "contexts"
-        contexts_dir.mkdir(parents=True)
-
-        old_date = (date.today() - timedelta(days=12)).isoformat()
-        (contexts_dir / "@phone.md").write_text(f"""---
-title: Phone
-last_reviewed: {old_date}
----
-""")
-
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": str(repo_path),
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        auditor = Auditor(config)
+        auditor = _auditor_with(
+            audit_repo, contexts=[("@macbook.md", _markdown(title="Macbook", last_reviewed="2025-01-08"))]
+        )
 
         # When
-        result = auditor.list_actions_needing_review()
+        result = auditor.list_actions_needing_review(days_threshold=days_threshold)
 
         # Then
-        assert len(result["actions_needing_review"]) == 1
-        assert result["actions_needing_review"][0]["days_since_review"] == 12
+        assert [a["days_since_review"] for a in result["actions_needing_review"]] == expected_days
@@ -1,8 +1,7 @@
 """Tests for ProjectCompleter class."""
 
-import pytest
-from pathlib import Path
 from datetime import date
+
 from execution_system_mcp.completer import ProjectCompleter
 from execution_system_mcp.config import ConfigManager
 
@@ -17,13 +16,12 @@ class TestProjectCompleterFindActiveProject:
         Then the project path and area are returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [
                 {"name": "Health", "kebab": "health"}
             ]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
@@ -40,7 +38,7 @@ last_reviewed: 2025-10-20
 # Content
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -56,18 +54,17 @@ last_reviewed: 2025-10-20
         Then None and error message are returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [
                 {"name": "Health", "kebab": "health"}
             ]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -84,13 +81,12 @@ last_reviewed: 2025-10-20
         Then None and error message are returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [
                 {"name": "Health", "kebab": "health"}
             ]
-        }""" % str(tmp_path))
+        }
 
         completed_health = tmp_path / "docs/execution_system/10k-projects/completed/health"
         completed_health.mkdir(parents=True)
@@ -101,7 +97,7 @@ title: Old Project
 ---
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -118,13 +114,12 @@ title: Old Project
         Then None and error message are returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [
                 {"name": "Health", "kebab": "health"}
             ]
-        }""" % str(tmp_path))
+        }
 
         incubator_health = tmp_path / "docs/execution_system/10k-projects/incubator/health"
         incubator_health.mkdir(parents=True)
@@ -135,7 +130,7 @@ title: Future Project
 ---
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -152,14 +147,13 @@ title: Future Project
         Then the correct project is found in its area
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [
                 {"name": "Health", "kebab": "health"},
                 {"name": "Career", "kebab": "career"}
             ]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
@@ -179,7 +173,7 @@ title: Career Project
 ---
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -199,11 +193,10 @@ class TestProjectCompleterCheck0kBlockers:
         Then an empty list is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -216,7 +209,7 @@ title: Waiting For
 - [ ] 2025-10-22 Someone to do something +other-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -232,11 +225,10 @@ title: Waiting For
         Then a list with the blocking item is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -250,7 +242,7 @@ title: Waiting For
 - [ ] 2025-10-21 Something else +other-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -268,11 +260,10 @@ title: Waiting For
         Then a list with the blocking item is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -285,7 +276,7 @@ title: Incubating
 - [ ] 2025-09-12 Text Samarth to get coffee +my-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -303,11 +294,10 @@ title: Incubating
         Then a list with the blocking item is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -320,7 +310,7 @@ title: Deferred
 - [ ] 2025-10-23 Pick up dry cleaning +my-project defer:2025-10-28
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -338,11 +328,10 @@ title: Deferred
         Then a list with the blocking item is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         contexts_dir = tmp_path / "docs/execution_system/00k-next-actions/contexts"
         contexts_dir.mkdir(parents=True)
@@ -355,7 +344,7 @@ title: Personal Context
 - [ ] 2025-10-20 Do the thing @home +my-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -373,11 +362,10 @@ title: Personal Context
         Then a list with all blocking items is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -408,7 +396,7 @@ title: Personal
 - [ ] 2025-10-20 Next action +my-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -424,11 +412,10 @@ title: Personal
         Then those items are not included in the result
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -442,7 +429,7 @@ title: Completed
 - [x] 2025-10-19 Another completed task +my-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -458,11 +445,10 @@ title: Completed
         Then the checked item is not included in the result
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
@@ -476,7 +462,7 @@ title: Waiting For
 - [ ] 2025-10-21 Still waiting +other-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -496,11 +482,10 @@ class TestProjectCompleterParseFrontmatter:
         Then all fields are returned in a dict
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         project_file = tmp_path / "project.md"
         project_file.write_text("""---
@@ -516,7 +501,7 @@ due: 2025-12-31
 # Content
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -538,11 +523,10 @@ due: 2025-12-31
         Then the dict includes only present fields
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         project_file = tmp_path / "project.md"
         project_file.write_text("""---
@@ -556,7 +540,7 @@ last_reviewed: 2025-10-22
 # Content
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -575,11 +559,10 @@ last_reviewed: 2025-10-22
         Then the returned dict preserves insertion order
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         project_file = tmp_path / "project.md"
         project_file.write_text("""---
@@ -594,7 +577,7 @@ last_reviewed: 2025-10-22
 # Content
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -615,11 +598,10 @@ class TestProjectCompleterAddCompletedDate:
         Then a completed field with today's date is added
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -630,7 +612,7 @@ class TestProjectCompleterAddCompletedDate:
             "last_reviewed": "2025-10-22"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -647,11 +629,10 @@ class TestProjectCompleterAddCompletedDate:
         Then all original fields are preserved
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -663,7 +644,7 @@ class TestProjectCompleterAddCompletedDate:
             "due": "2025-12-31"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -685,11 +666,10 @@ class TestProjectCompleterAddCompletedDate:
         Then completed is placed after due
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -701,7 +681,7 @@ class TestProjectCompleterAddCompletedDate:
             "due": "2025-12-31"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -718,11 +698,10 @@ class TestProjectCompleterAddCompletedDate:
         Then completed is placed after last_reviewed
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -733,7 +712,7 @@ class TestProjectCompleterAddCompletedDate:
             "last_reviewed": "2025-10-22"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -754,11 +733,10 @@ class TestProjectCompleterGenerateFrontmatterYaml:
         Then valid YAML frontmatter is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -771,7 +749,7 @@ class TestProjectCompleterGenerateFrontmatterYaml:
             "completed": "2025-10-23"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -791,11 +769,10 @@ class TestProjectCompleterGenerateFrontmatterYaml:
         Then fields appear in the correct order
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -807,7 +784,7 @@ class TestProjectCompleterGenerateFrontmatterYaml:
             "completed": "2025-10-23"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -829,11 +806,10 @@ class TestProjectCompleterGenerateFrontmatterYaml:
         Then dates are formatted as string values
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         frontmatter = {
             "area": "Health",
@@ -843,7 +819,7 @@ class TestProjectCompleterGenerateFrontmatterYaml:
             "completed": "2025-10-23"
         }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -864,11 +840,10 @@ class TestProjectCompleterCompleteProject:
         Then the project is moved to completed with completed date added
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
@@ -890,7 +865,7 @@ last_reviewed: 2025-10-22
         waiting_file = next_actions_dir / "@waiting.md"
         waiting_file.write_text("---\ntitle: Waiting\n---\n\n- [ ] Something else +other-project\n")
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -910,11 +885,10 @@ last_reviewed: 2025-10-22
         Then the directory is created
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
@@ -934,7 +908,7 @@ last_reviewed: 2025-10-22
         next_actions_dir = tmp_path / "docs/execution_system/00k-next-actions"
         next_actions_dir.mkdir(parents=True)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -952,16 +926,15 @@ last_reviewed: 2025-10-22
         Then an error message is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
@@ -977,11 +950,10 @@ last_reviewed: 2025-10-22
         Then an error message listing blockers is returned
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_file.write_text("""{
-            "execution_system_repo_path": "%s",
+        config_data = {
+            "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }""" % str(tmp_path))
+        }
 
         active_health = tmp_path / "docs/execution_system/10k-projects/active/health"
         active_health.mkdir(parents=True)
@@ -1008,7 +980,7 @@ title: Waiting
 - [ ] 2025-10-22 Wait for something +test-project
 """)
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         completer = ProjectCompleter(config)
 
         # When
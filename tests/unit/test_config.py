@@ -1,13 +1,18 @@
 """Tests for ConfigManager."""
 
 import json
-from pathlib import Path
 
 import pytest
 
 from execution_system_mcp.config import ConfigManager
 
 
+def _write_config(path, config_data: dict) -> None:
+    """Serialize a config dict straight into the file, without an intermediate string."""
+    with path.open("w") as f:
+        json.dump(config_data, f)
+
+
 class TestConfigManagerInit:
     """Test ConfigManager initialization."""
 
@@ -28,7 +33,7 @@ class TestConfigManagerInit:
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         # When
         config = ConfigManager(str(config_file))
@@ -80,7 +85,7 @@ class TestConfigManagerInit:
         config_data = {
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         # When/Then
         with pytest.raises(ValueError, match="execution_system_repo_path"):
@@ -99,7 +104,7 @@ class TestConfigManagerInit:
         config_data = {
             "execution_system_repo_path": "/path/to/repo",
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         # When/Then
         with pytest.raises(ValueError, match="areas"):
@@ -119,13 +124,55 @@ class TestConfigManagerInit:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         # When/Then
         with pytest.raises(ValueError, match="non-empty"):
             ConfigManager(str(config_file))
 
 
+class TestConfigManagerFromDict:
+    """Test ConfigManager.from_dict()."""
+
+    def test_builds_from_dict(self):
+        """
+        Test building a ConfigManager without a config file.
+
+        Given: Parsed config dict with repo path and areas
+        When: Calling ConfigManager.from_dict()
+        Then: Repo path and area lookups come from the dict
+        """
+        # Given
+        config_data = {
+            "execution_system_repo_path": "/path/to/repo",
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+
+        # When
+        config = ConfigManager.from_dict(config_data)
+
+        # Then
+        assert config.get_repo_path() == "/path/to/repo"
+        assert config.find_area_kebab("health") == "health"
+
+    def test_fail_on_empty_areas(self):
+        """
+        Test dict configs are validated like config files.
+
+        Given: Config dict with empty areas array
+        When: Calling ConfigManager.from_dict()
+        Then: Raises ValueError with 'non-empty' message
+        """
+        # Given
+        config_data = {
+            "execution_system_repo_path": "/path/to/repo",
+            "areas": [],
+        }
+
+        # When/Then
+        with pytest.raises(ValueError, match="non-empty"):
+            ConfigManager.from_dict(config_data)
+
 class TestConfigManagerGetRepoPath:
     """Test ConfigManager.get_repo_path()."""
 
@@ -143,7 +190,7 @@ class TestConfigManagerGetRepoPath:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -173,7 +220,7 @@ class TestConfigManagerGetAreas:
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -204,7 +251,7 @@ class TestConfigManagerFindAreaKebab:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -227,7 +274,7 @@ class TestConfigManagerFindAreaKebab:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -250,7 +297,7 @@ class TestConfigManagerFindAreaKebab:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -275,7 +322,7 @@ class TestConfigManagerFindAreaKebab:
                 {"name": "Personal Growth Systems", "kebab": "personal-growth-systems"}
             ],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
@@ -298,7 +345,7 @@ class TestConfigManagerFindAreaKebab:
             "execution_system_repo_path": "/path/to/repo",
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
         config = ConfigManager(str(config_file))
 
         # When
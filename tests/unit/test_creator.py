@@ -1,7 +1,5 @@
 """Tests for ProjectCreator."""
 
-import json
-from datetime import date
 from pathlib import Path
 
 import pytest
@@ -112,13 +110,11 @@ class TestProjectCreatorGenerateFrontmatter:
         Then: Frontmatter includes area, title, type, created, last_reviewed
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -146,13 +142,11 @@ class TestProjectCreatorGenerateFrontmatter:
         Then: Frontmatter includes started field
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -176,13 +170,11 @@ class TestProjectCreatorGenerateFrontmatter:
         Then: Frontmatter does not include started field
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -206,13 +198,11 @@ class TestProjectCreatorGenerateFrontmatter:
         Then: Frontmatter includes due: 2025-12-31
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -237,13 +227,11 @@ class TestProjectCreatorGenerateFrontmatter:
         Then: Frontmatter does not include due field
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(tmp_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -272,13 +260,11 @@ class TestProjectCreatorCreateProject:
         """
         # Given
         repo_path = tmp_path / "repo"
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -304,13 +290,11 @@ class TestProjectCreatorCreateProject:
         """
         # Given
         repo_path = tmp_path / "repo"
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Career", "kebab": "career"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -335,13 +319,11 @@ class TestProjectCreatorCreateProject:
         """
         # Given
         repo_path = tmp_path / "repo"
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         creator = ProjectCreator(config)
 
         # When
@@ -357,3 +339,34 @@ class TestProjectCreatorCreateProject:
         assert content.startswith("---\n")
         assert "# Test Project" in content
         assert "## 1. PURPOSE - Why This Matters" in content
+
+    def test_does_not_overwrite_existing_file(self, tmp_path):
+        """
+        Test existing project file is never overwritten.
+
+        Given: Project file already exists at the target path
+        When: Calling create_project() with the same title
+        Then: ValueError is raised and the existing content is unchanged
+        """
+        # Given
+        repo_path = tmp_path / "repo"
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        creator = ProjectCreator(config)
+
+        existing = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health" / "test-project.md"
+        existing.parent.mkdir(parents=True)
+        existing.write_text("original content")
+
+        # When / Then
+        with pytest.raises(ValueError, match="already exists"):
+            creator.create_project(
+                title="Test Project",
+                area="Health",
+                project_type="standard",
+                folder="active"
+            )
+        assert existing.read_text() == "original content"
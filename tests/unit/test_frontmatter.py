@@ -0,0 +1,83 @@
+"""Tests for frontmatter reading."""
+
+from execution_system_mcp.frontmatter import read_frontmatter
+
+
+class TestReadFrontmatter:
+    """Test read_frontmatter()."""
+
+    def test_parses_key_value_pairs(self, tmp_path):
+        """
+        Test frontmatter fields are returned as stripped strings.
+
+        Given: File with area, title and last_reviewed in frontmatter
+        When: Calling read_frontmatter()
+        Then: Returns dict with those fields
+        """
+        # Given
+        project_file = tmp_path / "project.md"
+        project_file.write_text(
+            "---\narea: Health\ntitle: Run a 5k\nlast_reviewed: 2025-10-01\n---\n# Run a 5k\n"
+        )
+
+        # When
+        frontmatter = read_frontmatter(project_file)
+
+        # Then
+        assert frontmatter == {"area": "Health", "title": "Run a 5k", "last_reviewed": "2025-10-01"}
+
+    def test_stops_at_closing_delimiter(self, tmp_path):
+        """
+        Test body lines after the closing --- are not parsed.
+
+        Given: File whose body contains "key: value" style lines
+        When: Calling read_frontmatter()
+        Then: Only the frontmatter fields are returned
+        """
+        # Given
+        project_file = tmp_path / "project.md"
+        project_file.write_text("---\ntitle: Run a 5k\n---\n\n**Status:** Active\nnote: not metadata\n")
+
+        # When
+        frontmatter = read_frontmatter(project_file)
+
+        # Then
+        assert frontmatter == {"title": "Run a 5k"}
+
+    def test_reads_frontmatter_longer_than_ten_lines(self, tmp_path):
+        """
+        Test long frontmatter is read in full.
+
+        Given: File with twelve frontmatter fields
+        When: Calling read_frontmatter()
+        Then: All twelve fields are returned
+        """
+        # Given
+        fields = "".join(f"key{i}: value{i}\n" for i in range(12))
+        project_file = tmp_path / "project.md"
+        project_file.write_text(f"---\n{fields}---\n")
+
+        # When
+        frontmatter = read_frontmatter(project_file)
+
+        # Then
+        assert len(frontmatter) == 12
+        assert frontmatter["key11"] == "value11"
+
+    def test_file_without_frontmatter_returns_empty_dict(self, tmp_path):
+        """
+        Test file with no --- delimiter yields no fields.
+
+        Given: Plain markdown file with a "key: value" line
+        When: Calling read_frontmatter()
+        Then: Returns empty dict
+        """
+        # Given
+        project_file = tmp_path / "notes.md"
+        project_file.write_text("# Notes\nstatus: draft\n")
+
+        # When
+        frontmatter = read_frontmatter(project_file)
+
+        # Then
+        assert frontmatter == {}
@@ -1,9 +1,6 @@
 """Tests for GoalLister."""
 
 import json
-from pathlib import Path
-
-import pytest
 
 from execution_system_mcp.config import ConfigManager
 from execution_system_mcp.goal_lister import GoalLister
@@ -47,16 +44,15 @@ type: goal
 # Learn Spanish
 """)
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
+        config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
                 {"name": "Health", "kebab": "health"},
                 {"name": "Learning", "kebab": "learning"}
             ]
-        }))
+        }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = GoalLister(config)
 
         # When
@@ -108,13 +104,12 @@ title: Role Criteria
 Just supporting material
 """)
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
+        config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Career", "kebab": "career"}]
-        }))
+        }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = GoalLister(config)
 
         # When
@@ -147,13 +142,12 @@ started: 2025-10-01
 # Find New Job
 """)
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
+        config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Career", "kebab": "career"}]
-        }))
+        }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = GoalLister(config)
 
         # When
@@ -180,13 +174,12 @@ started: 2025-10-01
         (goals_base / "active").mkdir(parents=True)
         (goals_base / "incubator").mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
+        config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = GoalLister(config)
 
         # When
@@ -219,13 +212,12 @@ started: 2025-09-15
 # Health Goal
 """)
 
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps({
+        config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}]
-        }))
+        }
 
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = GoalLister(config)
 
         # When
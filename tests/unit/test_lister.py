@@ -1,10 +1,6 @@
 """Tests for ProjectLister."""
 
-import json
 from datetime import date, timedelta
-from pathlib import Path
-
-import pytest
 
 from execution_system_mcp.config import ConfigManager
 from execution_system_mcp.lister import ProjectLister
@@ -242,7 +238,6 @@ type: coordination
 # Job Search
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -250,8 +245,7 @@ type: coordination
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -294,7 +288,6 @@ type: standard
         # Create empty career directory
         (active_path / "career").mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -302,8 +295,7 @@ type: standard
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -349,7 +341,6 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -357,8 +348,7 @@ type: standard
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -413,13 +403,11 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -452,13 +440,11 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -500,7 +486,6 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -508,8 +493,7 @@ type: standard
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -548,13 +532,11 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -613,13 +595,11 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -667,7 +647,6 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -675,8 +654,7 @@ type: standard
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -772,13 +750,11 @@ completed: 2025-10-31
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -841,13 +817,11 @@ completed: {last_week_start - timedelta(days=8)}
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -896,13 +870,11 @@ completed: {today}
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -965,13 +937,11 @@ completed: {this_week_start - timedelta(days=1)}
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When
@@ -1034,13 +1004,11 @@ completed: 2025-11-01
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         lister = ProjectLister(config)
 
         # When - filter for October 2025
@@ -1,10 +1,6 @@
 """Tests for ProjectManager (Phase 2 tools)."""
 
-import json
 from datetime import date
-from pathlib import Path
-
-import pytest
 
 from execution_system_mcp.config import ConfigManager
 from execution_system_mcp.project_manager import ProjectManager
@@ -39,13 +35,11 @@ last_reviewed: 2025-01-01
 # Test Project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -85,13 +79,11 @@ type: standard
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -138,13 +130,11 @@ last_reviewed: 2025-01-01
         contexts_dir.mkdir(parents=True)
         (contexts_dir / "@macbook.md").write_text("---\ntitle: Macbook\n---\n")
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -195,13 +185,11 @@ title: Macbook
 - [ ] 2025-10-30 Do something @macbook +test-project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -248,13 +236,11 @@ last_reviewed: 2025-01-01
         contexts_dir.mkdir(parents=True)
         (contexts_dir / "@macbook.md").write_text("---\ntitle: Macbook\n---\n")
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -301,13 +287,11 @@ type: standard
         contexts_dir.mkdir(parents=True)
         (contexts_dir / "@macbook.md").write_text("---\ntitle: Macbook\n---\n")
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -349,13 +333,11 @@ last_reviewed: 2025-01-01
 # Test Project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -394,13 +376,11 @@ due: 2025-12-31
 # Test Project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -445,7 +425,6 @@ last_reviewed: 2025-01-01
 # Test Project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -453,8 +432,7 @@ last_reviewed: 2025-01-01
                 {"name": "Career", "kebab": "career"}
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -503,13 +481,11 @@ last_reviewed: 2025-01-01
 # Test Project
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -554,13 +530,11 @@ last_reviewed: 2025-01-01
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -600,13 +574,11 @@ last_reviewed: 2025-01-01
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -656,7 +628,6 @@ last_reviewed: 2025-01-01
 ---
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -664,8 +635,7 @@ last_reviewed: 2025-01-01
                 {"name": "Career", "kebab": "career"}
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         manager = ProjectManager(config)
 
         # When
@@ -0,0 +1,88 @@
+"""Tests for ProjectReviewIndex."""
+
+from execution_system_mcp.review_index import ProjectReviewIndex
+
+
+def _write_project(projects_base, folder, name, last_reviewed=None):
+    """Write a minimal project file under projects_base/folder/health."""
+    area_dir = projects_base / folder / "health"
+    area_dir.mkdir(parents=True, exist_ok=True)
+    review_line = f"last_reviewed: {last_reviewed}\n" if last_reviewed else ""
+    path = area_dir / f"{name}.md"
+    path.write_text(f"---\narea: Health\ntitle: {name}\n{review_line}---\n")
+    return path
+
+
+class TestProjectReviewIndexNeedingReview:
+    """Test ProjectReviewIndex.needing_review()."""
+
+    def test_returns_projects_on_or_before_cutoff(self, tmp_path):
+        """
+        Test dated projects are split at the cutoff.
+
+        Given: Projects reviewed 2025-01-01, 2025-01-10 and 2025-01-20
+        When: Querying with cutoff 2025-01-10
+        Then: The first two are due, oldest first; nothing is undated
+        """
+        # Given
+        _write_project(tmp_path, "active", "recent", "2025-01-20")
+        _write_project(tmp_path, "active", "old", "2025-01-01")
+        _write_project(tmp_path, "incubator", "edge", "2025-01-10")
+        index = ProjectReviewIndex(tmp_path, ("active", "incubator"))
+        index.refresh()
+
+        # When
+        dated, undated = index.needing_review("2025-01-10")
+
+        # Then
+        assert [record["title"] for _, record in dated] == ["old", "edge"]
+        assert undated == []
+
+    def test_missing_and_irregular_dates_are_undated(self, tmp_path):
+        """
+        Test projects without a canonical valid date are returned unfiltered.
+
+        Given: Projects with no date, an impossible date and an unpadded date
+        When: Querying with any cutoff
+        Then: All three are returned as undated
+        """
+        # Given
+        _write_project(tmp_path, "active", "never")
+        _write_project(tmp_path, "active", "typo", "2025-02-30")
+        _write_project(tmp_path, "active", "unpadded", "2025-1-5")
+        index = ProjectReviewIndex(tmp_path, ("active",))
+        index.refresh()
+
+        # When
+        dated, undated = index.needing_review("2000-01-01")
+
+        # Then
+        assert dated == []
+        assert sorted(record["title"] for _, record in undated) == ["never", "typo", "unpadded"]
+
+
+class TestProjectReviewIndexRefresh:
+    """Test ProjectReviewIndex.refresh()."""
+
+    def test_picks_up_modified_and_removed_files(self, tmp_path):
+        """
+        Test refresh re-reads changed files and drops deleted ones.
+
+        Given: Indexed projects "a" (old review) and "b" (old review)
+        When: "a" is re-reviewed, "b" is deleted and the index is refreshed
+        Then: Neither is due for review any more
+        """
+        # Given
+        path_a = _write_project(tmp_path, "active", "a", "2025-01-01")
+        path_b = _write_project(tmp_path, "active", "b", "2025-01-02")
+        index = ProjectReviewIndex(tmp_path, ("active",))
+        index.refresh()
+        assert len(index.needing_review("2025-01-05")[0]) == 2
+
+        # When
+        path_a.write_text("---\narea: Health\ntitle: a\nlast_reviewed: 2025-06-01\n---\n# Reviewed\n")
+        path_b.unlink()
+        index.refresh()
+
+        # Then
+        assert index.needing_review("2025-01-05") == ([], [])
@@ -0,0 +1,171 @@
+"""Tests for directory scanning helpers."""
+
+import os
+
+from execution_system_mcp.scanner import (
+    entry_stem,
+    iter_markdown_files,
+    iter_markdown_tree,
+    iter_subdirectories,
+)
+
+
+class TestIterMarkdownFiles:
+    """Test iter_markdown_files()."""
+
+    def test_yields_only_markdown_files(self, tmp_path):
+        """
+        Test only regular .md files are yielded.
+
+        Given: Directory with .md files, a non-markdown file and a subdirectory ending in .md
+        When: Calling iter_markdown_files()
+        Then: Only the regular .md files are yielded
+        """
+        # Given
+        (tmp_path / "one.md").write_text("# One")
+        (tmp_path / "two.md").write_text("# Two")
+        (tmp_path / "notes.txt").write_text("notes")
+        (tmp_path / "folder.md").mkdir()
+
+        # When
+        names = sorted(entry.name for entry in iter_markdown_files(tmp_path))
+
+        # Then
+        assert names == ["one.md", "two.md"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """
+        Test missing directory is treated as empty.
+
+        Given: Path that does not exist
+        When: Calling iter_markdown_files()
+        Then: Nothing is yielded and no error is raised
+        """
+        # When
+        entries = list(iter_markdown_files(tmp_path / "missing"))
+
+        # Then
+        assert entries == []
+
+
+class TestIterSubdirectories:
+    """Test iter_subdirectories()."""
+
+    def test_yields_only_directories(self, tmp_path):
+        """
+        Test only subdirectories are yielded.
+
+        Given: Directory with two subdirectories and a file
+        When: Calling iter_subdirectories()
+        Then: Only the subdirectories are yielded
+        """
+        # Given
+        (tmp_path / "health").mkdir()
+        (tmp_path / "career").mkdir()
+        (tmp_path / "README.md").write_text("# Readme")
+
+        # When
+        names = sorted(entry.name for entry in iter_subdirectories(tmp_path))
+
+        # Then
+        assert names == ["career", "health"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """
+        Test missing directory is treated as empty.
+
+        Given: Path that does not exist
+        When: Calling iter_subdirectories()
+        Then: Nothing is yielded and no error is raised
+        """
+        # When
+        entries = list(iter_subdirectories(tmp_path / "missing"))
+
+        # Then
+        assert entries == []
+
+
+class TestIterMarkdownTree:
+    """Test iter_markdown_tree()."""
+
+    def test_yields_markdown_files_at_every_depth(self, tmp_path):
+        """
+        Test nested markdown files are found.
+
+        Given: Markdown files at the top level and two levels down, plus a text file
+        When: Calling iter_markdown_tree()
+        Then: All .md files are yielded and the text file is skipped
+        """
+        # Given
+        (tmp_path / "top.md").write_text("# Top")
+        (tmp_path / "health" / "fitness").mkdir(parents=True)
+        (tmp_path / "health" / "area.md").write_text("# Area")
+        (tmp_path / "health" / "fitness" / "run.md").write_text("# Run")
+        (tmp_path / "health" / "notes.txt").write_text("notes")
+
+        # When
+        paths = sorted(
+            os.path.relpath(entry.path, tmp_path) for entry in iter_markdown_tree(tmp_path)
+        )
+
+        # Then
+        assert paths == [
+            os.path.join("health", "area.md"),
+            os.path.join("health", "fitness", "run.md"),
+            "top.md",
+        ]
+
+    def test_files_come_before_subdirectories(self, tmp_path):
+        """
+        Test a directory's own files are yielded before nested ones.
+
+        Given: Directory with a file and a subdirectory containing a file
+        When: Calling iter_markdown_tree()
+        Then: The top-level file is yielded first
+        """
+        # Given
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "inner.md").write_text("# Inner")
+        (tmp_path / "outer.md").write_text("# Outer")
+
+        # When
+        names = [entry.name for entry in iter_markdown_tree(tmp_path)]
+
+        # Then
+        assert names == ["outer.md", "inner.md"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """
+        Test missing directory is treated as empty.
+
+        Given: Path that does not exist
+        When: Calling iter_markdown_tree()
+        Then: Nothing is yielded and no error is raised
+        """
+        # When
+        entries = list(iter_markdown_tree(tmp_path / "missing"))
+
+        # Then
+        assert entries == []
+
+
+class TestEntryStem:
+    """Test entry_stem()."""
+
+    def test_strips_extension(self, tmp_path):
+        """
+        Test extension is removed from entry name.
+
+        Given: Markdown file named @macbook.md
+        When: Calling entry_stem() on its directory entry
+        Then: Returns "@macbook"
+        """
+        # Given
+        (tmp_path / "@macbook.md").write_text("---\ntitle: Macbook\n---\n")
+        entry = next(iter_markdown_files(tmp_path))
+
+        # When
+        stem = entry_stem(entry)
+
+        # Then
+        assert stem == "@macbook"
@@ -1,10 +1,5 @@
 """Tests for project and action search functionality."""
 
-import json
-from pathlib import Path
-
-import pytest
-
 from execution_system_mcp.config import ConfigManager
 from execution_system_mcp.searcher import Searcher
 
@@ -50,13 +45,11 @@ last_reviewed: 2025-10-30
 Daily meditation routine.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -108,13 +101,11 @@ last_reviewed: 2025-10-30
 This is about JavaScript development.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Mission", "kebab": "mission"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -151,13 +142,11 @@ last_reviewed: 2025-10-30
 Content with YoGa mentioned.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -203,13 +192,11 @@ last_reviewed: 2025-10-30
 Fitness ideas.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -255,7 +242,6 @@ last_reviewed: 2025-10-30
 Content about goals.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [
@@ -263,8 +249,7 @@ Content about goals.
                 {"name": "Mission", "kebab": "mission"}
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -298,13 +283,11 @@ last_reviewed: 2025-10-30
 Content here.
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -341,13 +324,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Review JavaScript code @macbook +project-b
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -383,13 +364,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Call DOCTOR about appointment @phone
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -424,13 +403,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Review feedback from team @waiting @macbook +project-a
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -464,13 +441,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Write tests @macbook +project-b
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -512,13 +487,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Email office @phone +project-a
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -551,13 +524,11 @@ last_reviewed: 2025-10-30
 - [ ] 2025-10-30 Do something @macbook +project-a
 """)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         searcher = Searcher(config)
 
         # When
@@ -1,11 +1,29 @@
 """Tests for MCP server."""
 
+import asyncio
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from execution_system_mcp.server import create_project_handler
+from execution_system_mcp.lister import ProjectLister
+from execution_system_mcp.server import (
+    _HANDLERS,
+    _TOOLS,
+    _arg_getter,
+    _dispatch,
+    _dumps,
+    _get_config,
+    _get_service,
+    create_project_handler,
+)
+
+
+def _write_config(path, config_data: dict) -> None:
+    """Serialize a config dict straight into the file, without an intermediate string."""
+    with path.open("w") as f:
+        json.dump(config_data, f)
 
 
 class TestCreateProjectHandler:
@@ -26,7 +44,7 @@ class TestCreateProjectHandler:
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         params = {
             "title": "Test Project",
@@ -61,7 +79,7 @@ class TestCreateProjectHandler:
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         params = {
             "title": "Test Project",
@@ -92,7 +110,7 @@ class TestCreateProjectHandler:
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         # Create existing project
         existing_project = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health" / "test-project.md"
@@ -127,7 +145,7 @@ class TestCreateProjectHandler:
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         params = {
             "title": "Test Project",
@@ -159,7 +177,7 @@ class TestCreateProjectHandler:
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
+        _write_config(config_file, config_data)
 
         params = {
             "title": "Test Project",
@@ -179,3 +197,449 @@ class TestCreateProjectHandler:
         project_file = repo_path / "docs" / "execution_system" / "10k-projects" / "active" / "health" / "test-project.md"
         content = project_file.read_text()
         assert "due: 2025-12-31" in content
+
+    def test_second_create_with_same_title_reports_duplicate(self, tmp_path):
+        """
+        Test duplicate check sees a project created earlier in the session.
+
+        Given: Project "Test Project" was just created through the handler
+        When: Calling create_project_handler() again with the same title
+        Then: Duplicate error naming the active folder is returned
+        """
+        # Given
+        repo_path = tmp_path / "repo"
+        config_file = tmp_path / "config.json"
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        _write_config(config_file, config_data)
+
+        params = {
+            "title": "Test Project",
+            "area": "Health",
+            "type": "standard",
+            "folder": "active"
+        }
+        create_project_handler(params, str(config_file))
+
+        # When
+        result = create_project_handler(params, str(config_file))
+
+        # Then
+        assert result == "Error: Project 'Test Project' already exists in active/ as test-project.md"
+
+    def test_raw_mode_returns_result_tuple(self, tmp_path):
+        """
+        Test raw mode returns an unformatted result tuple.
+
+        Given: Valid project parameters
+        When: Calling create_project_handler() with raw=True
+        Then: Returns ("ok", title, file_path) and the file exists
+        """
+        # Given
+        repo_path = tmp_path / "repo"
+        config_file = tmp_path / "config.json"
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        _write_config(config_file, config_data)
+
+        params = {
+            "title": "Test Project",
+            "area": "Health",
+            "type": "standard",
+            "folder": "active"
+        }
+
+        # When
+        status, title, file_path = create_project_handler(params, str(config_file), raw=True)
+
+        # Then
+        assert status == "ok"
+        assert title == "Test Project"
+        assert Path(file_path).name == "test-project.md"
+        assert Path(file_path).exists()
+
+    def test_raw_mode_returns_error_tuple(self, tmp_path):
+        """
+        Test raw mode reports errors without the "Error:" prefix.
+
+        Given: Invalid area parameter
+        When: Calling create_project_handler() with raw=True
+        Then: Returns ("error", title, message) listing valid areas
+        """
+        # Given
+        repo_path = tmp_path / "repo"
+        config_file = tmp_path / "config.json"
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        _write_config(config_file, config_data)
+
+        params = {
+            "title": "Test Project",
+            "area": "InvalidArea",
+            "type": "standard",
+            "folder": "active"
+        }
+
+        # When
+        status, title, message = create_project_handler(params, str(config_file), raw=True)
+
+        # Then
+        assert status == "error"
+        assert title == "Test Project"
+        assert not message.startswith("Error:")
+        assert "Health" in message
+
+
+class TestGetConfig:
+    """Test _get_config() caching."""
+
+    def test_reuses_config_while_file_unchanged(self, tmp_path):
+        """
+        Test cached ConfigManager is returned for an unchanged file.
+
+        Given: Valid config file
+        When: Calling _get_config() twice with the same path
+        Then: The same ConfigManager instance is returned
+        """
+        # Given
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+
+        # When
+        first = _get_config(str(config_file))
+        second = _get_config(str(config_file))
+
+        # Then
+        assert first is second
+
+    def test_reloads_config_when_file_changes(self, tmp_path):
+        """
+        Test config is re-read after the file is modified.
+
+        Given: Cached config, then the file is rewritten with a new mtime
+        When: Calling _get_config() again
+        Then: A new ConfigManager reflecting the new contents is returned
+        """
+        # Given
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+        first = _get_config(str(config_file))
+
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Career", "kebab": "career"}],
+        })
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # When
+        second = _get_config(str(config_file))
+
+        # Then
+        assert second is not first
+        assert second.get_areas() == [{"name": "Career", "kebab": "career"}]
+
+    def test_missing_file_raises(self, tmp_path):
+        """
+        Test missing config file raises FileNotFoundError.
+
+        Given: Path to a config file that does not exist
+        When: Calling _get_config()
+        Then: FileNotFoundError is raised
+        """
+        # When / Then
+        with pytest.raises(FileNotFoundError):
+            _get_config(str(tmp_path / "missing.json"))
+
+
+class TestToolRegistry:
+    """Test tool definitions and handler table stay in sync."""
+
+    def test_every_tool_has_a_handler(self):
+        """
+        Test each listed tool can be dispatched.
+
+        Given: The precomputed tool list and handler table
+        When: Comparing tool names with handler keys
+        Then: They contain exactly the same names, with no duplicates
+        """
+        # When
+        tool_names = [tool.name for tool in _TOOLS]
+
+        # Then
+        assert len(tool_names) == len(set(tool_names))
+        assert set(tool_names) == set(_HANDLERS) | {"bulk"}
+
+
+class TestDumps:
+    """Test _dumps() JSON serialization."""
+
+    def test_matches_stdlib_indented_output(self):
+        """
+        Test output matches the standard library's indented format.
+
+        Given: Nested result with lists, empty containers, None and non-ASCII text
+        When: Calling _dumps()
+        Then: Output equals json.dumps(indent=2, ensure_ascii=False)
+        """
+        # Given
+        result = {
+            "health": [{"title": "Café run", "due": None, "tags": []}],
+            "career": [],
+            "meta": {},
+        }
+
+        # When
+        output = _dumps(result)
+
+        # Then
+        assert output == json.dumps(result, indent=2, ensure_ascii=False)
+
+    def test_large_results_are_compact(self):
+        """
+        Test results over the size threshold are emitted without indentation.
+
+        Given: Result whose compact JSON is well over 8192 characters
+        When: Calling _dumps()
+        Then: Output equals the compact standard-library encoding
+        """
+        # Given
+        result = {"actions": [{"text": f"Action {i}", "context": "@macbook"} for i in range(500)]}
+
+        # When
+        output = _dumps(result)
+
+        # Then
+        assert output == json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+
+class TestDispatch:
+    """Test _dispatch() tool routing."""
+
+    def test_runs_handler_and_wraps_text(self, tmp_path):
+        """
+        Test known tool is dispatched and its result wrapped as text.
+
+        Given: Valid config with one area
+        When: Dispatching "list_areas"
+        Then: A single text content item with the areas JSON is returned
+        """
+        # Given
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+
+        # When
+        contents = asyncio.run(_dispatch("list_areas", {}, str(config_file)))
+
+        # Then
+        assert len(contents) == 1
+        assert contents[0].type == "text"
+        assert json.loads(contents[0].text) == {"areas": [{"name": "Health", "kebab": "health"}]}
+
+    def test_handler_exception_becomes_error_text(self, tmp_path):
+        """
+        Test exceptions from text tools are returned as "Error: ..." text.
+
+        Given: Config path that does not exist
+        When: Dispatching "complete_project"
+        Then: Text starting with "Error:" mentioning the missing file is returned
+        """
+        # When
+        contents = asyncio.run(_dispatch("complete_project", {"title": "X"}, str(tmp_path / "missing.json")))
+
+        # Then
+        assert contents[0].text.startswith("Error: Configuration file not found")
+
+    def test_handler_exception_becomes_json_error_for_json_tools(self, tmp_path):
+        """
+        Test exceptions from JSON tools are returned as a JSON error object.
+
+        Given: Config path that does not exist
+        When: Dispatching "list_areas"
+        Then: JSON with an "error" key is returned
+        """
+        # When
+        contents = asyncio.run(_dispatch("list_areas", {}, str(tmp_path / "missing.json")))
+
+        # Then
+        assert "Configuration file not found" in json.loads(contents[0].text)["error"]
+
+    def test_bulk_runs_read_only_calls_in_order(self, tmp_path):
+        """
+        Test bulk returns each call's result in call order.
+
+        Given: Valid config, and a bulk request for list_areas, list_goals and create_project
+        When: Dispatching "bulk"
+        Then: Read-only results are returned in order; create_project is refused
+        """
+        # Given
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+        calls = [
+            {"name": "list_areas"},
+            {"name": "list_goals", "arguments": {}},
+            {"name": "create_project", "arguments": {"title": "Sneaky"}},
+        ]
+
+        # When
+        contents = asyncio.run(_dispatch("bulk", {"calls": calls}, str(config_file)))
+
+        # Then
+        results = json.loads(contents[0].text)
+        assert [r["name"] for r in results] == ["list_areas", "list_goals", "create_project"]
+        assert json.loads(results[0]["result"]) == {"areas": [{"name": "Health", "kebab": "health"}]}
+        assert "error" not in json.loads(results[1]["result"])
+        assert results[2]["result"].startswith("Error: Tool 'create_project' is not allowed")
+
+    def test_concurrent_writes_to_one_context_keep_both_actions(self, tmp_path):
+        """
+        Test concurrent write tools are serialized so no update is lost.
+
+        Given: Valid config and an empty @macbook context file
+        When: Dispatching two add_action calls to @macbook concurrently
+        Then: Both actions are in the context file
+        """
+        # Given
+        repo_path = tmp_path / "repo"
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+        contexts_dir = repo_path / "docs" / "execution_system" / "00k-next-actions" / "contexts"
+        contexts_dir.mkdir(parents=True)
+        context_file = contexts_dir / "@macbook.md"
+        context_file.write_text("---\ntitle: Macbook\n---\n\n")
+
+        async def add_both():
+            return await asyncio.gather(
+                _dispatch("add_action", {"text": "First", "context": "@macbook"}, str(config_file)),
+                _dispatch("add_action", {"text": "Second", "context": "@macbook"}, str(config_file)),
+            )
+
+        # When
+        results = asyncio.run(add_both())
+
+        # Then
+        assert all("Successfully added" in contents[0].text for contents in results)
+        content = context_file.read_text()
+        assert " First @macbook" in content
+        assert " Second @macbook" in content
+
+    def test_unknown_tool_raises(self):
+        """
+        Test unknown tool name raises ValueError.
+
+        Given: Tool name that is not registered
+        When: Dispatching it
+        Then: ValueError is raised naming the tool
+        """
+        # When / Then
+        with pytest.raises(ValueError, match="Unknown tool: nope"):
+            asyncio.run(_dispatch("nope", {}, None))
+
+
+class TestGetService:
+    """Test _get_service() instance sharing."""
+
+    def test_reuses_service_until_config_changes(self, tmp_path):
+        """
+        Test service instances are shared per config and rebuilt on change.
+
+        Given: Valid config file
+        When: Requesting ProjectLister twice, then again after the config changes
+        Then: First two calls share an instance; the third gets a new one
+        """
+        # Given
+        config_file = tmp_path / "config.json"
+        _write_config(config_file, {
+            "execution_system_repo_path": str(tmp_path / "repo"),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        })
+
+        # When
+        first = _get_service(str(config_file), ProjectLister)
+        second = _get_service(str(config_file), ProjectLister)
+
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = _get_service(str(config_file), ProjectLister)
+
+        # Then
+        assert first is second
+        assert third is not first
+
+
+class TestArgGetter:
+    """Test _arg_getter() parameter extraction."""
+
+    def test_returns_values_in_key_order(self):
+        """
+        Test all present keys are returned in the requested order.
+
+        Given: Params with title and new_area (plus an unrelated key)
+        When: Extracting ("title", "new_area")
+        Then: Returns ("Run", "Health")
+        """
+        # Given
+        extract = _arg_getter("title", "new_area")
+
+        # When
+        values = extract({"new_area": "Health", "title": "Run", "other": 1})
+
+        # Then
+        assert values == ("Run", "Health")
+
+    def test_missing_keys_become_none(self):
+        """
+        Test missing keys are returned as None instead of raising.
+
+        Given: Params with only title
+        When: Extracting ("title", "new_area")
+        Then: Returns ("Run", None)
+        """
+        # Given
+        extract = _arg_getter("title", "new_area")
+
+        # When
+        values = extract({"title": "Run"})
+
+        # Then
+        assert values == ("Run", None)
+
+    def test_single_key_returns_one_tuple(self):
+        """
+        Test a single key gives a 1-tuple whether or not it is present.
+
+        Given: Extractor for ("title",)
+        When: Extracting from params with and without title
+        Then: Returns ("Run",) and (None,)
+        """
+        # Given
+        extract = _arg_getter("title")
+
+        # When
+        present = extract({"title": "Run"})
+        missing = extract({})
+
+        # Then
+        assert present == ("Run",)
+        assert missing == (None,)
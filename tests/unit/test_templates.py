@@ -206,6 +206,25 @@ class TestTemplateEngineGenerateHabit:
         # Then
         assert "## Next Actions" in result
 
+    def test_title_with_placeholder_text_is_kept_verbatim(self):
+        """
+        Test placeholder-like text in the title is not substituted.
+
+        Given: Title "Track {status} weekly" and folder "active"
+        When: Calling generate_habit()
+        Then: Heading keeps "{status}" literally and status line shows "Active"
+        """
+        # Given
+        title = "Track {status} weekly"
+        folder = "active"
+
+        # When
+        result = TemplateEngine.generate_habit(title, folder)
+
+        # Then
+        assert "# Track {status} weekly" in result
+        assert "**Status:** Active" in result
+
 
 class TestTemplateEngineGenerateCoordination:
     """Test TemplateEngine.generate_coordination()."""
@@ -311,3 +330,36 @@ class TestTemplateEngineGenerateCoordination:
 
         # Then
         assert "## Ideas to Consider" in result
+
+
+class TestTemplateEngineGenerate:
+    """Test TemplateEngine.generate()."""
+
+    def test_dispatches_by_project_type(self):
+        """
+        Test generate() returns the template for each project type.
+
+        Given: Title "Daily Exercise" and folder "incubator"
+        When: Calling generate() for standard, habit and coordination
+        Then: Each result matches the type-specific generator
+        """
+        # Given
+        title = "Daily Exercise"
+        folder = "incubator"
+
+        # When / Then
+        assert TemplateEngine.generate("standard", title, folder) == TemplateEngine.generate_standard(title)
+        assert TemplateEngine.generate("habit", title, folder) == TemplateEngine.generate_habit(title, folder)
+        assert TemplateEngine.generate("coordination", title, folder) == TemplateEngine.generate_coordination(title)
+
+    def test_unknown_type_raises(self):
+        """
+        Test unknown project type raises ValueError.
+
+        Given: Project type "unknown"
+        When: Calling generate()
+        Then: ValueError is raised naming the type
+        """
+        # When / Then
+        with pytest.raises(ValueError, match="Unknown project type: unknown"):
+            TemplateEngine.generate("unknown", "Title", "active")
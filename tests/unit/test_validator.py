@@ -1,7 +1,7 @@
 """Tests for ProjectValidator."""
 
-import json
-from pathlib import Path
+import os
+import shutil
 
 import pytest
 
@@ -9,10 +9,19 @@ from execution_system_mcp.config import ConfigManager
 from execution_system_mcp.validator import ProjectValidator
 
 
+@pytest.fixture(scope="class")
+def health_config():
+    """ConfigManager for tests that never touch the repository, built once per class."""
+    return ConfigManager.from_dict({
+        "execution_system_repo_path": "/path/to/repo",
+        "areas": [{"name": "Health", "kebab": "health"}],
+    })
+
+
 class TestProjectValidatorValidateArea:
     """Test ProjectValidator.validate_area()."""
 
-    def test_valid_area_exact_case(self, tmp_path):
+    def test_valid_area_exact_case(self, health_config):
         """
         Test validating area with exact case match.
 
@@ -21,14 +30,7 @@ class TestProjectValidatorValidateArea:
         Then: Returns (True, None)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_area("Health")
@@ -37,7 +39,7 @@ class TestProjectValidatorValidateArea:
         assert is_valid is True
         assert error_msg is None
 
-    def test_valid_area_case_insensitive(self, tmp_path):
+    def test_valid_area_case_insensitive(self, health_config):
         """
         Test validating area with different case.
 
@@ -46,14 +48,7 @@ class TestProjectValidatorValidateArea:
         Then: Returns (True, None)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_area("health")
@@ -71,7 +66,6 @@ class TestProjectValidatorValidateArea:
         Then: Returns (False, error message with valid areas)
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": "/path/to/repo",
             "areas": [
@@ -79,8 +73,7 @@ class TestProjectValidatorValidateArea:
                 {"name": "Career", "kebab": "career"},
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -102,15 +95,13 @@ class TestProjectValidatorValidateArea:
         Then: Returns (True, None)
         """
         # Given
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": "/path/to/repo",
             "areas": [
                 {"name": "Personal Growth Systems", "kebab": "personal-growth-systems"}
             ],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -139,13 +130,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["active", "incubator", "completed", "descoped"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -173,13 +162,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["incubator", "completed", "descoped"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -207,13 +194,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["active", "completed", "descoped"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Career", "kebab": "career"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -241,13 +226,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["active", "incubator", "descoped"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -275,13 +258,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["active", "incubator", "completed"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Finance", "kebab": "finance"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -309,13 +290,11 @@ class TestProjectValidatorCheckDuplicates:
         for folder in ["incubator", "completed", "descoped"]:
             (projects_path / folder).mkdir(parents=True)
 
-        config_file = tmp_path / "config.json"
         config_data = {
             "execution_system_repo_path": str(repo_path),
             "areas": [{"name": "Health", "kebab": "health"}],
         }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
+        config = ConfigManager.from_dict(config_data)
         validator = ProjectValidator(config)
 
         # When
@@ -325,11 +304,207 @@ class TestProjectValidatorCheckDuplicates:
         assert is_duplicate is False
         assert folder_name is None
 
+    def test_earlier_folder_wins_when_filename_repeats(self, tmp_path):
+        """
+        Test folder search order decides which duplicate is reported.
+
+        Given: Project "test-project.md" exists in both completed/ and active/
+        When: Calling check_duplicates("test-project")
+        Then: Returns (True, "active")
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        for folder in ["completed", "active"]:
+            area_dir = projects_path / folder / "health"
+            area_dir.mkdir(parents=True)
+            (area_dir / "test-project.md").write_text("---\narea: Health\n---\n")
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+
+        # When
+        is_duplicate, folder_name = validator.check_duplicates("test-project")
+
+        # Then
+        assert is_duplicate is True
+        assert folder_name == "active"
+
+    def test_walk_stops_below_depth_limit(self, tmp_path):
+        """
+        Test the duplicate index does not descend past three levels.
+
+        Given: Projects three and four directory levels below active/
+        When: Calling check_duplicates() for each
+        Then: Only the project within the depth limit is found
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        within_dir = projects_path / "active" / "health" / "fitness" / "running"
+        beyond_dir = within_dir / "archive"
+        beyond_dir.mkdir(parents=True)
+        (within_dir / "marathon.md").write_text("# Marathon")
+        (beyond_dir / "old-race.md").write_text("# Old Race")
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+
+        # When
+        within = validator.check_duplicates("marathon")
+        beyond = validator.check_duplicates("old-race")
+
+        # Then
+        assert within == (True, "active")
+        assert beyond == (False, None)
+
+    def test_index_sees_changes_made_after_first_check(self, tmp_path):
+        """
+        Test duplicate index notices projects added and moved on disk.
+
+        Given: Validator that already checked once (index built)
+        When: A project is added to active/, then moved to completed/
+        Then: check_duplicates reports each new location
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        (projects_path / "active" / "health").mkdir(parents=True)
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+        assert validator.check_duplicates("test-project") == (False, None)
+
+        # When / Then
+        project_file = projects_path / "active" / "health" / "test-project.md"
+        project_file.write_text("# Test Project")
+        assert validator.check_duplicates("test-project") == (True, "active")
+
+        completed_dir = projects_path / "completed" / "health"
+        completed_dir.mkdir(parents=True)
+        project_file.rename(completed_dir / "test-project.md")
+        assert validator.check_duplicates("test-project") == (True, "completed")
+
+    def test_add_records_created_project(self, tmp_path):
+        """
+        Test add() records a project created in a new directory.
+
+        Given: Built index and a project file written to a new area directory
+        When: Calling add() for it, then check_duplicates()
+        Then: Duplicate is reported and the new directory is tracked
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        (projects_path / "active").mkdir(parents=True)
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+        validator.check_duplicates("anything")
+
+        project_file = projects_path / "active" / "health" / "test-project.md"
+        project_file.parent.mkdir()
+        project_file.write_text("# Test Project")
+
+        # When
+        validator.add("test-project", "active", str(project_file))
+        result = validator.check_duplicates("test-project")
+
+        # Then
+        assert result == (True, "active")
+        assert os.path.abspath(project_file.parent) in validator._index_dirs
+
+    def test_add_keeps_directories_created_outside_the_server(self, tmp_path):
+        """
+        Test add() does not hide a new area directory made outside the server.
+
+        Given: Built index, then active/newarea/ext.md written directly to disk
+        When: add() records a project in another new area, then check_duplicates("ext")
+        Then: The outside project is reported on every check
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        (projects_path / "active").mkdir(parents=True)
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+        validator.check_duplicates("anything")
+
+        outside_dir = projects_path / "active" / "newarea"
+        outside_dir.mkdir()
+        (outside_dir / "ext.md").write_text("# Ext")
+
+        project_file = projects_path / "active" / "health" / "test-project.md"
+        project_file.parent.mkdir()
+        project_file.write_text("# Test Project")
+
+        # When
+        validator.add("test-project", "active", str(project_file))
+        first = validator.check_duplicates("ext")
+        second = validator.check_duplicates("ext")
+
+        # Then
+        assert first == (True, "active")
+        assert second == (True, "active")
+        assert validator.check_duplicates("test-project") == (True, "active")
+
+    def test_index_drops_projects_under_removed_directory(self, tmp_path):
+        """
+        Test projects disappear from the index with their directory.
+
+        Given: Validator that indexed a project in a nested area directory
+        When: The area directory is removed, then check_duplicates() is called
+        Then: The project is no longer reported and its directories are untracked
+        """
+        # Given
+        repo_path = tmp_path / "execution-system-repo"
+        projects_path = repo_path / "docs" / "execution_system" / "10k-projects"
+        nested_dir = projects_path / "active" / "health" / "fitness"
+        nested_dir.mkdir(parents=True)
+        (nested_dir / "test-project.md").write_text("# Test Project")
+
+        config_data = {
+            "execution_system_repo_path": str(repo_path),
+            "areas": [{"name": "Health", "kebab": "health"}],
+        }
+        config = ConfigManager.from_dict(config_data)
+        validator = ProjectValidator(config)
+        assert validator.check_duplicates("test-project") == (True, "active")
+
+        # When
+        shutil.rmtree(projects_path / "active" / "health")
+        result = validator.check_duplicates("test-project")
+
+        # Then
+        assert result == (False, None)
+        assert os.path.abspath(nested_dir) not in validator._index_dirs
+
 
 class TestProjectValidatorValidateDueDate:
     """Test ProjectValidator.validate_due_date()."""
 
-    def test_valid_due_date(self, tmp_path):
+    def test_valid_due_date(self, health_config):
         """
         Test validating correct YYYY-MM-DD format.
 
@@ -338,14 +513,7 @@ class TestProjectValidatorValidateDueDate:
         Then: Returns (True, None)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_due_date("2025-12-31")
@@ -354,7 +522,7 @@ class TestProjectValidatorValidateDueDate:
         assert is_valid is True
         assert error_msg is None
 
-    def test_invalid_date_format_slashes(self, tmp_path):
+    def test_invalid_date_format_slashes(self, health_config):
         """
         Test rejecting YYYY/MM/DD format.
 
@@ -363,14 +531,7 @@ class TestProjectValidatorValidateDueDate:
         Then: Returns (False, error message)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_due_date("2025/12/31")
@@ -380,7 +541,7 @@ class TestProjectValidatorValidateDueDate:
         assert error_msg is not None
         assert "YYYY-MM-DD" in error_msg
 
-    def test_invalid_date_format_american(self, tmp_path):
+    def test_invalid_date_format_american(self, health_config):
         """
         Test rejecting MM-DD-YYYY format.
 
@@ -389,14 +550,7 @@ class TestProjectValidatorValidateDueDate:
         Then: Returns (False, error message)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_due_date("12-31-2025")
@@ -405,7 +559,7 @@ class TestProjectValidatorValidateDueDate:
         assert is_valid is False
         assert error_msg is not None
 
-    def test_empty_string_is_invalid(self, tmp_path):
+    def test_empty_string_is_invalid(self, health_config):
         """
         Test rejecting empty string.
 
@@ -414,14 +568,7 @@ class TestProjectValidatorValidateDueDate:
         Then: Returns (False, error message)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_due_date("")
@@ -430,7 +577,7 @@ class TestProjectValidatorValidateDueDate:
         assert is_valid is False
         assert error_msg is not None
 
-    def test_invalid_date_values(self, tmp_path):
+    def test_invalid_date_values(self, health_config):
         """
         Test rejecting invalid date values.
 
@@ -439,14 +586,7 @@ class TestProjectValidatorValidateDueDate:
         Then: Returns (False, error message)
         """
         # Given
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "execution_system_repo_path": "/path/to/repo",
-            "areas": [{"name": "Health", "kebab": "health"}],
-        }
-        config_file.write_text(json.dumps(config_data))
-        config = ConfigManager(str(config_file))
-        validator = ProjectValidator(config)
+        validator = ProjectValidator(health_config)
 
         # When
         is_valid, error_msg = validator.validate_due_date("2025-13-45")
@@ -454,3 +594,93 @@ class TestProjectValidatorValidateDueDate:
         # Then
         assert is_valid is False
         assert error_msg is not None
+
+    def test_trailing_newline_is_format_error(self, health_config):
+        """
+        Test rejecting a date followed by a newline as a format error.
+
+        Given: ProjectValidator instance
+        When: Calling validate_due_date("2025-12-31\\n")
+        Then: Returns (False, format error message)
+        """
+        # Given
+        validator = ProjectValidator(health_config)
+
+        # When
+        is_valid, error_msg = validator.validate_due_date("2025-12-31\n")
+
+        # Then
+        assert is_valid is False
+        assert "YYYY-MM-DD" in error_msg
+
+    def test_leap_day_in_leap_year_is_valid(self, health_config):
+        """
+        Test accepting February 29 in a leap year.
+
+        Given: ProjectValidator instance
+        When: Calling validate_due_date("2024-02-29")
+        Then: Returns (True, None)
+        """
+        # Given
+        validator = ProjectValidator(health_config)
+
+        # When
+        is_valid, error_msg = validator.validate_due_date("2024-02-29")
+
+        # Then
+        assert is_valid is True
+        assert error_msg is None
+
+    def test_leap_day_in_common_year_is_invalid(self, health_config):
+        """
+        Test rejecting February 29 outside a leap year.
+
+        Given: ProjectValidator instance
+        When: Calling validate_due_date("2025-02-29")
+        Then: Returns (False, invalid date values message)
+        """
+        # Given
+        validator = ProjectValidator(health_config)
+
+        # When
+        is_valid, error_msg = validator.validate_due_date("2025-02-29")
+
+        # Then
+        assert is_valid is False
+        assert "valid calendar date" in error_msg
+
+    def test_compact_iso_date_is_format_error(self, health_config):
+        """
+        Test rejecting the compact ISO form YYYYMMDD.
+
+        Given: ProjectValidator instance
+        When: Calling validate_due_date("20251231")
+        Then: Returns (False, format error message)
+        """
+        # Given
+        validator = ProjectValidator(health_config)
+
+        # When
+        is_valid, error_msg = validator.validate_due_date("20251231")
+
+        # Then
+        assert is_valid is False
+        assert "YYYY-MM-DD" in error_msg
+
+    def test_non_digit_fields_are_format_error(self, health_config):
+        """
+        Test rejecting letters in the date fields as a format error.
+
+        Given: ProjectValidator instance
+        When: Calling validate_due_date("2025-ab-01")
+        Then: Returns (False, format error message)
+        """
+        # Given
+        validator = ProjectValidator(health_config)
+
+        # When
+        is_valid, error_msg = validator.validate_due_date("2025-ab-01")
+
+        # Then
+        assert is_valid is False
+        assert "YYYY-MM-DD" in error_msg